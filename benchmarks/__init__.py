@@ -0,0 +1 @@
+"""Benchmarks - headless performance measurements."""
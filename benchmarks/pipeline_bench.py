@@ -0,0 +1,74 @@
+"""
+Pipeline Benchmark - Serial versus pipelined update/render.
+
+Plays the same scripted single-player run twice, unpaced, once drawing
+each frame after its update and once with RenderPipeline drawing frame
+N on the render thread while frame N+1 updates. Reports frames per
+second and the game thread's time per frame. Run headless from the
+project root:
+
+    python -m benchmarks.pipeline_bench [--frames N] [--enemies N]
+"""
+
+import argparse
+import os
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame
+from config import FPS
+from core.game import Game
+from core.persistence import SessionStore
+from states.playing_state import PlayingState
+
+FRAMES = 1200
+ENEMIES = 30
+
+
+def run(pipelined: bool, frames: int, enemies: int) -> float:
+    """Seconds per frame for a scripted run."""
+    game = Game(pipelined=pipelined)
+    game.sessions = SessionStore(None)
+    state = PlayingState(game)
+    game.push_state(state)
+    state.player.max_health = state.player.health = 10 ** 9
+    for _ in range(enemies):
+        state._spawn_enemy()
+
+    def key(kind, code):
+        pygame.event.post(pygame.event.Event(kind, key=code, mod=0, unicode='', scancode=0))
+
+    key(pygame.KEYDOWN, pygame.K_f)    # auto-fire keeps particles going
+    start = time.perf_counter()
+    for frame in range(frames):
+        if frame % 240 == 0:
+            key(pygame.KEYUP, pygame.K_a)
+            key(pygame.KEYDOWN, pygame.K_d)
+        elif frame % 240 == 120:
+            key(pygame.KEYUP, pygame.K_d)
+            key(pygame.KEYDOWN, pygame.K_a)
+        game.handle_events()
+        game.update(1.0 / FPS)
+        game.render()
+    elapsed = time.perf_counter() - start
+    game.shutdown()
+    return elapsed / frames
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Serial vs pipelined rendering")
+    parser.add_argument("--frames", type=int, default=FRAMES)
+    parser.add_argument("--enemies", type=int, default=ENEMIES)
+    args = parser.parse_args()
+
+    serial = run(False, args.frames, args.enemies)
+    pipelined = run(True, args.frames, args.enemies)
+    print(f"serial:    {serial * 1000:6.2f} ms/frame ({1 / serial:5.0f} FPS)")
+    print(f"pipelined: {pipelined * 1000:6.2f} ms/frame ({1 / pipelined:5.0f} FPS)")
+    print(f"speedup:   {serial / pipelined:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
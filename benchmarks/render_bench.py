@@ -0,0 +1,84 @@
+"""
+Render Benchmark - Per-sprite cost of drawing the world.
+
+Compares the original path (one blit per sprite through Camera.apply,
+which allocates a Rect each time) with the batched BlitBatch path, at
+several sprite counts. Run headless from the project root:
+
+    python -m benchmarks.render_bench
+"""
+
+import os
+import random
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+from core.camera import Camera
+from core.renderer import BlitBatch, SoftwareRenderer
+from core.assets import sprite_cache
+from config import SCREEN_WIDTH, SCREEN_HEIGHT, LEVEL_WIDTH, TITLE
+
+SPRITE_COUNTS = (50, 200, 1000)
+FRAMES = 200
+
+
+class _Sprite(pygame.sprite.Sprite):
+    def __init__(self, image, x, y):
+        super().__init__()
+        self.image = image
+        self.rect = image.get_rect(topleft=(x, y))
+
+
+def draw_per_sprite(screen, sprites, camera, batch) -> None:
+    """Original path: a blit and a Rect allocation per sprite."""
+    for sprite in sprites:
+        screen.blit(sprite.image, camera.apply(sprite))
+
+
+def draw_batched(screen, sprites, camera, batch) -> None:
+    """Current path: one blits call over a reused batch."""
+    screen.blits(batch.fill(sprites, camera.left, camera.top))
+
+
+def time_frames(draw, screen, sprites, camera, batch) -> float:
+    """Seconds per frame for draw()."""
+    start = time.perf_counter()
+    for _ in range(FRAMES):
+        draw(screen, sprites, camera, batch)
+    return (time.perf_counter() - start) / FRAMES
+
+
+def main():
+    pygame.init()
+    screen = SoftwareRenderer((SCREEN_WIDTH, SCREEN_HEIGHT), TITLE)
+    random.seed(0)
+
+    # Tiny sprites keep pixel work small, isolating per-call overhead
+    frames = [sprite_cache.frame(name) for name in ('enemy', 'bullet')]
+    tiny = pygame.Surface((1, 1)).convert()
+
+    camera = Camera()
+    camera.camera_rect.x = (LEVEL_WIDTH - SCREEN_WIDTH) // 2
+
+    print(f"{'sprites':>8} {'image':>7} {'per-sprite':>12} {'batched':>10} {'saved':>7}")
+    for image_name, images in (('sprite', frames), ('1x1', [tiny])):
+        for count in SPRITE_COUNTS:
+            group = pygame.sprite.Group(
+                _Sprite(random.choice(images),
+                        random.randint(camera.left, camera.right),
+                        random.randint(0, SCREEN_HEIGHT))
+                for _ in range(count)
+            )
+            batch = BlitBatch()
+            before = time_frames(draw_per_sprite, screen, group, camera, batch) / count * 1e6
+            after = time_frames(draw_batched, screen, group, camera, batch) / count * 1e6
+            print(f"{count:>8} {image_name:>7} {before:>10.3f}us {after:>8.3f}us "
+                  f"{(1 - after / before):>6.0%}")
+
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
@@ -11,12 +11,61 @@ SCREEN_HEIGHT = 600
 FPS = 60
 TITLE = "Side-Scrolling Shooter"
 
+# Renderer backend: "software" (Surface.blit) or "texture" (pygame._sdl2 GPU textures)
+RENDERER = "software"
+RENDERER_SDL_SOFTWARE = False   # texture backend on SDL's software renderer (no GPU)
+RENDER_PIPELINED = False        # draw each frame on a render thread while the next updates
+
+# Frame pacing: "sleep" (clock.tick), "busy" (tick_busy_loop),
+# "hybrid" (sleep, then spin) or "vsync" (falls back to hybrid)
+FRAME_PACING = "sleep"
+FRAME_PACING_SPIN_MS = 2.0      # hybrid: spin this long before each deadline
+FRAME_STATS_WINDOW = 600        # recent frames used for jitter percentiles
+
+# =============================================================================
+# INPUT
+# =============================================================================
+# Action -> key names (as accepted by pygame.key.key_code)
+INPUT_ACTIONS = {
+    "left": ("left", "a"),
+    "right": ("right", "d"),
+    "jump": ("space", "w"),
+    "shoot": ("f",),
+    "rewind": ("r",),
+    "pause": ("escape",),
+    "back": ("escape",),
+    "confirm": ("return",),
+    "quit": ("q",),
+    "endless": ("e",),
+}
+INPUT_JUMP_BUFFER = 0.1         # seconds a jump press waits for the player to land
+INPUT_SHOOT_BUFFER = 0.15       # seconds a fire press waits out the shot cooldown
+
 # =============================================================================
 # LEVEL
 # =============================================================================
 LEVEL_WIDTH = 2000
 LEVEL_HEIGHT = 600
 
+# =============================================================================
+# ENDLESS MODE
+# =============================================================================
+ENDLESS_SEED = None             # level seed (None picks a new one every run)
+ENDLESS_CHUNK_WIDTH = 1050      # pixels per generated chunk (15 ground tiles)
+ENDLESS_CHUNKS_AHEAD = 2        # chunks kept ready past the player's chunk
+ENDLESS_CHUNKS_BEHIND = 2       # chunks kept behind the player before dropping
+ENDLESS_PLATFORMS = (3, 6)      # floating platforms per chunk (min, max)
+ENDLESS_TIERS = (450, 380, 310, 240, 170)  # platform tops; each is in jump reach of the last
+ENDLESS_GAP = (70, 170)         # gap between floating platforms (min, max; wider than the player)
+ENDLESS_SPAWN_CLEARANCE = 250   # first chunk keeps floating platforms right of this x
+
+# =============================================================================
+# PARALLAX BACKGROUND
+# =============================================================================
+PARALLAX_STRIP_WIDTH = 1024     # width of each wrap-around layer strip
+PARALLAX_FAR_FACTOR = 0.2       # far hills scroll at this fraction of camera speed
+PARALLAX_NEAR_FACTOR = 0.5      # near scenery scroll factor
+
 # =============================================================================
 # COLORS
 # =============================================================================
@@ -25,6 +74,10 @@ COLOR_WHITE = (255, 255, 255)
 COLOR_GRAY = (100, 100, 100)
 COLOR_DARK_GRAY = (50, 50, 50)
 COLOR_SKY_BLUE = (135, 206, 235)
+COLOR_SKY_TOP = (70, 130, 200)
+COLOR_HILLS_FAR = (120, 170, 200)
+COLOR_HILLS_NEAR = (90, 150, 110)
+COLOR_SCENERY = (60, 110, 80)
 COLOR_DARK_BLUE = (50, 50, 80)
 
 # Entity colors
@@ -73,12 +126,114 @@ ENEMY_SPEED = 150           # pixels/second
 ENEMY_HEALTH = 50
 ENEMY_DAMAGE = 15           # damage on contact
 
+# AI level of detail - (max distance to player in pixels, frames between
+# steering ticks), nearest first; anything further ticks every
+# AI_FAR_INTERVAL frames (10 Hz at 60 FPS)
+AI_LOD_TIERS = [
+    (400, 1),
+    (800, 3),
+]
+AI_FAR_INTERVAL = 6
+
+# Flocking - enemies steer toward their target plus separation from
+# neighbors closer than FLOCK_SEPARATION_RADIUS and alignment with the
+# heading of neighbors within FLOCK_NEIGHBOR_RADIUS
+FLOCK_NEIGHBOR_RADIUS = 64      # pixels
+FLOCK_SEPARATION_RADIUS = 44    # pixels (a bit more than an enemy's width)
+FLOCK_SEPARATION_WEIGHT = 5
+FLOCK_ALIGNMENT_WEIGHT = 0.3
+FLOCK_MAX_NEIGHBORS = 12        # neighbors considered per steering tick
+FLOCK_GRID_CELL = 64            # neighbor grid cell size in pixels
+
+# Navigation - enemies follow a shared flow field toward the players
+NAV_CELL_SIZE = 32              # navigation grid cell size in pixels
+NAV_CLEARANCE = 20              # platform margin kept clear (half an enemy)
+NAV_CELLS_PER_FRAME = 400       # search budget per frame (the grid has ~1200 cells)
+NAV_DIRECT_STEPS = 1            # cells from a player where enemies fly straight in
+NAV_FIELD_CACHE = 16            # finished fields kept for reuse
+
 # =============================================================================
 # SPAWNING
 # =============================================================================
 SPAWN_INTERVAL = 2.5        # seconds between spawns
 SPAWN_MARGIN = 50           # pixels off-screen
 
+# Wave schedule - difficulty time (s) when each wave starts,
+# seconds between spawns and enemies per spawn
+SPAWN_WAVES = [
+    {'start': 0,   'interval': SPAWN_INTERVAL, 'count': 1},
+    {'start': 45,  'interval': 2.0,            'count': 1},
+    {'start': 90,  'interval': 2.0,            'count': 2},
+    {'start': 150, 'interval': 1.5,            'count': 2},
+    {'start': 240, 'interval': 1.5,            'count': 3},
+]
+
+# Entity budgets
+MAX_LIVE_ENEMIES = 40
+MAX_LIVE_BULLETS = 20
+
+# Frame budget - hold spawns when the smoothed frame time passes
+# SPAWN_HOLD_RATIO of the frame budget, resume below SPAWN_RESUME_RATIO
+SPAWN_HOLD_RATIO = 0.85
+SPAWN_RESUME_RATIO = 0.7
+SPAWN_FRAME_SMOOTHING = 0.1    # weight of the newest frame time
+
+# =============================================================================
+# PARTICLES
+# =============================================================================
+PARTICLE_MAX = 20000        # hard cap on live particles
+PARTICLE_GRAVITY = 600      # pixels/second^2
+PARTICLE_SIZE = 3           # pixels
+PARTICLE_FADE_STEPS = 4     # size steps as particles age (they shrink, alpha is unchanged)
+
+# Effect name -> (particles per burst, speed px/s, lifetime s, color)
+PARTICLE_EFFECTS = {
+    'enemy_killed': (60, 260, 0.8, (255, 200, 60)),
+    'bullet_hit': (12, 160, 0.3, BULLET_COLOR),
+    'player_damaged': (30, 200, 0.5, ENEMY_COLOR),
+}
+
+# =============================================================================
+# AUDIO
+# =============================================================================
+AUDIO_ENABLED = True
+AUDIO_FREQUENCY = 22050         # mixer sample rate
+AUDIO_BUFFER = 512              # mixer buffer in samples (lower = less latency)
+AUDIO_CHANNELS = 8              # fixed voice pool; never grows during play
+
+# Sound name -> (file in SOUNDS_DIR, priority, min seconds between plays,
+# max simultaneous voices, fallback tone). Higher priority sounds may
+# steal voices from lower ones. The fallback tone (waveform, start Hz,
+# end Hz, seconds, volume) is synthesized when the file is missing.
+SOUND_EFFECTS = {
+    'shoot': ('shoot.wav', 1, 0.05, 2, ('square', 880, 440, 0.08, 0.2)),
+    'enemy_killed': ('enemy_killed.wav', 2, 0.04, 3, ('noise', 1600, 200, 0.3, 0.35)),
+    'player_damaged': ('player_damaged.wav', 3, 0.15, 1, ('square', 220, 110, 0.2, 0.3)),
+    'player_died': ('player_died.wav', 4, 0.5, 1, ('square', 330, 55, 0.9, 0.35)),
+}
+
+# =============================================================================
+# SAVES
+# =============================================================================
+HIGHSCORE_COUNT = 10            # runs kept in the high-score table
+SAVE_BATCH_DELAY = 0.5          # seconds the writer gathers records before writing
+
+# =============================================================================
+# NETPLAY (two-player co-op)
+# =============================================================================
+NET_PORT = 7777                 # default local UDP port
+NET_SEED = 1234                 # shared gameplay seed for both peers
+NET_INPUT_DELAY = 2             # frames local input is delayed before use
+NET_MAX_ROLLBACK = 8            # max frames predicted ahead of the peer
+NET_MAX_PACKET_INPUTS = 64      # unacknowledged inputs resent per packet
+NET_CHECKSUM_INTERVAL = 30      # frames between desync checksums
+
+# =============================================================================
+# REWIND
+# =============================================================================
+REWIND_SECONDS = 10             # history kept for rewinding
+REWIND_KEYFRAME_INTERVAL = 30   # frames per keyframe (the rest are deltas)
+
 # =============================================================================
 # UI
 # =============================================================================
@@ -87,8 +242,45 @@ HEALTH_BAR_HEIGHT = 20
 HEALTH_BAR_X = 10
 HEALTH_BAR_Y = 10
 
+# =============================================================================
+# RENDER SCALING
+# =============================================================================
+RENDER_SCALE_MIN = 0.5          # lowest world render scale
+RENDER_SCALE_MAX = 1.0          # highest world render scale
+RENDER_SCALE_STEP = 0.125       # scale change per adjustment
+RENDER_SCALE_DOWN_RATIO = 0.9   # scale down above this fraction of the frame budget
+RENDER_SCALE_UP_RATIO = 0.6     # scale up below this fraction of the frame budget
+RENDER_SCALE_HOLD_FRAMES = 60   # frames to wait between adjustments
+RENDER_SCALE_SMOOTHING = 0.1    # weight of the newest frame time
+SHOW_RENDER_SCALE = True        # show the current scale in the HUD
+
+# =============================================================================
+# SOAK TEST
+# =============================================================================
+SOAK_SAMPLE_INTERVAL = 300      # simulated seconds between samples
+SOAK_WARMUP = 60                # simulated seconds before the baseline sample
+SOAK_MAX_GROWTH_KB = 2048       # traced memory growth allowed after warmup
+SOAK_MAX_SURFACE_GROWTH = 50    # live surface growth allowed after warmup
+SOAK_TOP_SITES = 10             # allocation sites listed in the report
+
+# =============================================================================
+# SPIKE PROFILER
+# =============================================================================
+SPIKE_PROFILER = True           # capture frames that go over budget
+SPIKE_BUDGET_MS = 33.0          # frame work time that counts as a spike
+SPIKE_SAMPLE_INTERVAL_MS = 5.0  # stack sampling period (0 disables sampling)
+SPIKE_STACK_DEPTH = 40          # frames kept per sampled stack
+SPIKE_COOLDOWN = 5.0            # min seconds between captures
+SPIKE_MAX_CAPTURES = 20         # newest captures kept on disk
+
 # =============================================================================
 # ASSETS
 # =============================================================================
 import os
 ASSETS_DIR = os.path.join(os.path.dirname(__file__), "assets", "sprites")
+SOUNDS_DIR = os.path.join(os.path.dirname(__file__), "assets", "sounds")
+ATLAS_WIDTH = 512           # sprite atlas width in pixels
+ATLAS_PADDING = 1           # transparent border around each atlas frame
+SPRITE_CACHE_DIR = os.path.join(os.path.dirname(__file__), ".cache", "sprites")
+SPIKE_CAPTURE_DIR = os.path.join(os.path.dirname(__file__), ".cache", "spikes")
+SAVE_DIR = os.path.join(os.path.dirname(__file__), "saves")
@@ -0,0 +1,160 @@
+"""
+Assets - Shared sprite atlas addressed by integer sprite ids.
+"""
+
+import os
+import pygame
+from config import (
+    ASSETS_DIR, ATLAS_WIDTH, ATLAS_PADDING, PLAYER_COLOR, ENEMY_COLOR, BULLET_COLOR, PLATFORM_COLOR
+)
+from .atlas import AtlasBuilder
+from .pixel_cache import PixelCache, hash_sources
+
+
+# Frame name -> (file, scaled size, has flipped variant, fallback color, fallback size)
+SPRITE_FRAMES = {
+    'player_stand': ('player_stand.png', (48, 48), True, PLAYER_COLOR, None),
+    'player_jump': ('player_jump.png', (48, 48), True, PLAYER_COLOR, None),
+    'player_walk1': ('player_walk1.png', (48, 48), True, PLAYER_COLOR, None),
+    'player_walk2': ('player_walk2.png', (48, 48), True, PLAYER_COLOR, None),
+    'enemy': ('enemy.png', (40, 40), True, ENEMY_COLOR, None),
+    'enemy_fly': ('enemy_fly.png', (40, 40), True, ENEMY_COLOR, None),
+    'bullet': ('bullet.png', (24, 24), True, BULLET_COLOR, (12, 6)),
+    'platform_left': ('platform_left.png', (70, 70), False, PLATFORM_COLOR, None),
+    'platform_mid': ('platform_mid.png', (70, 70), False, PLATFORM_COLOR, None),
+    'platform_right': ('platform_right.png', (70, 70), False, PLATFORM_COLOR, None),
+}
+
+
+def load_image(path: str) -> pygame.Surface:
+    """
+    Load an image with per-pixel alpha.
+    Converts to the display format when a display surface exists; the
+    texture renderer has none, and uploads the image as loaded.
+    """
+    image = pygame.image.load(path)
+    if pygame.display.get_surface() is None:
+        return image
+    return image.convert_alpha()
+
+
+class SpriteCache:
+    """
+    Decodes and scales every frame in SPRITE_FRAMES once, packs them
+    (with flipped variants) into one atlas surface and hands out integer
+    ids. Each id maps to a subsurface of the atlas, so frames share the
+    atlas pixels and the texture renderer can draw them by source rect.
+
+    The packed atlas is kept in a PixelCache keyed by a hash of the
+    source PNGs and frame specs; later launches map it from disk
+    instead of decoding and scaling.
+
+    A collision mask of each frame's opaque pixels is built along with
+    the atlas, so pixel-accurate collision never builds masks in play.
+    """
+
+    def __init__(self, frames: dict = SPRITE_FRAMES, pixel_cache: PixelCache = None):
+        self.frames = frames
+        self.pixel_cache = pixel_cache or PixelCache()
+        self.atlas = None
+        self.manifest = {}
+        self._ids = {}
+        self._surfaces = []
+        self._masks = []
+        self._masks_by_surface = {}
+        self._opaque_rects = []
+
+    def build(self) -> None:
+        """Map the cached atlas, or load all frames and pack (and cache) it."""
+        paths = [os.path.join(ASSETS_DIR, spec[0]) for spec in self.frames.values()]
+        source_hash = hash_sources(paths, extra=(self.frames, ATLAS_WIDTH, ATLAS_PADDING))
+
+        cached = self.pixel_cache.load('atlas', source_hash)
+        if cached is not None:
+            self.atlas, meta = cached
+            self.manifest = {
+                (name, flipped): pygame.Rect(rect) for name, flipped, rect in meta['manifest']
+            }
+        else:
+            self.atlas, self.manifest = self._pack()
+            self.pixel_cache.save('atlas', self.atlas, source_hash, manifest=[
+                [name, flipped, list(rect)] for (name, flipped), rect in self.manifest.items()
+            ])
+
+        self._ids = {}
+        self._surfaces = []
+        self._masks = []
+        self._masks_by_surface = {}
+        self._opaque_rects = []
+        for key, rect in self.manifest.items():
+            self._ids[key] = len(self._surfaces)
+            surface = self.atlas.subsurface(rect)
+            mask = pygame.mask.from_surface(surface)
+            self._surfaces.append(surface)
+            self._masks.append(mask)
+            self._masks_by_surface[surface] = mask
+            bounds = mask.get_bounding_rects()
+            self._opaque_rects.append(bounds[0].unionall(bounds[1:]) if bounds else surface.get_rect())
+
+    def _pack(self):
+        """Decode, scale and pack every frame."""
+        builder = AtlasBuilder()
+        for name, (filename, size, flippable, color, fallback_size) in self.frames.items():
+            surface = self._load(filename, size, color, fallback_size or size)
+            builder.add((name, False), surface)
+            if flippable:
+                builder.add((name, True), pygame.transform.flip(surface, True, False))
+        return builder.build()
+
+    def sprite_id(self, name: str, flipped: bool = False) -> int:
+        """Get the id of a frame (building the atlas on first use)."""
+        if self.atlas is None:
+            self.build()
+        return self._ids[(name, flipped)]
+
+    def surface(self, sprite_id: int) -> pygame.Surface:
+        """Get the atlas subsurface for a sprite id."""
+        return self._surfaces[sprite_id]
+
+    def frame(self, name: str, flipped: bool = False) -> pygame.Surface:
+        """Get the atlas subsurface for a frame name."""
+        sprite_id = self.sprite_id(name, flipped)
+        return self._surfaces[sprite_id]
+
+    def mask(self, sprite_id: int) -> pygame.mask.Mask:
+        """Get the collision mask for a sprite id."""
+        return self._masks[sprite_id]
+
+    def mask_of(self, surface: pygame.Surface) -> pygame.mask.Mask:
+        """Get the collision mask for a frame surface from this cache."""
+        return self._masks_by_surface[surface]
+
+    def opaque_rect(self, sprite_id: int) -> pygame.Rect:
+        """Get the bounding box of a sprite id's opaque pixels (frame coordinates)."""
+        return self._opaque_rects[sprite_id]
+
+    def clear(self) -> None:
+        """Drop the atlas and all frames."""
+        self.atlas = None
+        self.manifest = {}
+        self._ids.clear()
+        self._surfaces.clear()
+        self._masks.clear()
+        self._masks_by_surface.clear()
+        self._opaque_rects.clear()
+
+    def _load(self, filename: str, size: tuple, fallback_color, fallback_size: tuple) -> pygame.Surface:
+        """Load a sprite image and scale it to size."""
+        path = os.path.join(ASSETS_DIR, filename)
+        try:
+            image = load_image(path)
+            return pygame.transform.scale(image, size)
+        except (pygame.error, FileNotFoundError):
+            # Fallback to colored rectangle
+            surface = pygame.Surface(fallback_size)
+            surface.fill(fallback_color)
+            return surface
+
+
+# Shared instance used by all entities
+sprite_cache = SpriteCache()
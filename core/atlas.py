@@ -0,0 +1,52 @@
+"""
+Atlas - Packs sprite frames into a single surface.
+"""
+
+import pygame
+from config import ATLAS_WIDTH, ATLAS_PADDING
+
+
+class AtlasBuilder:
+    """
+    Shelf packer: frames are placed tallest first, left to right, on
+    rows ("shelves") as tall as their first frame. Frames are padded
+    so scaled or filtered draws don't bleed into their neighbours.
+    """
+
+    def __init__(self, width: int = ATLAS_WIDTH, padding: int = ATLAS_PADDING):
+        self.width = width
+        self.padding = padding
+        self._frames = []
+
+    def add(self, key, surface: pygame.Surface) -> None:
+        """Queue a frame for packing."""
+        if surface.get_width() + 2 * self.padding > self.width:
+            raise ValueError(f"frame {key!r} is wider than the atlas")
+        self._frames.append((key, surface))
+
+    def build(self):
+        """
+        Pack all queued frames.
+
+        Returns:
+            (atlas surface, manifest of key -> Rect within the atlas)
+        """
+        pad = self.padding
+        order = sorted(self._frames, key=lambda frame: frame[1].get_height(), reverse=True)
+
+        manifest = {}
+        x = y = shelf_height = 0
+        for key, surface in order:
+            w, h = surface.get_size()
+            if x + w + 2 * pad > self.width:
+                x = 0
+                y += shelf_height
+                shelf_height = 0
+            manifest[key] = pygame.Rect(x + pad, y + pad, w, h)
+            x += w + 2 * pad
+            shelf_height = max(shelf_height, h + 2 * pad)
+
+        atlas = pygame.Surface((self.width, max(1, y + shelf_height)), pygame.SRCALPHA)
+        for key, surface in self._frames:
+            atlas.blit(surface, manifest[key])
+        return atlas, manifest
@@ -0,0 +1,189 @@
+"""
+Audio - Preloaded sound effects played through a fixed voice pool.
+"""
+
+import os
+import random
+import time
+from array import array
+import pygame
+from config import AUDIO_ENABLED, AUDIO_CHANNELS, SOUND_EFFECTS, SOUNDS_DIR
+from .event_manager import EventManager, GameEvent
+
+# Game event -> sound played for it
+EVENT_SOUNDS = {
+    GameEvent.BULLET_FIRED: 'shoot',
+    GameEvent.ENEMY_KILLED: 'enemy_killed',
+    GameEvent.PLAYER_DAMAGED: 'player_damaged',
+    GameEvent.PLAYER_DIED: 'player_died',
+}
+
+
+def synthesize(waveform: str, start_hz: float, end_hz: float, seconds: float,
+               volume: float, rng: random.Random):
+    """
+    A Sound for a tone sweeping from start_hz to end_hz with a linear
+    fade out, in the mixer's format. waveform is "square" or "noise"
+    (random levels held for one cycle, so the sweep still sounds
+    pitched). Returns None for mixer formats other than 16-bit.
+    """
+    frequency, size, channels = pygame.mixer.get_init()
+    if abs(size) != 16:
+        return None
+
+    count = max(1, int(frequency * seconds))
+    peak = 32767 * volume
+    samples = array('h')
+    phase = 0.0
+    level = 1.0
+    for i in range(count):
+        t = i / count
+        hz = start_hz + (end_hz - start_hz) * t
+        phase += hz / frequency
+        if phase >= 1.0:
+            phase -= int(phase)
+            if waveform == "noise":
+                level = rng.uniform(-1.0, 1.0)
+        if waveform == "square":
+            level = 1.0 if phase < 0.5 else -1.0
+        value = int(level * peak * (1.0 - t))
+        samples.extend((value,) * channels)
+    return pygame.mixer.Sound(buffer=samples)
+
+
+class AudioManager:
+    """
+    Plays SOUND_EFFECTS for game events.
+
+    Every sound is loaded (from SOUNDS_DIR, or synthesized from its
+    fallback tone) when the manager is created, so playing never touches
+    the disk. Sounds play on a fixed pool of AUDIO_CHANNELS mixer
+    channels; when all are busy a new sound takes the channel of the
+    oldest, lowest priority voice that isn't more important than it, or
+    is dropped. Each sound also has a minimum interval between plays and
+    a cap on simultaneous voices (past it, the oldest of its own voices
+    restarts), so bursts of the same event don't fill the pool.
+
+    Without a working mixer (no device, or AUDIO_ENABLED off) every
+    call does nothing. SDL's dummy audio driver works like a real one.
+    Set muted to silence events temporarily (rollback replays).
+    """
+
+    def __init__(self, event_manager: EventManager, effects: dict = SOUND_EFFECTS,
+                 channels: int = AUDIO_CHANNELS):
+        self.event_manager = event_manager
+        self.enabled = AUDIO_ENABLED and pygame.mixer.get_init() is not None
+        self.muted = False
+
+        self.effects = effects
+        self.sounds = {}
+        self.channels = []
+        self._voices = []           # per channel: (sound name, priority, start time) or None
+        self._last_played = {}      # sound name -> start time
+        self._handlers = {}         # event type -> subscribed callback
+
+        # Counters for tuning the limits
+        self.played = 0
+        self.limited = 0
+        self.stolen = 0
+        self.dropped = 0
+
+        if not self.enabled:
+            return
+
+        pygame.mixer.set_num_channels(channels)
+        self.channels = [pygame.mixer.Channel(i) for i in range(channels)]
+        self._voices = [None] * channels
+        self._preload()
+
+        for event_type, name in EVENT_SOUNDS.items():
+            self._handlers[event_type] = self._handler(name)
+            event_manager.subscribe(event_type, self._handlers[event_type])
+
+    def _preload(self) -> None:
+        """Load or synthesize every sound up front."""
+        rng = random.Random(0)
+        for name, (filename, _, _, _, tone) in self.effects.items():
+            path = os.path.join(SOUNDS_DIR, filename)
+            sound = None
+            if os.path.exists(path):
+                try:
+                    sound = pygame.mixer.Sound(path)
+                except pygame.error:
+                    sound = None
+            if sound is None:
+                sound = synthesize(*tone, rng)
+            if sound is not None:
+                self.sounds[name] = sound
+
+    def _handler(self, name: str):
+        def on_event(data=None) -> None:
+            self.play(name)
+        return on_event
+
+    def play(self, name: str):
+        """Play a sound by name; returns the channel used, or None."""
+        if not self.enabled or self.muted:
+            return None
+        sound = self.sounds.get(name)
+        if sound is None:
+            return None
+
+        _, priority, min_interval, max_voices, _ = self.effects[name]
+        now = time.monotonic()
+        if now - self._last_played.get(name, float('-inf')) < min_interval:
+            self.limited += 1
+            return None
+
+        index = self._pick_channel(name, priority, max_voices)
+        if index is None:
+            self.dropped += 1
+            return None
+
+        channel = self.channels[index]
+        channel.play(sound)
+        self._voices[index] = (name, priority, now)
+        self._last_played[name] = now
+        self.played += 1
+        return channel
+
+    def _pick_channel(self, name: str, priority: int, max_voices: int):
+        """Index of the channel to play on, or None to drop the sound."""
+        free = None
+        own = []        # (start time, index) of this sound's voices
+        victims = []    # (priority, start time, index) of voices it may take over
+        for index, channel in enumerate(self.channels):
+            voice = self._voices[index]
+            if voice is None or not channel.get_busy():
+                self._voices[index] = None
+                if free is None:
+                    free = index
+                continue
+            voice_name, voice_priority, started = voice
+            if voice_name == name:
+                own.append((started, index))
+            if voice_priority <= priority:
+                victims.append((voice_priority, started, index))
+
+        if len(own) >= max_voices:
+            self.stolen += 1
+            return min(own)[1]
+        if free is not None:
+            return free
+        if victims:
+            self.stolen += 1
+            return min(victims)[2]
+        return None
+
+    def close(self) -> None:
+        """Unsubscribe from events and silence every voice."""
+        for event_type, handler in self._handlers.items():
+            self.event_manager.unsubscribe(event_type, handler)
+        self._handlers.clear()
+        self.stop()
+
+    def stop(self) -> None:
+        """Silence every voice."""
+        for index, channel in enumerate(self.channels):
+            channel.stop()
+            self._voices[index] = None
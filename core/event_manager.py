@@ -12,6 +12,7 @@ class GameEvent(Enum):
     PLAYER_DAMAGED = auto()
     ENEMY_KILLED = auto()
     BULLET_FIRED = auto()
+    BULLET_HIT = auto()
     GAME_PAUSED = auto()
     GAME_RESUMED = auto()
 
@@ -42,6 +43,10 @@ class EventManager:
             for callback in self._listeners[event_type]:
                 callback(data)
 
+    def listener_count(self) -> int:
+        """Total number of registered listeners."""
+        return sum(len(callbacks) for callbacks in self._listeners.values())
+
     def clear(self) -> None:
         """Remove all listeners."""
         self._listeners.clear()
@@ -0,0 +1,136 @@
+"""
+Frame Pacer - Selectable frame pacing strategies with jitter statistics.
+"""
+
+import time
+from collections import deque
+import pygame
+from config import FPS, FRAME_PACING_SPIN_MS, FRAME_STATS_WINDOW
+
+STRATEGIES = ("sleep", "busy", "hybrid", "vsync")
+
+# Histogram bin width for frame intervals
+BIN_MS = 0.5
+
+# vsync check: frames measured before deciding whether presents really block
+VSYNC_PROBE_FRAMES = 30
+
+
+def _percentile(ordered: list, fraction: float) -> float:
+    return ordered[min(len(ordered) - 1, int(len(ordered) * fraction))]
+
+
+class FramePacer:
+    """
+    Waits for the next frame and measures how evenly frames arrive.
+
+    Strategies:
+        sleep  - clock.tick: cheap, but only as precise as the OS sleep
+        busy   - clock.tick_busy_loop: precise, burns a core
+        hybrid - sleep until FRAME_PACING_SPIN_MS before the deadline,
+                 then spin; deadlines advance by whole periods so
+                 timing errors don't accumulate
+        vsync  - no waiting; presenting blocks on the display refresh.
+                 Drivers can accept vsync and ignore it, so if the first
+                 frames come much faster than the period the pacer
+                 switches to hybrid
+
+    Every interval between tick() calls goes into a histogram and a
+    window of recent samples for percentile reports.
+    """
+
+    def __init__(self, strategy: str = "sleep", fps: int = FPS):
+        if strategy not in STRATEGIES:
+            raise ValueError(f"unknown frame pacing strategy: {strategy}")
+        self.strategy = strategy
+        self.fps = fps
+        self.period = 1.0 / fps
+        self.clock = pygame.time.Clock()
+
+        self.histogram = {}     # bin start (ms) -> count
+        self.frames = 0
+        self._intervals = deque(maxlen=FRAME_STATS_WINDOW)
+        self._last = None
+        self._deadline = None
+
+    def tick(self) -> float:
+        """Wait for the next frame; returns the time since the last tick in seconds."""
+        if self.strategy == "sleep":
+            self.clock.tick(self.fps)
+        elif self.strategy == "busy":
+            self.clock.tick_busy_loop(self.fps)
+        elif self.strategy == "hybrid":
+            self._wait_hybrid()
+
+        now = time.perf_counter()
+        if self._last is None:
+            self._last = now
+            return self.period
+        interval = now - self._last
+        self._last = now
+        self._record(interval * 1000.0)
+        return interval
+
+    def _wait_hybrid(self) -> None:
+        now = time.perf_counter()
+        if self._deadline is None or now - self._deadline > self.period:
+            # First frame, or too far behind to catch up: restart the schedule
+            self._deadline = now + self.period
+        else:
+            self._deadline += self.period
+
+        sleep_for = self._deadline - now - FRAME_PACING_SPIN_MS / 1000.0
+        if sleep_for > 0:
+            time.sleep(sleep_for)
+        while time.perf_counter() < self._deadline:
+            pass
+
+    def _record(self, interval_ms: float) -> None:
+        if self.strategy == "vsync" and len(self._intervals) == VSYNC_PROBE_FRAMES:
+            median = sorted(self._intervals)[VSYNC_PROBE_FRAMES // 2]
+            if median < self.period * 1000.0 * 0.75:
+                self.strategy = "hybrid"
+                self.frames = 0
+                self.histogram.clear()
+                self._intervals.clear()
+                return
+        self.frames += 1
+        self._intervals.append(interval_ms)
+        bin_start = int(interval_ms / BIN_MS) * BIN_MS
+        self.histogram[bin_start] = self.histogram.get(bin_start, 0) + 1
+
+    def stats(self) -> dict:
+        """Interval and jitter percentiles (ms) over the recent window."""
+        if not self._intervals:
+            return {}
+        target = self.period * 1000.0
+        intervals = sorted(self._intervals)
+        jitter = sorted(abs(interval - target) for interval in self._intervals)
+        return {
+            'strategy': self.strategy,
+            'frames': len(intervals),
+            'target_ms': target,
+            'interval_p50_ms': _percentile(intervals, 0.5),
+            'interval_p99_ms': _percentile(intervals, 0.99),
+            'jitter_p50_ms': _percentile(jitter, 0.5),
+            'jitter_p99_ms': _percentile(jitter, 0.99),
+            'jitter_max_ms': jitter[-1],
+        }
+
+    def report(self) -> str:
+        """Human-readable stats and histogram of all frames."""
+        stats = self.stats()
+        if not stats:
+            return "[pacing] no frames"
+        lines = [
+            f"[pacing] {stats['strategy']}: {self.frames} frames, target {stats['target_ms']:.2f} ms",
+            f"[pacing] interval p50 {stats['interval_p50_ms']:.2f} ms  p99 {stats['interval_p99_ms']:.2f} ms",
+            f"[pacing] jitter p50 {stats['jitter_p50_ms']:.3f} ms  p99 {stats['jitter_p99_ms']:.3f} ms  "
+            f"max {stats['jitter_max_ms']:.3f} ms",
+        ]
+        peak = max(self.histogram.values())
+        for bin_start in sorted(self.histogram):
+            count = self.histogram[bin_start]
+            bar = '#' * max(1, round(count / peak * 40))
+            lines.append(f"[pacing] {bin_start:6.1f} ms {count:7d} {bar}")
+        return "\n".join(lines)
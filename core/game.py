@@ -2,9 +2,20 @@
 Game - Main game class with game loop and state management.
 """
 
+import time
 import pygame
-from config import SCREEN_WIDTH, SCREEN_HEIGHT, FPS, TITLE
+from config import (
+    SCREEN_WIDTH, SCREEN_HEIGHT, TITLE, RENDERER, RENDERER_SDL_SOFTWARE, SPIKE_PROFILER,
+    FRAME_PACING, AUDIO_FREQUENCY, AUDIO_BUFFER, RENDER_PIPELINED
+)
+from .audio import AudioManager
 from .event_manager import EventManager
+from .frame_pacer import FramePacer
+from .input import InputManager
+from .persistence import SessionStore
+from .render_pipeline import RenderPipeline
+from .renderer import SoftwareRenderer, TextureRenderer
+from .spike_profiler import SpikeProfiler
 
 
 class Game:
@@ -13,17 +24,50 @@ class Game:
     Manages the game loop and state stack.
     """
 
-    def __init__(self):
+    def __init__(self, renderer: str = RENDERER, sdl_software: bool = RENDERER_SDL_SOFTWARE,
+                 pacing: str = FRAME_PACING, pipelined: bool = RENDER_PIPELINED):
+        """
+        Args:
+            renderer: "software" or "texture" backend
+            sdl_software: Run the texture backend on SDL's software renderer
+            pacing: Frame pacing strategy (see FramePacer)
+            pipelined: Draw each frame on a render thread while the next is updated
+        """
+        # Small mixer buffer so effects play without noticeable delay
+        pygame.mixer.pre_init(AUDIO_FREQUENCY, -16, 2, AUDIO_BUFFER)
         pygame.init()
-        pygame.display.set_caption(TITLE)
 
-        self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
-        self.clock = pygame.time.Clock()
+        size = (SCREEN_WIDTH, SCREEN_HEIGHT)
+        vsync = pacing == "vsync"
+        if renderer == "texture":
+            self.renderer = TextureRenderer(size, TITLE, software=sdl_software, vsync=vsync)
+        else:
+            self.renderer = SoftwareRenderer(size, TITLE, vsync=vsync)
+
+        # Without driver vsync, fall back to the most precise timed strategy
+        if vsync and not self.renderer.vsync:
+            pacing = "hybrid"
+        self.pacer = FramePacer(pacing)
+
+        # Texture drawing has to stay on the thread that made the renderer
+        self.pipeline = None
+        if pipelined:
+            if self.renderer.software:
+                self.pipeline = RenderPipeline(self.renderer)
+            else:
+                print("[render] pipelining needs the software renderer; drawing serially")
+        self.input = InputManager()
+        self.input.install()
         self.running = True
         self.event_manager = EventManager()
+        self.audio = AudioManager(self.event_manager)
+        self.sessions = SessionStore()
+        self.frame_time = 0.0  # ms spent on events/update/render last frame
+        self.profiler = SpikeProfiler(self) if SPIKE_PROFILER else None
 
         # State stack for managing game states
         self.state_stack = []
+        self.playing_state = None  # Reused across restarts
 
     def push_state(self, state) -> None:
         """Push a new state onto the stack."""
@@ -53,15 +97,15 @@ class Game:
         return self.state_stack[-1] if self.state_stack else None
 
     def handle_events(self) -> None:
-        """Process all pygame events."""
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                self.running = False
-                return
+        """Poll input once and let the current state read its actions."""
+        self.input.poll()
+        if self.input.quit_requested:
+            self.running = False
+            return
 
-            # Pass event to current state
-            if self.current_state():
-                self.current_state().handle_event(event)
+        state = self.current_state()
+        if state:
+            state.handle_input(self.input)
 
     def update(self, dt: float) -> None:
         """Update current state."""
@@ -69,19 +113,67 @@ class Game:
             self.current_state().update(dt)
 
     def render(self) -> None:
-        """Render current state."""
-        if self.current_state():
-            self.current_state().render(self.screen)
-        pygame.display.flip()
+        """Render current state and show it."""
+        self.draw()
+        self.present()
+
+    def draw(self) -> None:
+        """Draw the current state's frame (or record it, when pipelined)."""
+        if self.pipeline is not None:
+            self.pipeline.submit(self.current_state())
+        elif self.current_state():
+            self.current_state().render(self.renderer)
+
+    def present(self) -> None:
+        """Show the drawn frame; with vsync this waits for the display."""
+        if self.pipeline is not None:
+            self.pipeline.present()
+        else:
+            self.renderer.present()
 
     def run(self) -> None:
         """Main game loop."""
+        profiler = self.profiler
+        if profiler:
+            profiler.start()
+
         while self.running:
             # Delta time in seconds
-            dt = self.clock.tick(FPS) / 1000.0
+            dt = self.pacer.tick()
+            frame_start = time.perf_counter()
+            if profiler:
+                profiler.begin_frame()
 
             self.handle_events()
+            events_done = time.perf_counter()
             self.update(dt)
-            self.render()
-
+            update_done = time.perf_counter()
+            self.draw()
+            frame_end = time.perf_counter()
+            self.present()
+
+            # Frame work excludes presenting: a vsync wait isn't load, and
+            # counting it would keep the spawn and resolution throttles
+            # pinned at the frame budget
+            self.frame_time = (frame_end - frame_start) * 1000.0
+            if profiler:
+                profiler.end_frame(self.frame_time, {
+                    'events': (events_done - frame_start) * 1000.0,
+                    'update': (update_done - events_done) * 1000.0,
+                    'render': (frame_end - update_done) * 1000.0,
+                    'present': (time.perf_counter() - frame_end) * 1000.0,
+                })
+
+        if profiler:
+            profiler.stop()
+        self.shutdown()
+
+    def shutdown(self) -> None:
+        """Exit every state, finish pending saves and close pygame."""
+        while self.state_stack:
+            self.state_stack.pop().exit()
+        if self.pipeline is not None:
+            self.pipeline.close()
+        self.sessions.close()
+        self.audio.close()
         pygame.quit()
@@ -0,0 +1,86 @@
+"""
+Input - Named actions from filtered keyboard events, with buffering.
+"""
+
+import time
+import pygame
+from config import INPUT_ACTIONS
+
+# The only SDL events the game reads; everything else is dropped by SDL
+ALLOWED_EVENTS = (pygame.QUIT, pygame.KEYDOWN, pygame.KEYUP, pygame.WINDOWFOCUSLOST)
+
+
+class InputManager:
+    """
+    Turns keyboard events into named actions (INPUT_ACTIONS).
+
+    SDL is told to queue only the events in ALLOWED_EVENTS, so mouse
+    motion and window chatter never reach Python. poll() drains the
+    queue once per frame, tracking which keys are held and when each
+    action was last pressed. States then ask about actions:
+
+        held(action)             - any of its keys is down
+        pressed(action, buffer)  - pressed within the last `buffer` seconds
+                                   (0 means during this frame's poll)
+        consume(action, buffer)  - pressed(), and forget the press
+
+    Buffered presses let a jump tapped just before landing, or a shot
+    tapped during the cooldown, still happen.
+    """
+
+    def __init__(self, actions: dict = INPUT_ACTIONS):
+        self._keys = {}             # action -> key codes
+        self._actions_by_key = {}   # key code -> actions
+        for action, names in actions.items():
+            codes = {pygame.key.key_code(name) for name in names}
+            self._keys[action] = codes
+            for code in codes:
+                self._actions_by_key.setdefault(code, []).append(action)
+
+        self._held_keys = set()
+        self._presses = {}          # action -> time of the last unconsumed press
+        self.now = time.perf_counter()
+        self.quit_requested = False
+
+    def install(self) -> None:
+        """Restrict the SDL event queue to the events we read."""
+        pygame.event.set_blocked(None)
+        pygame.event.set_allowed(list(ALLOWED_EVENTS))
+
+    def poll(self) -> None:
+        """Drain the event queue and update action state."""
+        self.now = time.perf_counter()
+        for event in pygame.event.get():
+            kind = event.type
+            if kind == pygame.KEYDOWN:
+                self._held_keys.add(event.key)
+                for action in self._actions_by_key.get(event.key, ()):
+                    self._presses[action] = self.now
+            elif kind == pygame.KEYUP:
+                self._held_keys.discard(event.key)
+            elif kind == pygame.QUIT:
+                self.quit_requested = True
+            elif kind == pygame.WINDOWFOCUSLOST:
+                # Key releases while unfocused never arrive
+                self._held_keys.clear()
+
+    def held(self, action: str) -> bool:
+        """True while any key for the action is down."""
+        return not self._held_keys.isdisjoint(self._keys[action])
+
+    def pressed(self, action: str, buffer: float = 0.0) -> bool:
+        """True if the action was pressed within `buffer` seconds and not consumed."""
+        pressed_at = self._presses.get(action)
+        return pressed_at is not None and self.now - pressed_at <= buffer
+
+    def consume(self, action: str, buffer: float = 0.0) -> bool:
+        """Like pressed(), but the press is used up."""
+        if self.pressed(action, buffer):
+            del self._presses[action]
+            return True
+        return False
+
+    def clear(self) -> None:
+        """Forget held keys and pending presses."""
+        self._held_keys.clear()
+        self._presses.clear()
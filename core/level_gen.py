@@ -0,0 +1,151 @@
+"""
+Level Gen - Seeded endless level chunks, generated on a worker thread.
+"""
+
+import queue
+import random
+import threading
+from config import (
+    SCREEN_HEIGHT, ENDLESS_CHUNK_WIDTH, ENDLESS_PLATFORMS, ENDLESS_TIERS,
+    ENDLESS_GAP, ENDLESS_SPAWN_CLEARANCE
+)
+from entities.platform import Platform
+
+GROUND_HEIGHT = 70
+GROUND_TOP = SCREEN_HEIGHT - GROUND_HEIGHT
+PLATFORM_WIDTHS = (140, 210, 280)   # 2-4 tiles
+EDGE_MARGIN = 35                    # kept free at both chunk edges
+
+
+class Chunk:
+    """
+    One ENDLESS_CHUNK_WIDTH slice of the level, ready to install: its
+    platforms (images already tiled) and their collision boxes as
+    (left, top, right, bottom) tuples.
+    """
+
+    def __init__(self, seed: int, index: int, platforms: list):
+        self.seed = seed
+        self.index = index
+        self.left = index * ENDLESS_CHUNK_WIDTH
+        self.right = self.left + ENDLESS_CHUNK_WIDTH
+        self.platforms = platforms
+        self.boxes = [(p.rect.left, p.rect.top, p.rect.right, p.rect.bottom) for p in platforms]
+
+
+def generate_chunk(seed: int, index: int) -> Chunk:
+    """
+    Build chunk `index` of the level for `seed`. The result only depends
+    on the two numbers, so a dropped chunk comes back identical.
+
+    Every chunk has a ground strip. Floating platforms follow a random
+    walk over the ENDLESS_TIERS heights, moving one tier at a time, so
+    each one can be reached from the ground or the one before it.
+    """
+    rng = random.Random(f"{seed}:{index}")
+    left = index * ENDLESS_CHUNK_WIDTH
+    right = left + ENDLESS_CHUNK_WIDTH
+
+    # Ground pieces join up with their neighbors, so no edge tiles
+    platforms = [Platform(left, GROUND_TOP, ENDLESS_CHUNK_WIDTH, GROUND_HEIGHT, edges=False)]
+
+    x = left + EDGE_MARGIN + rng.randint(0, ENDLESS_GAP[1])
+    if index == 0:
+        x = max(x, ENDLESS_SPAWN_CLEARANCE)
+    tier = 0
+    count = rng.randint(*ENDLESS_PLATFORMS)
+    while count > 0:
+        width = rng.choice(PLATFORM_WIDTHS)
+        if x + width > right - EDGE_MARGIN:
+            break
+        platforms.append(Platform(x, ENDLESS_TIERS[tier], width, GROUND_HEIGHT))
+        count -= 1
+
+        # Step up or down a tier (or back to the lowest) for the next one
+        tier = max(0, min(len(ENDLESS_TIERS) - 1, tier + rng.choice((-1, 1, 1))))
+        if rng.random() < 0.2:
+            tier = 0
+        x += width + rng.randint(*ENDLESS_GAP)
+
+    return Chunk(seed, index, platforms)
+
+
+class ChunkStreamer:
+    """
+    Generates chunks on a background thread.
+
+    The main thread asks for chunk indices with request() and picks up
+    finished chunks with finished(); it never waits on generation
+    unless it asks to with wait(). Chunks for an older seed (requested
+    before a restart) are thrown away when they arrive.
+    """
+
+    def __init__(self, seed: int):
+        self.seed = seed
+        self.pending = set()        # indices requested but not yet picked up
+        self.generated = 0
+        self._requests = queue.Queue()
+        self._results = queue.Queue()
+        self._thread = None
+
+    def reseed(self, seed: int) -> None:
+        """Switch to a new level; chunks already requested are discarded."""
+        self.seed = seed
+        self.pending.clear()
+
+    def request(self, index: int) -> None:
+        """Queue a chunk for generation (once)."""
+        if index in self.pending:
+            return
+        self.pending.add(index)
+        self._start_worker()
+        self._requests.put((self.seed, index))
+
+    def finished(self) -> list:
+        """Chunks generated since the last call, for the current seed."""
+        chunks = []
+        while True:
+            try:
+                chunk = self._results.get_nowait()
+            except queue.Empty:
+                return chunks
+            self._accept(chunk, chunks)
+
+    def wait(self, index: int) -> list:
+        """Like finished(), but block until chunk `index` is among the results."""
+        self.request(index)
+        chunks = []
+        while index in self.pending:
+            self._accept(self._results.get(), chunks)
+        return chunks + self.finished()
+
+    def close(self) -> None:
+        """Stop the worker thread (requests restart it)."""
+        if self._thread is not None:
+            self._requests.put(None)
+            self._thread.join()
+            self._thread = None
+        self.pending.clear()
+        while not self._results.empty():
+            self._results.get_nowait()
+
+    def _accept(self, chunk: Chunk, chunks: list) -> None:
+        if chunk.seed == self.seed and chunk.index in self.pending:
+            self.pending.discard(chunk.index)
+            chunks.append(chunk)
+
+    def _start_worker(self) -> None:
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._work, name="chunk-generator", daemon=True)
+            self._thread.start()
+
+    def _work(self) -> None:
+        while True:
+            item = self._requests.get()
+            if item is None:
+                return
+            seed, index = item
+            if seed != self.seed:
+                continue    # restarted since the request
+            self._results.put(generate_chunk(seed, index))
+            self.generated += 1
@@ -0,0 +1,312 @@
+"""
+Netplay - Input-only UDP sync with prediction and rollback.
+"""
+
+import heapq
+import random
+import socket
+import struct
+import time
+from config import (
+    NET_INPUT_DELAY, NET_MAX_ROLLBACK, NET_MAX_PACKET_INPUTS, NET_CHECKSUM_INTERVAL,
+    INPUT_JUMP_BUFFER, INPUT_SHOOT_BUFFER
+)
+
+# Input bits for one player and frame
+INPUT_LEFT = 1
+INPUT_RIGHT = 2
+INPUT_JUMP = 4
+INPUT_SHOOT = 8
+
+# Packet: first input frame, ack (last contiguous remote frame received),
+# checksum frame and value, run count; then (input, run length) byte pairs
+PACKET_HEADER = struct.Struct('<iiiIB')
+MAX_RUN = 255
+
+
+def input_bits(actions) -> int:
+    """Pack an InputManager's actions into input bits. Buffered presses
+    stay set for the buffer window, so taps survive input delay."""
+    bits = 0
+    if actions.held("left"):
+        bits |= INPUT_LEFT
+    if actions.held("right"):
+        bits |= INPUT_RIGHT
+    if actions.held("jump") or actions.pressed("jump", INPUT_JUMP_BUFFER):
+        bits |= INPUT_JUMP
+    if actions.held("shoot") or actions.pressed("shoot", INPUT_SHOOT_BUFFER):
+        bits |= INPUT_SHOOT
+    return bits
+
+
+def pack_inputs(start: int, ack: int, inputs, checksum_frame: int = -1, checksum: int = 0) -> bytes:
+    """
+    Pack a run of per-frame inputs. Inputs rarely change between frames,
+    so they are run-length encoded: a second of held input is two bytes.
+    """
+    runs = bytearray()
+    count = 0
+    previous = None
+    length = 0
+    for bits in inputs:
+        if bits == previous and length < MAX_RUN:
+            length += 1
+            continue
+        if previous is not None:
+            runs += bytes((previous, length))
+            count += 1
+        previous, length = bits, 1
+    if previous is not None:
+        runs += bytes((previous, length))
+        count += 1
+    return PACKET_HEADER.pack(start, ack, checksum_frame, checksum, count) + bytes(runs)
+
+
+def unpack_inputs(packet: bytes):
+    """
+    Unpack a packet from pack_inputs.
+
+    Returns:
+        (start frame, ack, checksum frame, checksum, list of inputs)
+    """
+    start, ack, checksum_frame, checksum, count = PACKET_HEADER.unpack_from(packet)
+    inputs = []
+    offset = PACKET_HEADER.size
+    for _ in range(count):
+        bits, length = packet[offset], packet[offset + 1]
+        inputs.extend([bits] * length)
+        offset += 2
+    return start, ack, checksum_frame, checksum, inputs
+
+
+class UdpTransport:
+    """
+    Non-blocking UDP socket bound to one peer. Can simulate one-way
+    latency and packet loss on send, so two instances on one machine
+    behave like a real link over loopback.
+    """
+
+    def __init__(self, local_port: int, remote_address: tuple, latency_ms: float = 0.0,
+                 loss: float = 0.0, seed=None, clock=time.monotonic):
+        """
+        Args:
+            local_port: UDP port to bind on all interfaces
+            remote_address: (host, port) of the other peer
+            latency_ms: Simulated one-way delay added to every packet
+            loss: Fraction of packets dropped on send
+            seed: Seed for the loss simulation
+            clock: Time source in seconds (a fake clock for tests)
+        """
+        self.remote_address = remote_address
+        self.latency = latency_ms / 1000.0
+        self.loss = loss
+        self.rng = random.Random(seed)
+        self.clock = clock
+        self.sent = 0
+        self.dropped = 0
+
+        self.socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self.socket.bind(('', local_port))
+        self.socket.setblocking(False)
+
+        self._queue = []    # (due time, sequence, packet) awaiting simulated latency
+        self._sequence = 0
+
+    def send(self, packet: bytes) -> None:
+        """Send a packet (after the simulated delay, unless it is dropped)."""
+        self.sent += 1
+        if self.loss and self.rng.random() < self.loss:
+            self.dropped += 1
+            return
+        if not self.latency:
+            self._send_now(packet)
+            return
+        self._sequence += 1
+        heapq.heappush(self._queue, (self.clock() + self.latency, self._sequence, packet))
+
+    def receive(self) -> list:
+        """Flush due delayed packets, then return every packet waiting on the socket."""
+        now = self.clock()
+        while self._queue and self._queue[0][0] <= now:
+            self._send_now(heapq.heappop(self._queue)[2])
+
+        packets = []
+        while True:
+            try:
+                packet, _ = self.socket.recvfrom(2048)
+            except (BlockingIOError, InterruptedError):
+                break
+            except OSError:     # e.g. ICMP port unreachable before the peer starts
+                continue
+            packets.append(packet)
+        return packets
+
+    def close(self) -> None:
+        self.socket.close()
+
+    def _send_now(self, packet: bytes) -> None:
+        try:
+            self.socket.sendto(packet, self.remote_address)
+        except OSError:
+            pass
+
+
+class RollbackSession:
+    """
+    Runs a deterministic simulation for two peers that exchange only
+    inputs. Each frame the local input (delayed by NET_INPUT_DELAY
+    frames) is sent with every input the peer hasn't acknowledged, and
+    the simulation steps with the remote input predicted as its last
+    known value. When a real remote input differs from the prediction,
+    the session restores the state saved before that frame and
+    resimulates up to the present. It stalls rather than predict more
+    than NET_MAX_ROLLBACK frames ahead of the last confirmed input.
+
+    The simulation object provides save_state(), load_state(state),
+    checksum(state) and step(inputs, replay), where inputs holds one
+    input value per player index.
+    """
+
+    def __init__(self, sim, transport: UdpTransport, local_index: int,
+                 input_delay: int = NET_INPUT_DELAY, max_rollback: int = NET_MAX_ROLLBACK):
+        self.sim = sim
+        self.transport = transport
+        self.local_index = local_index
+        self.remote_index = 1 - local_index
+        self.input_delay = input_delay
+        self.max_rollback = max_rollback
+
+        self.frame = 0                  # next frame to simulate
+        self.local_inputs = {}
+        self.remote_inputs = {}
+        self.predicted = {}             # remote input used for each simulated frame
+        self.states = {}                # state at the start of each frame
+        self.remote_received = -1       # last contiguous remote input frame
+        self.remote_ack = -1            # last local input frame the peer has
+        self._rollback_to = None
+
+        # Desync detection: local checksums of confirmed frames
+        self.checksums = {}
+        self.desync_frame = None
+
+        # Stats
+        self.rollbacks = 0
+        self.resimulated = 0
+        self.last_rollback_ms = 0.0
+        self.max_rollback_ms = 0.0
+        self.stalls = 0
+
+    @property
+    def confirmed_frame(self) -> int:
+        """Last frame simulated with real inputs from both players."""
+        return min(self.remote_received, self.frame - 1)
+
+    def update(self, local_bits: int) -> bool:
+        """
+        Run one tick: exchange inputs, roll back if needed and simulate
+        the next frame.
+
+        Returns:
+            False when stalled waiting for the peer.
+        """
+        self._receive()
+
+        stalled = self.frame - self.remote_received > self.max_rollback
+        if not stalled:
+            self.local_inputs.setdefault(self.frame + self.input_delay, local_bits)
+
+        if self._rollback_to is not None:
+            self._resimulate(self._rollback_to)
+            self._rollback_to = None
+
+        self._record_checksums()
+        self._send()
+
+        if stalled:
+            self.stalls += 1
+            return False
+
+        self.states[self.frame] = self.sim.save_state()
+        self.sim.step(self._inputs(self.frame), False)
+        self.frame += 1
+        self._prune()
+        return True
+
+    def _inputs(self, frame: int) -> list:
+        """Inputs for a frame, predicting the remote one if it hasn't arrived."""
+        remote = self.remote_inputs.get(frame)
+        if remote is None:
+            remote = self.remote_inputs.get(self.remote_received, 0)
+            self.predicted[frame] = remote
+        else:
+            self.predicted.pop(frame, None)
+
+        inputs = [0, 0]
+        inputs[self.local_index] = self.local_inputs.get(frame, 0)
+        inputs[self.remote_index] = remote
+        return inputs
+
+    def _resimulate(self, start: int) -> None:
+        """Restore the state before `start` and replay up to the present."""
+        began = time.perf_counter()
+        self.sim.load_state(self.states[start])
+        for frame in range(start, self.frame):
+            if frame != start:
+                self.states[frame] = self.sim.save_state()
+            self.sim.step(self._inputs(frame), True)
+
+        self.rollbacks += 1
+        self.resimulated += self.frame - start
+        self.last_rollback_ms = (time.perf_counter() - began) * 1000.0
+        self.max_rollback_ms = max(self.max_rollback_ms, self.last_rollback_ms)
+
+    def _receive(self) -> None:
+        for packet in self.transport.receive():
+            try:
+                start, ack, checksum_frame, checksum, inputs = unpack_inputs(packet)
+            except (struct.error, IndexError):
+                continue
+            self.remote_ack = max(self.remote_ack, ack)
+
+            for frame, bits in enumerate(inputs, start):
+                if frame in self.remote_inputs or frame <= self.remote_received:
+                    continue
+                self.remote_inputs[frame] = bits
+                # A wrong guess for an already simulated frame needs a rollback
+                if frame < self.frame and self.predicted.get(frame) != bits:
+                    if self._rollback_to is None or frame < self._rollback_to:
+                        self._rollback_to = frame
+            while self.remote_received + 1 in self.remote_inputs:
+                self.remote_received += 1
+
+            local = self.checksums.get(checksum_frame)
+            if local is not None and local != checksum and self.desync_frame is None:
+                self.desync_frame = checksum_frame
+
+    def _send(self) -> None:
+        """Send every local input the peer hasn't acknowledged."""
+        start = self.remote_ack + 1
+        end = min(max(self.local_inputs, default=-1) + 1, start + NET_MAX_PACKET_INPUTS)
+        inputs = [self.local_inputs.get(frame, 0) for frame in range(start, end)]
+
+        checksum_frame = max(self.checksums, default=-1)
+        packet = pack_inputs(start, self.remote_received, inputs,
+                             checksum_frame, self.checksums.get(checksum_frame, 0))
+        self.transport.send(packet)
+
+    def _record_checksums(self) -> None:
+        """Checksum every NET_CHECKSUM_INTERVAL-th frame once it is confirmed."""
+        confirmed = self.confirmed_frame
+        frame = max(self.checksums, default=-NET_CHECKSUM_INTERVAL) + NET_CHECKSUM_INTERVAL
+        while frame <= confirmed and frame in self.states:
+            self.checksums[frame] = self.sim.checksum(self.states[frame])
+            frame += NET_CHECKSUM_INTERVAL
+
+    def _prune(self) -> None:
+        """Forget frames that can no longer be rolled back to or resent."""
+        oldest = min(self.confirmed_frame, self.remote_ack)
+        for history in (self.states, self.predicted, self.remote_inputs, self.local_inputs):
+            for frame in [f for f in history if f < oldest]:
+                del history[frame]
+        for frame in [f for f in self.checksums if f < oldest - NET_CHECKSUM_INTERVAL * 4]:
+            del self.checksums[frame]
@@ -0,0 +1,132 @@
+"""
+Parallax - Background layers that scroll slower than the world.
+"""
+
+import math
+import random
+import pygame
+from config import (
+    SCREEN_WIDTH, SCREEN_HEIGHT, PARALLAX_STRIP_WIDTH,
+    PARALLAX_FAR_FACTOR, PARALLAX_NEAR_FACTOR,
+    COLOR_SKY_TOP, COLOR_SKY_BLUE, COLOR_HILLS_FAR, COLOR_HILLS_NEAR, COLOR_SCENERY
+)
+
+# Transparent key for layer strips; colorkey blits are cheaper than per-pixel alpha
+COLORKEY = (255, 0, 255)
+
+
+class ParallaxLayer:
+    """
+    One pre-rendered strip that wraps horizontally.
+    Scrolls at `factor` times the camera speed and is drawn as at
+    most two slices, so cost doesn't depend on level width.
+    """
+
+    def __init__(self, strip: pygame.Surface, factor: float, y: int):
+        self.strip = strip
+        self.factor = factor
+        self.y = y
+        self._scaled = {1.0: strip}
+
+    def render(self, screen, camera, scale: float = 1.0) -> None:
+        """Draw the visible part of the strip (one or two blits)."""
+        strip = self._strip(scale)
+        width = strip.get_width()
+        height = strip.get_height()
+        view_width = round(SCREEN_WIDTH * scale)
+        y = round((self.y - camera.top * self.factor) * scale)
+
+        offset = int(camera.left * self.factor * scale) % width
+        first = min(width - offset, view_width)
+        screen.blit(strip, (0, y), (offset, 0, first, height))
+        if first < view_width:
+            screen.blit(strip, (first, y), (0, 0, view_width - first, height))
+
+    def _strip(self, scale: float) -> pygame.Surface:
+        """Strip at the given render scale (built once per scale)."""
+        strip = self._scaled.get(scale)
+        if strip is None:
+            size = (round(self.strip.get_width() * scale), round(self.strip.get_height() * scale))
+            strip = pygame.transform.scale(self.strip, size)
+            strip.set_colorkey(self.strip.get_colorkey())
+            self._scaled[scale] = strip
+        return strip
+
+
+class ParallaxBackground:
+    """
+    Sky gradient plus far hills and near scenery layers, generated
+    procedurally once. Strips are tileable: hill outlines are sums of
+    sines with whole periods across the strip, and scenery that crosses
+    the seam is drawn on both ends.
+    """
+
+    def __init__(self, seed: int = 7):
+        rng = random.Random(seed)
+        width = PARALLAX_STRIP_WIDTH
+
+        self.sky = ParallaxLayer(self._sky(), 0.0, 0)
+        self.layers = [
+            self.sky,
+            ParallaxLayer(self._hills(width, 260, COLOR_HILLS_FAR, 170, rng),
+                          PARALLAX_FAR_FACTOR, SCREEN_HEIGHT - 330),
+            ParallaxLayer(self._scenery(width, 220, rng),
+                          PARALLAX_NEAR_FACTOR, SCREEN_HEIGHT - 250),
+        ]
+
+    def render(self, screen, camera, scale: float = 1.0) -> None:
+        """Draw all layers back to front (replaces clearing the screen)."""
+        for layer in self.layers:
+            layer.render(screen, camera, scale)
+
+    def _sky(self) -> pygame.Surface:
+        """Vertical gradient one screen wide; it doesn't scroll."""
+        sky = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+        for y in range(SCREEN_HEIGHT):
+            t = y / (SCREEN_HEIGHT - 1)
+            color = [round(a + (b - a) * t) for a, b in zip(COLOR_SKY_TOP, COLOR_SKY_BLUE)]
+            sky.fill(color, (0, y, SCREEN_WIDTH, 1))
+        return self._finish(sky, alpha=False)
+
+    def _hills(self, width: int, height: int, color, base: int, rng: random.Random) -> pygame.Surface:
+        """Rolling hill outline, filled to the bottom of the strip."""
+        strip = self._blank(width, height)
+        waves = [(rng.randint(1, 4), rng.uniform(15, 45), rng.uniform(0, 2 * math.pi)) for _ in range(3)]
+
+        points = [(0, height)]
+        for x in range(0, width + 1, 4):
+            offset = sum(amp * math.sin(2 * math.pi * k * x / width + phase) for k, amp, phase in waves)
+            points.append((x, height - base - offset))
+        points.append((width, height))
+        pygame.draw.polygon(strip, color, points)
+        return self._finish(strip)
+
+    def _scenery(self, width: int, height: int, rng: random.Random) -> pygame.Surface:
+        """Near hills with trees along their ridge."""
+        strip = self._blank(width, height)
+        hills = self._hills(width, height, COLOR_HILLS_NEAR, 90, rng)
+        strip.blit(hills, (0, 0))
+
+        for _ in range(14):
+            x = rng.randrange(width)
+            trunk_height = rng.randint(18, 30)
+            radius = rng.randint(14, 24)
+            ground = height - 70
+            # Draw on both sides of the seam so the strip tiles cleanly
+            for tx in (x - width, x, x + width):
+                pygame.draw.rect(strip, COLOR_SCENERY, (tx - 3, ground - trunk_height, 6, trunk_height + 40))
+                pygame.draw.circle(strip, COLOR_SCENERY, (tx, ground - trunk_height - radius // 2), radius)
+        return self._finish(strip)
+
+    def _blank(self, width: int, height: int) -> pygame.Surface:
+        strip = pygame.Surface((width, height))
+        strip.fill(COLORKEY)
+        return strip
+
+    def _finish(self, strip: pygame.Surface, alpha: bool = True) -> pygame.Surface:
+        """Convert to the display format (if any) and set the colorkey."""
+        if pygame.display.get_surface() is not None:
+            strip = strip.convert()
+        if alpha:
+            strip.set_colorkey(COLORKEY, pygame.RLEACCEL)
+        return strip
@@ -0,0 +1,224 @@
+"""
+Persistence - Session log and high-score table, written off the main thread.
+"""
+
+import bisect
+import json
+import os
+import queue
+import threading
+import time
+from config import SAVE_DIR, HIGHSCORE_COUNT, SAVE_BATCH_DELAY
+
+SESSION_LOG = "sessions.jsonl"
+HIGHSCORE_FILE = "highscores.json"
+DEFAULT_MODE = "single"     # mode of records that don't name one
+
+
+class SessionStore:
+    """
+    Keeps every finished run in an append-only log (one JSON record
+    per line) and the best HIGHSCORE_COUNT runs of each mode (single,
+    endless, co-op) in a high-score table, so modes don't compete for
+    places.
+
+    Both are read once at startup; if the table is missing or corrupt it
+    is rebuilt from the log. During play, record_session() only updates
+    the in-memory table and queues the writes, so the game never waits
+    on the disk. A background thread collects writes for
+    SAVE_BATCH_DELAY seconds, appends the new records in one write and
+    replaces the table file atomically (temp file, fsync, os.replace),
+    so a crash leaves either the old table or the new one.
+
+    With directory None nothing is read or written.
+    """
+
+    def __init__(self, directory: str = SAVE_DIR, size: int = HIGHSCORE_COUNT,
+                 batch_delay: float = SAVE_BATCH_DELAY):
+        self.directory = directory
+        self.size = size
+        self.batch_delay = batch_delay
+
+        # Mode -> best runs, highest score first; _keys mirrors each as
+        # negated scores so bisect can find ranks
+        self.tables = {}
+        self._keys = {}
+
+        self.sessions = 0       # records written by this process
+        self.errors = 0
+        self._queue = queue.Queue()
+        self._thread = None
+        self._torn_log = False  # log ends mid-line (crash during a write)
+
+        if directory is not None:
+            self._load()
+
+    # --- Main thread ---
+
+    def record_session(self, record: dict):
+        """
+        Log a finished run and add it to its mode's table.
+
+        Returns:
+            1-based rank in the mode's high-score table, or None if it
+            didn't place.
+        """
+        mode = record.get('mode', DEFAULT_MODE)
+        rank = self.rank(record['score'], mode)
+        if rank is not None:
+            # Later runs with the same score rank below earlier ones
+            table = self.tables.setdefault(mode, [])
+            keys = self._keys.setdefault(mode, [])
+            index = bisect.bisect_right(keys, -record['score'])
+            keys.insert(index, -record['score'])
+            table.insert(index, record)
+            del keys[self.size:]
+            del table[self.size:]
+
+        if self.directory is not None:
+            self._start_writer()
+            tables = {mode: list(table) for mode, table in self.tables.items()}
+            self._queue.put((record, tables if rank is not None else None))
+        return rank
+
+    def rank(self, score: int, mode: str = DEFAULT_MODE):
+        """1-based rank a score would get in a mode, or None if it wouldn't place."""
+        rank = bisect.bisect_right(self._keys.get(mode, []), -score) + 1
+        return rank if rank <= self.size else None
+
+    def best(self, mode: str = DEFAULT_MODE) -> int:
+        """Highest recorded score in a mode (0 with none)."""
+        table = self.tables.get(mode)
+        return table[0]['score'] if table else 0
+
+    def close(self) -> None:
+        """Write everything queued and stop the writer thread."""
+        if self._thread is not None:
+            self._queue.put(None)
+            self._thread.join()
+            self._thread = None
+
+    # --- Loading (startup only) ---
+
+    def _load(self) -> None:
+        try:
+            with open(self._path(SESSION_LOG), 'rb') as f:
+                f.seek(0, os.SEEK_END)
+                if f.tell():
+                    f.seek(-1, os.SEEK_END)
+                    self._torn_log = f.read(1) != b'\n'
+        except OSError:
+            pass
+
+        tables = None
+        try:
+            with open(self._path(HIGHSCORE_FILE)) as f:
+                tables = json.load(f)
+        except (OSError, ValueError):
+            pass
+
+        # Any unusable entry means the file can't be trusted; rebuild it.
+        # (A single list is the table from before per-mode tables.)
+        if isinstance(tables, list):
+            tables = {DEFAULT_MODE: tables} if all(map(_is_record, tables)) else None
+        if not isinstance(tables, dict) or not all(
+                isinstance(table, list) and all(map(_is_record, table))
+                for table in tables.values()):
+            tables = self._rebuild_tables()
+        else:
+            tables = self._split_modes(record for table in tables.values() for record in table)
+
+        self.tables = tables
+        self._keys = {mode: [-record['score'] for record in table] for mode, table in tables.items()}
+
+    def _split_modes(self, records) -> dict:
+        """Sort records into per-mode tables of the best self.size."""
+        tables = {}
+        for record in records:
+            tables.setdefault(record.get('mode', DEFAULT_MODE), []).append(record)
+        for mode, table in tables.items():
+            table.sort(key=lambda record: -record['score'])
+            del table[self.size:]
+        return tables
+
+    def _rebuild_tables(self) -> dict:
+        """Best records of each mode from the session log."""
+        records = []
+        try:
+            with open(self._path(SESSION_LOG)) as f:
+                for line in f:
+                    try:
+                        records.append(json.loads(line))
+                    except ValueError:
+                        continue    # torn last line from a crash
+        except OSError:
+            return {}
+        return self._split_modes(record for record in records if _is_record(record))
+
+    # --- Writer thread ---
+
+    def _start_writer(self) -> None:
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._write_loop, name="session-writer", daemon=True)
+            self._thread.start()
+
+    def _write_loop(self) -> None:
+        while True:
+            item = self._queue.get()
+            batch = [item]
+            # Gather whatever else arrives shortly, unless closing
+            deadline = time.monotonic() + self.batch_delay
+            while item is not None:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    item = self._queue.get(timeout=remaining)
+                except queue.Empty:
+                    break
+                batch.append(item)
+
+            closing = batch[-1] is None
+            self._write([entry for entry in batch if entry is not None])
+            if closing:
+                return
+
+    def _write(self, batch: list) -> None:
+        if not batch:
+            return
+        records = [record for record, _ in batch]
+        tables = [table for _, table in batch if table is not None]
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            lines = ''.join(json.dumps(record) + '\n' for record in records)
+            if self._torn_log:
+                lines = '\n' + lines
+            with open(self._path(SESSION_LOG), 'a') as f:
+                f.write(lines)
+            self._torn_log = False
+            if tables:
+                self._replace(HIGHSCORE_FILE, json.dumps(tables[-1], indent=1))
+        except OSError as e:
+            self.errors += 1
+            print(f"[save] write failed: {e}")
+            return
+        self.sessions += len(records)
+
+    def _replace(self, name: str, text: str) -> None:
+        """Write a file atomically."""
+        path = self._path(name)
+        temp = path + ".tmp"
+        with open(temp, 'w') as f:
+            f.write(text)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp, path)
+
+    def _path(self, name: str) -> str:
+        return os.path.join(self.directory, name)
+
+
+def _is_record(record) -> bool:
+    """True for a session record the table can rank."""
+    return (isinstance(record, dict) and isinstance(record.get('score'), (int, float))
+            and not isinstance(record['score'], bool))
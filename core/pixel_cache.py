@@ -0,0 +1,113 @@
+"""
+Pixel Cache - Pre-converted raw pixel buffers on disk, loaded via mmap.
+"""
+
+import hashlib
+import json
+import mmap
+import os
+import struct
+import pygame
+from config import SPRITE_CACHE_DIR
+
+MAGIC = b'SPXC'
+VERSION = 1
+PIXEL_FORMAT = 'BGRA'       # Matches the usual 32-bit display layout
+HEADER = struct.Struct('<4sHI')   # magic, version, metadata length
+ALIGNMENT = 16
+
+
+def hash_sources(paths, extra=None) -> str:
+    """
+    Hash source file contents (and any extra settings that affect the
+    result). Missing files hash as missing, so adding one invalidates too.
+    """
+    digest = hashlib.sha1()
+    for path in paths:
+        digest.update(os.path.basename(path).encode())
+        try:
+            with open(path, 'rb') as f:
+                digest.update(f.read())
+        except OSError:
+            digest.update(b'<missing>')
+    if extra is not None:
+        digest.update(repr(extra).encode())
+    return digest.hexdigest()
+
+
+def _pixel_offset(meta_length: int) -> int:
+    """Pixels start at the first aligned offset after the header and metadata."""
+    end = HEADER.size + meta_length
+    return (end + ALIGNMENT - 1) // ALIGNMENT * ALIGNMENT
+
+
+class PixelCache:
+    """
+    Stores surfaces as raw pixels after a small header (magic, version,
+    JSON metadata with size, format and source hash). Loading maps the
+    file and wraps the pixels with pygame.image.frombuffer, so no decode
+    or copy happens. Entries whose source hash differs are ignored.
+    """
+
+    def __init__(self, directory: str = SPRITE_CACHE_DIR):
+        self.directory = directory
+
+    def load(self, name: str, source_hash: str):
+        """
+        Map a cached surface.
+
+        Returns:
+            (surface, metadata) or None when missing or stale.
+        """
+        path = self._path(name)
+        try:
+            with open(path, 'rb') as f:
+                # Copy-on-write mapping: zero copy, and stray writes never reach the file
+                mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_COPY)
+        except (OSError, ValueError):
+            return None
+
+        try:
+            magic, version, meta_length = HEADER.unpack_from(mapped, 0)
+            if magic != MAGIC or version != VERSION:
+                return None
+            meta = json.loads(mapped[HEADER.size:HEADER.size + meta_length])
+            if meta.get('source_hash') != source_hash or meta.get('format') != PIXEL_FORMAT:
+                return None
+
+            width, height = meta['size']
+            offset = _pixel_offset(meta_length)
+            pixels = memoryview(mapped)[offset:offset + width * height * 4]
+            if len(pixels) != width * height * 4:
+                return None
+        except (struct.error, ValueError, KeyError):
+            return None
+
+        # The surface keeps the memoryview (and so the mapping) alive
+        surface = pygame.image.frombuffer(pixels, (width, height), PIXEL_FORMAT)
+        return surface, meta
+
+    def save(self, name: str, surface: pygame.Surface, source_hash: str, **metadata) -> bool:
+        """Write a surface to the cache atomically. Returns False if the cache is unwritable."""
+        pixels = pygame.image.tobytes(surface, PIXEL_FORMAT)
+        meta = dict(metadata, size=list(surface.get_size()), format=PIXEL_FORMAT,
+                    source_hash=source_hash)
+        meta_bytes = json.dumps(meta).encode()
+        padding = _pixel_offset(len(meta_bytes)) - HEADER.size - len(meta_bytes)
+
+        path = self._path(name)
+        temp_path = path + '.tmp'
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            with open(temp_path, 'wb') as f:
+                f.write(HEADER.pack(MAGIC, VERSION, len(meta_bytes)))
+                f.write(meta_bytes)
+                f.write(b'\0' * padding)
+                f.write(pixels)
+            os.replace(temp_path, path)
+        except OSError:
+            return False
+        return True
+
+    def _path(self, name: str) -> str:
+        return os.path.join(self.directory, name + '.pxc')
@@ -0,0 +1,152 @@
+"""
+Render Pipeline - Draws frame N on a worker thread while frame N+1 is simulated.
+"""
+
+import threading
+
+# Draw command kinds
+FILL = 0
+BLIT = 1
+BLITS = 2
+RECT = 3
+
+
+class DrawList:
+    """
+    A renderer stand-in that records draw calls instead of drawing.
+
+    Everything a call needs is copied into the list (positions, rects,
+    the blit sequence), so the recording stays valid after the game
+    moves on; surfaces are kept by reference, as the game never redraws
+    or changes a surface once it is in use.
+
+    There is no pixel access, so software is False: states draw at full
+    resolution and particles use blits.
+    """
+
+    software = False
+
+    def __init__(self, size: tuple):
+        self.size = size
+        self.commands = []
+
+    def get_size(self) -> tuple:
+        return self.size
+
+    def clear(self) -> None:
+        self.commands.clear()
+
+    def fill(self, color, rect=None) -> None:
+        self.commands.append((FILL, color, None if rect is None else tuple(rect)))
+
+    def blit(self, image, dest, area=None) -> None:
+        self.commands.append((BLIT, image, tuple(dest), None if area is None else tuple(area)))
+
+    def blits(self, sequence) -> None:
+        self.commands.append((BLITS, [(image, tuple(dest)) for image, dest in sequence]))
+
+    def draw_rect(self, color, rect, width: int = 0) -> None:
+        self.commands.append((RECT, color, tuple(rect), width))
+
+    def replay(self, target) -> None:
+        """Draw the recorded calls onto a real renderer."""
+        for command in self.commands:
+            kind = command[0]
+            if kind == BLITS:
+                target.blits(command[1])
+            elif kind == BLIT:
+                target.blit(command[1], command[2], command[3])
+            elif kind == FILL:
+                target.fill(command[1], command[2])
+            else:
+                target.draw_rect(command[1], command[2], command[3])
+
+
+class RenderPipeline:
+    """
+    Overlaps drawing with simulation using two DrawLists.
+
+    Each frame the game thread records the state's render() into the
+    back list and waits for the render thread to finish the previous
+    frame (submit), then presents that frame and hands over the new
+    list (present). The render
+    thread replays it onto the display surface (pygame releases the GIL
+    for blits and fills, so this runs on a second core) while the game
+    thread handles input and updates the next frame. Frames appear one
+    frame later than when drawn serially.
+
+    Presenting stays on the game thread, since SDL window calls belong
+    on the thread that opened the window. Only the software renderer
+    can be drawn from another thread.
+    """
+
+    def __init__(self, renderer):
+        self.renderer = renderer
+        self._lists = (DrawList(renderer.get_size()), DrawList(renderer.get_size()))
+        self._back = 0
+        self._pending = None        # list handed to the render thread
+        self._in_flight = False     # the render thread has a list to draw
+        self._drawn = False         # a finished frame is waiting to be presented
+        self._error = None
+        self._submitted = threading.Event()
+        self._done = threading.Event()
+        self._thread = threading.Thread(target=self._draw_loop, name="render", daemon=True)
+        self._thread.start()
+
+    def submit(self, state) -> None:
+        """Record the state's frame and wait for the previous one to be drawn."""
+        draw_list = self._lists[self._back]
+        draw_list.clear()
+        if state is not None:
+            state.render(draw_list)
+        self._wait()
+
+    def present(self) -> None:
+        """Show the previous frame and start drawing the one submitted."""
+        self._wait()
+        self._show()
+        self._pending = self._lists[self._back]
+        self._back ^= 1
+        self._in_flight = True
+        self._submitted.set()
+
+    def close(self) -> None:
+        """Finish and present the frame in flight, then stop the render thread."""
+        if self._thread is None:
+            return
+        self._wait()
+        self._show()
+        self._pending = None
+        self._submitted.set()
+        self._thread.join()
+        self._thread = None
+
+    def _wait(self) -> None:
+        """Wait for the frame being drawn, if any (re-raising its error)."""
+        if not self._in_flight:
+            return
+        self._done.wait()
+        self._done.clear()
+        self._in_flight = False
+        if self._error is not None:
+            error, self._error = self._error, None
+            raise error
+
+    def _show(self) -> None:
+        if self._drawn:
+            self._drawn = False
+            self.renderer.present()
+
+    def _draw_loop(self) -> None:
+        while True:
+            self._submitted.wait()
+            self._submitted.clear()
+            draw_list = self._pending
+            if draw_list is None:
+                return
+            try:
+                draw_list.replay(self.renderer)
+                self._drawn = True
+            except Exception as e:
+                self._error = e
+            self._done.set()
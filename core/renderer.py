@@ -0,0 +1,195 @@
+"""
+Renderer - Draw targets for the software and texture (GPU) backends.
+"""
+
+import weakref
+import pygame
+
+
+class BlitBatch:
+    """
+    Reusable (surface, position) list for submitting a whole sprite
+    group in one blits call. The [surface, [x, y]] entries persist
+    between frames and are overwritten in place, positions included,
+    so a frame allocates nothing per sprite; camera offsets are applied
+    to plain ints rather than through Rect.move.
+    """
+
+    __slots__ = ('items',)
+
+    def __init__(self):
+        self.items = []
+
+    def fill(self, sprites, offset_x: int, offset_y: int) -> list:
+        """Load sprites at rect position minus the offset; returns the blit sequence."""
+        return self._fill(sprites, offset_x, offset_y, 1.0, None)
+
+    def fill_scaled(self, sprites, offset_x: int, offset_y: int, scale: float, scaled) -> list:
+        """Like fill, with positions scaled and images mapped through scaled()."""
+        return self._fill(sprites, offset_x, offset_y, scale, scaled)
+
+    def _fill(self, sprites, offset_x: int, offset_y: int, scale: float, scaled) -> list:
+        items = self.items
+        size = len(items)
+        count = 0
+        for sprite in sprites:
+            rect = sprite.rect
+            if count < size:
+                pair = items[count]
+            else:
+                pair = [None, [0, 0]]
+                items.append(pair)
+                size += 1
+            position = pair[1]
+            if scaled is None:
+                pair[0] = sprite.image
+                position[0] = rect.x - offset_x
+                position[1] = rect.y - offset_y
+            else:
+                pair[0] = scaled(sprite.image)
+                position[0] = int((rect.x - offset_x) * scale)
+                position[1] = int((rect.y - offset_y) * scale)
+            count += 1
+        del items[count:]
+        return items
+
+
+class SoftwareRenderer:
+    """
+    Draws with Surface.blit onto the display surface.
+    """
+
+    software = True
+
+    def __init__(self, size: tuple, title: str, vsync: bool = False):
+        pygame.display.set_caption(title)
+        self.vsync = False
+        if vsync:
+            # SDL only honours vsync for SCALED (renderer-backed) windows
+            try:
+                self.surface = pygame.display.set_mode(size, pygame.SCALED, vsync=1)
+                is_vsync = getattr(pygame.display, 'is_vsync', None)    # pygame-ce only
+                self.vsync = is_vsync() if is_vsync else True
+            except pygame.error:
+                pass
+        if not self.vsync:
+            self.surface = pygame.display.set_mode(size)
+        # pygame-ce's fblits skips building the list of dirty rects
+        self._fblits = getattr(self.surface, 'fblits', None)
+
+    def get_size(self) -> tuple:
+        return self.surface.get_size()
+
+    def fill(self, color, rect=None) -> None:
+        self.surface.fill(color, rect)
+
+    def blit(self, image: pygame.Surface, dest, area=None) -> None:
+        self.surface.blit(image, dest, area)
+
+    def blits(self, sequence) -> None:
+        """Blit many (surface, dest) pairs in one call."""
+        if self._fblits is not None:
+            self._fblits(sequence)
+        else:
+            self.surface.blits(sequence, doreturn=False)
+
+    def draw_rect(self, color, rect, width: int = 0) -> None:
+        pygame.draw.rect(self.surface, color, rect, width)
+
+    def present(self) -> None:
+        pygame.display.flip()
+
+
+class TextureRenderer:
+    """
+    Draws through pygame._sdl2.video: each surface is uploaded to a
+    Texture the first time it is drawn and reused after that. Atlas
+    frames (subsurfaces) draw from their parent's texture, so the whole
+    sprite atlas is uploaded once. Surfaces drawn here must not
+    change after their first draw.
+
+    With software=True SDL's software renderer is used, which runs on
+    machines without a GPU (and under the dummy video driver).
+
+    Drawing goes to a target texture that is copied to the window on
+    present, so frame contents persist like the display surface does
+    (overlay states such as PauseState rely on that).
+    """
+
+    software = False
+
+    def __init__(self, size: tuple, title: str, software: bool = False, vsync: bool = False):
+        from pygame._sdl2.video import Window, Renderer, Texture
+
+        self._texture_type = Texture
+        self.window = Window(title, size)
+        self.vsync = vsync and not software
+        self.renderer = Renderer(self.window, accelerated=0 if software else 1,
+                                 vsync=self.vsync)
+        self.size = size
+        self._textures = weakref.WeakKeyDictionary()
+
+        self._frame = Texture(self.renderer, size, target=True)
+        self.renderer.target = self._frame
+
+    def get_size(self) -> tuple:
+        return self.size
+
+    def fill(self, color, rect=None) -> None:
+        self.renderer.draw_color = pygame.Color(color)
+        if rect is None:
+            self.renderer.clear()
+        else:
+            self.renderer.fill_rect(rect)
+
+    def blit(self, image: pygame.Surface, dest, area=None) -> None:
+        alpha = image.get_alpha()
+        if area is None:
+            x, y = 0, 0
+            width, height = image.get_size()
+        else:
+            x, y, width, height = area
+
+        # Atlas frames are subsurfaces: draw a source rect of the atlas texture
+        parent = image.get_parent()
+        if parent is not None:
+            texture = self._texture(parent)
+            offset_x, offset_y = image.get_offset()
+            srcrect = (offset_x + x, offset_y + y, width, height)
+        else:
+            texture = self._texture(image)
+            srcrect = None if area is None else (x, y, width, height)
+
+        texture.alpha = 255 if alpha is None else alpha
+        texture.draw(srcrect=srcrect, dstrect=(dest[0], dest[1], width, height))
+
+    def blits(self, sequence) -> None:
+        """Draw many (surface, dest) pairs."""
+        for image, dest in sequence:
+            self.blit(image, dest)
+
+    def draw_rect(self, color, rect, width: int = 0) -> None:
+        self.renderer.draw_color = pygame.Color(color)
+        if width == 0:
+            self.renderer.fill_rect(rect)
+            return
+
+        # Renderer outlines are 1px; inset one per unit of width
+        rect = pygame.Rect(rect)
+        for _ in range(width):
+            self.renderer.draw_rect(rect)
+            rect.inflate_ip(-2, -2)
+
+    def present(self) -> None:
+        self.renderer.target = None
+        self._frame.draw()
+        self.renderer.present()
+        self.renderer.target = self._frame
+
+    def _texture(self, image: pygame.Surface):
+        texture = self._textures.get(image)
+        if texture is None:
+            texture = self._texture_type.from_surface(self.renderer, image)
+            texture.blend_mode = pygame.BLENDMODE_BLEND
+            self._textures[image] = texture
+        return texture
@@ -0,0 +1,82 @@
+"""
+Resolution Scaler - Dynamic world render resolution driven by frame time.
+"""
+
+import weakref
+import pygame
+from config import (
+    FPS, RENDER_SCALE_MIN, RENDER_SCALE_MAX, RENDER_SCALE_STEP,
+    RENDER_SCALE_DOWN_RATIO, RENDER_SCALE_UP_RATIO,
+    RENDER_SCALE_HOLD_FRAMES, RENDER_SCALE_SMOOTHING
+)
+
+
+class ResolutionScaler:
+    """
+    Picks the scale the world is rendered at from recent frame times.
+    Steps down a notch when the smoothed frame time stays above the
+    down threshold and back up when it stays below the (lower) up
+    threshold; each change waits RENDER_SCALE_HOLD_FRAMES frames.
+    Owns the internal render surface and per-scale sprite copies.
+    """
+
+    def __init__(self, size: tuple, frame_budget_ms: float = 1000.0 / FPS,
+                 min_scale: float = RENDER_SCALE_MIN, max_scale: float = RENDER_SCALE_MAX,
+                 step: float = RENDER_SCALE_STEP):
+        self.size = size
+        self.frame_budget_ms = frame_budget_ms
+        self.min_scale = min_scale
+        self.max_scale = max_scale
+        self.step = step
+
+        self.scale = max_scale
+        self.frame_time_avg = 0.0
+        self._frames_since_change = 0
+
+        self._surface = None
+        self._scaled = weakref.WeakKeyDictionary()
+
+    def update(self, frame_time_ms: float) -> float:
+        """Feed the last frame time and return the scale for this frame."""
+        self.frame_time_avg += (frame_time_ms - self.frame_time_avg) * RENDER_SCALE_SMOOTHING
+        self._frames_since_change += 1
+        if self._frames_since_change < RENDER_SCALE_HOLD_FRAMES:
+            return self.scale
+
+        if self.frame_time_avg > self.frame_budget_ms * RENDER_SCALE_DOWN_RATIO:
+            self._set_scale(self.scale - self.step)
+        elif self.frame_time_avg < self.frame_budget_ms * RENDER_SCALE_UP_RATIO:
+            self._set_scale(self.scale + self.step)
+        return self.scale
+
+    def surface(self) -> pygame.Surface:
+        """Internal render surface for the current scale."""
+        if self._surface is None:
+            width = max(1, round(self.size[0] * self.scale))
+            height = max(1, round(self.size[1] * self.scale))
+            self._surface = pygame.Surface((width, height)).convert()
+        return self._surface
+
+    def scaled(self, image: pygame.Surface) -> pygame.Surface:
+        """Copy of image at the current scale, cached per source surface."""
+        scaled = self._scaled.get(image)
+        if scaled is None:
+            width = max(1, round(image.get_width() * self.scale))
+            height = max(1, round(image.get_height() * self.scale))
+            scaled = pygame.transform.scale(image, (width, height))
+            scaled.set_alpha(image.get_alpha())     # (faded invincibility frames)
+            self._scaled[image] = scaled
+        return scaled
+
+    def present(self, screen) -> None:
+        """Scale the internal surface onto a SoftwareRenderer's display in one pass."""
+        pygame.transform.scale(self._surface, screen.get_size(), screen.surface)
+
+    def _set_scale(self, scale: float) -> None:
+        scale = round(max(self.min_scale, min(self.max_scale, scale)), 3)
+        if scale == self.scale:
+            return
+        self.scale = scale
+        self._frames_since_change = 0
+        self._surface = None
+        self._scaled = weakref.WeakKeyDictionary()
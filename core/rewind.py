@@ -0,0 +1,82 @@
+"""
+Rewind - Ring buffer of delta-encoded per-frame snapshots.
+"""
+
+import zlib
+from collections import deque
+from config import FPS, REWIND_SECONDS, REWIND_KEYFRAME_INTERVAL
+
+
+def _xor(data: bytes, base: bytes) -> bytes:
+    """Byte-wise XOR of two equal-length buffers."""
+    return (int.from_bytes(data, 'little') ^ int.from_bytes(base, 'little')).to_bytes(len(data), 'little')
+
+
+class RewindBuffer:
+    """
+    Stores opaque snapshot bytes for the last REWIND_SECONDS of frames.
+
+    Frames are grouped into chunks that start with a keyframe. Later
+    frames in a chunk are XORed against the keyframe and deflated:
+    values that didn't change become zero bytes and compress to almost
+    nothing. A frame whose size differs from the keyframe (entities
+    spawned or died) starts a new chunk. The oldest chunks are dropped
+    once the buffer holds more than the capacity, so memory stays
+    bounded by frame count.
+    """
+
+    def __init__(self, seconds: float = REWIND_SECONDS, keyframe_interval: int = REWIND_KEYFRAME_INTERVAL):
+        self.capacity = int(seconds * FPS)
+        self.keyframe_interval = keyframe_interval
+        # Each chunk is [compressed keyframe, [compressed deltas]]
+        self._chunks = deque()
+        self._frames = 0
+        self._keyframe = None   # Uncompressed keyframe of the newest chunk
+
+    def __len__(self) -> int:
+        return self._frames
+
+    @property
+    def nbytes(self) -> int:
+        """Compressed bytes held (keyframes plus deltas)."""
+        return sum(len(key) + sum(map(len, deltas)) for key, deltas in self._chunks)
+
+    def push(self, snapshot: bytes) -> None:
+        """Record the newest frame."""
+        keyframe = self._newest_keyframe()
+        if (keyframe is None or len(keyframe) != len(snapshot)
+                or len(self._chunks[-1][1]) + 1 >= self.keyframe_interval):
+            self._chunks.append([zlib.compress(snapshot, 1), []])
+            self._keyframe = snapshot
+        else:
+            self._chunks[-1][1].append(zlib.compress(_xor(snapshot, keyframe), 1))
+        self._frames += 1
+
+        # Drop whole chunks from the old end; deltas need their keyframe
+        while self._frames - (len(self._chunks[0][1]) + 1) >= self.capacity:
+            self._frames -= len(self._chunks.popleft()[1]) + 1
+
+    def pop(self):
+        """Remove and return the newest frame, or None when empty."""
+        keyframe = self._newest_keyframe()
+        if keyframe is None:
+            return None
+        deltas = self._chunks[-1][1]
+        self._frames -= 1
+        if deltas:
+            return _xor(zlib.decompress(deltas.pop()), keyframe)
+        self._chunks.pop()
+        self._keyframe = None
+        return keyframe
+
+    def clear(self) -> None:
+        """Forget all frames."""
+        self._chunks.clear()
+        self._frames = 0
+        self._keyframe = None
+
+    def _newest_keyframe(self):
+        """Keyframe the next delta is encoded against (decompressed on demand)."""
+        if self._keyframe is None and self._chunks:
+            self._keyframe = zlib.decompress(self._chunks[-1][0])
+        return self._keyframe
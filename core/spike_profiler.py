@@ -0,0 +1,194 @@
+"""
+Spike Profiler - Detailed captures of frames that blow the budget.
+"""
+
+import gc
+import json
+import os
+import queue
+import sys
+import threading
+import time
+from collections import Counter, deque
+import pygame
+from config import (
+    SPIKE_BUDGET_MS, SPIKE_SAMPLE_INTERVAL_MS, SPIKE_MAX_CAPTURES,
+    SPIKE_CAPTURE_DIR, SPIKE_COOLDOWN, SPIKE_STACK_DEPTH
+)
+
+# Frame times kept for context in each capture
+HISTORY_FRAMES = 120
+# Most common stacks written per capture
+TOP_STACKS = 20
+# Threads sampled besides the main thread (by name)
+SAMPLED_THREADS = ("render",)
+
+
+class SpikeProfiler:
+    """
+    Always-on, low-cost frame watchdog for Game.run.
+
+    Every frame it records per-phase timings and GC pauses (through
+    gc.callbacks), while a daemon thread samples the call stacks of the
+    main thread and the render thread (with --pipelined, drawing the
+    previous frame meanwhile) every SPIKE_SAMPLE_INTERVAL_MS. A sample
+    only keeps code objects and line numbers; they are turned into text
+    for the few frames that get written. Samples are dropped at the
+    start of each frame, so when a frame takes longer than
+    SPIKE_BUDGET_MS the samples cover exactly that frame.
+
+    The capture (stacks, phases, GC events, state stack, entity counts,
+    recent frame times) is handed to the sampling thread, which writes
+    it as JSON to SPIKE_CAPTURE_DIR between samples, keeping only the
+    newest SPIKE_MAX_CAPTURES files. The game thread never waits on
+    the disk.
+    """
+
+    def __init__(self, game, budget_ms: float = SPIKE_BUDGET_MS,
+                 sample_interval_ms: float = SPIKE_SAMPLE_INTERVAL_MS,
+                 directory: str = SPIKE_CAPTURE_DIR, max_captures: int = SPIKE_MAX_CAPTURES):
+        self.game = game
+        self.budget_ms = budget_ms
+        self.sample_interval = sample_interval_ms / 1000.0
+        self.directory = directory
+        self.max_captures = max_captures
+
+        self.frame = 0
+        self.captures = 0
+        self.history = deque(maxlen=HISTORY_FRAMES)
+        self._samples = deque(maxlen=4096)
+        self._gc_events = []
+        self._gc_start = None
+        self._last_capture = float('-inf')
+
+        self._threads = {}          # thread ident -> name, sampled
+        self._writes = queue.Queue()
+        self._thread = None
+
+    def start(self) -> None:
+        """Hook GC and start the sampling (and writing) thread."""
+        gc.callbacks.append(self._on_gc)
+        self._threads = {threading.main_thread().ident: "main"}
+        for thread in threading.enumerate():
+            if thread.name in SAMPLED_THREADS:
+                self._threads[thread.ident] = thread.name
+        self._thread = threading.Thread(target=self._run, name="spike-profiler", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Unhook GC, write queued captures and stop the thread."""
+        if self._on_gc in gc.callbacks:
+            gc.callbacks.remove(self._on_gc)
+        if self._thread is not None:
+            self._writes.put(None)
+            self._thread.join()
+            self._thread = None
+
+    def begin_frame(self) -> None:
+        """Forget the previous frame's samples and GC events."""
+        self._samples.clear()
+        self._gc_events = []
+
+    def end_frame(self, frame_ms: float, phases: dict) -> None:
+        """Record the frame and write a capture if it went over budget."""
+        self.frame += 1
+        self.history.append(round(frame_ms, 3))
+        if frame_ms <= self.budget_ms:
+            return
+
+        # One capture per SPIKE_COOLDOWN so a bad patch doesn't flood the disk
+        now = time.monotonic()
+        if now - self._last_capture < SPIKE_COOLDOWN:
+            return
+        self._last_capture = now
+        self._writes.put((self._capture(frame_ms, phases), list(self._samples)))
+
+    def _capture(self, frame_ms: float, phases: dict) -> dict:
+        """Everything but the stacks, which the writer adds from the samples."""
+        state = self.game.current_state()
+        entities = {}
+        if state is not None:
+            entities = {
+                name: len(value) for name, value in vars(state).items()
+                if isinstance(value, pygame.sprite.AbstractGroup)
+            }
+
+        return {
+            'time': time.strftime('%Y-%m-%dT%H:%M:%S'),
+            'frame': self.frame,
+            'frame_ms': round(frame_ms, 3),
+            'budget_ms': self.budget_ms,
+            'phases_ms': {name: round(ms, 3) for name, ms in phases.items()},
+            'gc': self._gc_events,
+            'states': [type(s).__name__ for s in self.game.state_stack],
+            'entities': entities,
+            'sample_interval_ms': self.sample_interval * 1000.0,
+            'recent_frames_ms': list(self.history),
+        }
+
+    # --- Profiler thread ---
+
+    def _run(self) -> None:
+        """Sample every interval; write captures as they arrive."""
+        timeout = self.sample_interval if self.sample_interval > 0 else None
+        while True:
+            if timeout is not None:
+                self._sample()
+            try:
+                item = self._writes.get(timeout=timeout)
+            except queue.Empty:
+                continue
+            if item is None:
+                return
+            self._write(*item)
+
+    def _sample(self) -> None:
+        """Record each watched thread's stack as (code, line) pairs, innermost first."""
+        frames = sys._current_frames()
+        for ident, name in self._threads.items():
+            frame = frames.get(ident)
+            stack = []
+            while frame is not None and len(stack) < SPIKE_STACK_DEPTH:
+                stack.append((frame.f_code, frame.f_lineno))
+                frame = frame.f_back
+            if stack:
+                self._samples.append((name, tuple(stack)))
+        del frames, frame
+
+    def _write(self, capture: dict, samples: list) -> None:
+        """Add the stacks, write a capture and delete the oldest beyond max_captures."""
+        stacks = Counter(samples)
+        capture['samples'] = len(samples)
+        capture['stacks'] = [
+            {'thread': name, 'samples': count, 'stack': [
+                f"{os.path.basename(code.co_filename)}:{line} {code.co_name}"
+                for code, line in reversed(stack)
+            ]}
+            for (name, stack), count in stacks.most_common(TOP_STACKS)
+        ]
+
+        name = f"spike-{time.strftime('%Y%m%d-%H%M%S')}-{capture['frame']:08d}.json"
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            with open(os.path.join(self.directory, name), 'w') as f:
+                json.dump(capture, f, indent=1)
+
+            files = sorted(f for f in os.listdir(self.directory)
+                           if f.startswith('spike-') and f.endswith('.json'))
+            for old in files[:-self.max_captures]:
+                os.remove(os.path.join(self.directory, old))
+        except OSError:
+            return
+        self.captures += 1
+
+    def _on_gc(self, phase: str, info: dict) -> None:
+        if phase == 'start':
+            self._gc_start = time.perf_counter()
+        elif self._gc_start is not None:
+            self._gc_events.append({
+                'generation': info['generation'],
+                'collected': info['collected'],
+                'uncollectable': info['uncollectable'],
+                'ms': round((time.perf_counter() - self._gc_start) * 1000.0, 3),
+            })
+            self._gc_start = None
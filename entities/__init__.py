@@ -4,3 +4,4 @@ from .player import Player
 from .bullet import Bullet
 from .enemy import FlyingEnemy
 from .platform import Platform
+from .entity_store import EntityStore, EntityView
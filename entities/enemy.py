@@ -2,71 +2,89 @@
 Enemy - Flying enemy that tracks toward the player.
 """
 
-import os
-import pygame
 from config import (
-    ENEMY_SPEED, ENEMY_HEALTH, ENEMY_DAMAGE, ASSETS_DIR
+    ENEMY_SPEED, ENEMY_HEALTH, ENEMY_DAMAGE, FLOCK_SEPARATION_RADIUS,
+    FLOCK_SEPARATION_WEIGHT, FLOCK_ALIGNMENT_WEIGHT
 )
-from core.event_manager import EventManager, GameEvent
+from core.assets import sprite_cache
+from core.event_manager import GameEvent
+from .entity_store import EntityStore, EntityView
 
 
-class FlyingEnemy(pygame.sprite.Sprite):
+class FlyingEnemy(EntityView):
     """
     Flying enemy that moves toward the player.
+    Only steers (sets velocity) and animates; movement and damage are
+    applied in bulk by the systems that own the EntityStore.
+
+    Steering is boids-style: the heading toward the player (along the
+    shared flow field when one is given), plus separation from
+    neighbors that are too close and alignment with the average
+    neighbor velocity, so a crowd spreads out instead of
+    collapsing into one blob.
+
+    The player it chases is a row in the store (an index into
+    store.targets) and deaths are reported to store.events, so an enemy
+    holds no references of its own.
     """
 
-    def __init__(self, x: int, y: int, player, event_manager: EventManager):
+    speed = ENEMY_SPEED
+    damage = ENEMY_DAMAGE
+    animation_speed = 0.15
+
+    # Sprite ids indexed by [facing_right][frame]; frame 0 is idle, 1 is fly.
+    # Looked up once, on the first spawn.
+    frames = None
+
+    def __init__(self, x: int, y: int, store: EntityStore, target: int = 0):
         """
         Args:
             x, y: Starting position
-            player: Reference to player (for tracking)
-            event_manager: For emitting death events
+            store: Component storage for this enemy's state
+            target: Index of the player to chase in store.targets
         """
-        super().__init__()
+        frames = FlyingEnemy.frames
+        if frames is None:
+            frames = FlyingEnemy.frames = tuple(
+                tuple(sprite_cache.sprite_id(name, flipped=not facing_right)
+                      for name in ('enemy', 'enemy_fly'))
+                for facing_right in (False, True)
+            )
 
-        # Load sprites
-        self.sprites = {
-            'idle': self._load_sprite('enemy.png'),
-            'fly': self._load_sprite('enemy_fly.png'),
-        }
+        super().__init__(store, x, y, 40, 40, health=ENEMY_HEALTH, sprite_id=frames[1][0],
+                         target=target)
 
         # Animation
         self.animation_timer = 0
-        self.animation_speed = 0.15
+        self.animation_frame = 0
 
-        self.image = self.sprites['idle']
-        self.rect = self.image.get_rect(center=(x, y))
+        self.facing_right = False
 
-        self.player = player
-        self.event_manager = event_manager
+        # Set by AIScheduler: round-robin slot and time since the last tick
+        self.ai_slot = None
+        self.ai_elapsed = 0.0
 
-        self.speed = ENEMY_SPEED
-        self.health = ENEMY_HEALTH
-        self.damage = ENEMY_DAMAGE
+    def update(self, dt: float, neighbors=(), field=None) -> None:
+        """
+        Steer toward the player.
 
-        self.velocity = pygame.math.Vector2(0, 0)
-        self.facing_right = False
+        Args:
+            dt: Time since the last steering update
+            neighbors: (enemy, x, y) entries near this one (see SpatialGrid.query)
+            field: FlowField to follow around platforms (None flies straight)
+        """
+        store = self.store
+        i = self._index
 
-    def _load_sprite(self, filename: str) -> pygame.Surface:
-        """Load a sprite image and scale it appropriately."""
-        path = os.path.join(ASSETS_DIR, filename)
-        try:
-            image = pygame.image.load(path).convert_alpha()
-            return pygame.transform.scale(image, (40, 40))
-        except pygame.error:
-            # Fallback to colored rectangle
-            surface = pygame.Surface((40, 40))
-            surface.fill((200, 50, 50))
-            return surface
-
-    def update(self, dt: float) -> None:
-        """Move toward the player."""
-        if not self.player or not self.player.alive():
+        player = store.targets[store.target[i]] if store.targets else None
+        if player is None or not player.alive():
+            store.vel_x[i] = 0.0
+            store.vel_y[i] = 0.0
             return
 
         # Calculate direction to player
-        dx = self.player.rect.centerx - self.rect.centerx
-        dy = self.player.rect.centery - self.rect.centery
+        dx = player.rect.centerx - store.pos_x[i]
+        dy = player.rect.centery - store.pos_y[i]
 
         # Normalize direction
         distance = (dx ** 2 + dy ** 2) ** 0.5
@@ -74,35 +92,84 @@ class FlyingEnemy(pygame.sprite.Sprite):
             dx /= distance
             dy /= distance
 
-        # Move toward player
-        self.rect.x += dx * self.speed * dt
-        self.rect.y += dy * self.speed * dt
+        # Route around platforms until close, then go straight in
+        if field is not None:
+            flow = field.sample(store.pos_x[i], store.pos_y[i])
+            if flow is not None:
+                dx, dy = flow
+
+        steer_x, steer_y = dx, dy
+        if neighbors:
+            steer_x, steer_y = self._flock(steer_x, steer_y, neighbors)
+
+        # Velocity along the steering direction; MovementSystem integrates it
+        length = (steer_x ** 2 + steer_y ** 2) ** 0.5
+        if length > 0:
+            store.vel_x[i] = steer_x / length * self.speed
+            store.vel_y[i] = steer_y / length * self.speed
+        else:
+            store.vel_x[i] = 0.0
+            store.vel_y[i] = 0.0
 
         # Track facing direction
         self.facing_right = dx > 0
 
-        # Animate
+        # Animate: toggle between idle and fly
         self.animation_timer += dt
         if self.animation_timer >= self.animation_speed:
             self.animation_timer = 0
-            # Toggle between idle and fly
-            if self.image == self.sprites['idle']:
-                sprite = self.sprites['fly']
+            self.animation_frame ^= 1
+        store.sprite_id[i] = self.frames[self.facing_right][self.animation_frame]
+
+    def _flock(self, steer_x: float, steer_y: float, neighbors) -> tuple:
+        """Add separation and alignment to a unit steering direction."""
+        store = self.store
+        i = self._index
+        x = store.pos_x[i]
+        y = store.pos_y[i]
+        vel_x, vel_y = store.vel_x, store.vel_y
+
+        push_x = push_y = 0.0
+        align_x = align_y = 0.0
+        count = 0
+        for other, ox, oy in neighbors:
+            if other is self:
+                continue
+            j = other._index
+            align_x += vel_x[j]
+            align_y += vel_y[j]
+            count += 1
+
+            # Push away harder the deeper the overlap
+            rx = x - ox
+            ry = y - oy
+            distance = (rx * rx + ry * ry) ** 0.5
+            if distance >= FLOCK_SEPARATION_RADIUS:
+                continue
+            if distance > 0:
+                strength = (1.0 - distance / FLOCK_SEPARATION_RADIUS) / distance
+                push_x += rx * strength
+                push_y += ry * strength
             else:
-                sprite = self.sprites['idle']
+                # Exactly stacked: split them apart by store order
+                push_x += 1.0 if i > j else -1.0
 
-            # Flip based on direction
-            if self.facing_right:
-                self.image = sprite
-            else:
-                self.image = pygame.transform.flip(sprite, True, False)
+        if count:
+            scale = FLOCK_ALIGNMENT_WEIGHT / (count * self.speed)
+            steer_x += align_x * scale
+            steer_y += align_y * scale
+        steer_x += push_x * FLOCK_SEPARATION_WEIGHT
+        steer_y += push_y * FLOCK_SEPARATION_WEIGHT
+        return steer_x, steer_y
 
     def take_damage(self, amount: int) -> None:
-        """Take damage and check for death."""
-        self.health -= amount
+        """Take damage; DamageSystem handles death."""
+        self.store.health[self._index] -= amount
 
-        if self.health <= 0:
-            self.event_manager.emit(GameEvent.ENEMY_KILLED, {
+    def on_depleted(self) -> None:
+        """Emit the death event and release the entity."""
+        if self.store.events is not None:
+            self.store.events.emit(GameEvent.ENEMY_KILLED, {
                 'position': self.rect.center
             })
-            self.kill()
+        self.kill()
@@ -0,0 +1,135 @@
+"""
+Entity Store - Array-backed components for short-lived entities.
+"""
+
+from array import array
+import pygame
+from core.assets import sprite_cache
+
+
+class EntityStore:
+    """
+    Dense component arrays (position, velocity, health, lifetime, sprite
+    id, target). Each live entity owns one row; rows are kept packed by
+    swap-removal so systems can iterate over range(len(store)) in bulk.
+
+    What the rows share is held once here rather than on every view:
+    the players they can chase (a row's target indexes into targets)
+    and the event manager their deaths are reported to.
+    """
+
+    __slots__ = ('pos_x', 'pos_y', 'vel_x', 'vel_y', 'health', 'lifetime',
+                 'sprite_id', 'target', 'views', 'targets', 'events')
+
+    def __init__(self, targets: list = None, events=None):
+        self.pos_x = array('d')
+        self.pos_y = array('d')
+        self.vel_x = array('d')
+        self.vel_y = array('d')
+        self.health = array('d')
+        self.lifetime = array('d')
+        self.sprite_id = array('i')
+        self.target = array('i')
+        self.views = []
+        self.targets = targets if targets is not None else []
+        self.events = events
+
+    def __len__(self) -> int:
+        return len(self.views)
+
+    def add(self, view, x: float, y: float, vx: float = 0.0, vy: float = 0.0,
+            health: float = 1.0, lifetime: float = float('inf'), sprite_id: int = 0,
+            target: int = 0) -> int:
+        """Append a row for view and return its index."""
+        self.pos_x.append(x)
+        self.pos_y.append(y)
+        self.vel_x.append(vx)
+        self.vel_y.append(vy)
+        self.health.append(health)
+        self.lifetime.append(lifetime)
+        self.sprite_id.append(sprite_id)
+        self.target.append(target)
+        self.views.append(view)
+        return len(self.views) - 1
+
+    def remove(self, index: int) -> None:
+        """Remove a row by moving the last row into its place."""
+        last = len(self.views) - 1
+        if index != last:
+            for column in (self.pos_x, self.pos_y, self.vel_x, self.vel_y,
+                           self.health, self.lifetime, self.sprite_id, self.target):
+                column[index] = column[last]
+            moved = self.views[last]
+            self.views[index] = moved
+            moved._index = index
+
+        for column in (self.pos_x, self.pos_y, self.vel_x, self.vel_y,
+                       self.health, self.lifetime, self.sprite_id, self.target):
+            column.pop()
+        self.views.pop()
+
+    def clear(self) -> None:
+        """Remove every row."""
+        for view in list(self.views):
+            view.kill()
+
+
+class EntityView(pygame.sprite.Sprite):
+    """
+    Thin sprite whose state lives in an EntityStore row.
+    Keeps a rect for group collision and rendering; the movement
+    system writes it back from the store after each step.
+
+    A view is only valid while it has a row: after kill() the row
+    belongs to another entity (or to nobody), so the store-backed
+    properties raise TypeError on a stale view. Check alive() first
+    when a view may have been killed.
+    """
+
+    def __init__(self, store: EntityStore, x: float, y: float, width: int, height: int, **components):
+        super().__init__()
+        self.store = store
+        self.rect = pygame.Rect(0, 0, width, height)
+        self.rect.center = (int(x), int(y))
+        self._index = store.add(self, x, y, **components)
+
+    @property
+    def image(self) -> pygame.Surface:
+        return sprite_cache.surface(self.store.sprite_id[self._index])
+
+    @property
+    def mask(self) -> pygame.mask.Mask:
+        """Collision mask of the current frame (used by collide_mask)."""
+        return sprite_cache.mask(self.store.sprite_id[self._index])
+
+    @property
+    def opaque_rect(self) -> pygame.Rect:
+        """Opaque part of the current frame, relative to the rect's top-left."""
+        return sprite_cache.opaque_rect(self.store.sprite_id[self._index])
+
+    @property
+    def position(self) -> tuple:
+        return (self.store.pos_x[self._index], self.store.pos_y[self._index])
+
+    @property
+    def velocity(self) -> tuple:
+        return (self.store.vel_x[self._index], self.store.vel_y[self._index])
+
+    @property
+    def health(self) -> float:
+        return self.store.health[self._index]
+
+    @property
+    def lifetime(self) -> float:
+        return self.store.lifetime[self._index]
+
+    def on_depleted(self) -> None:
+        """Called by the damage system when health reaches zero."""
+        self.kill()
+
+    def kill(self) -> None:
+        """Remove from all groups and release the store row (the view is invalid after)."""
+        super().kill()
+        if self._index is not None:
+            self.store.remove(self._index)
+            self._index = None
@@ -2,24 +2,25 @@
 Platform - Static solid surfaces for the player to stand on.
 """
 
-import os
 import pygame
-from config import PLATFORM_COLOR, ASSETS_DIR
+from core.assets import sprite_cache
 
 
 class Platform(pygame.sprite.Sprite):
     """
     Static platform that player and enemies can stand on.
-    Uses tiled sprites for visual appearance.
+    Uses tiled sprites from the atlas for visual appearance; with edges
+    off every tile is a middle tile, for pieces that continue into a
+    neighboring platform.
     """
 
-    def __init__(self, x: int, y: int, width: int, height: int, color=PLATFORM_COLOR):
+    def __init__(self, x: int, y: int, width: int, height: int, edges: bool = True):
         super().__init__()
 
-        # Load tile sprites
-        self.tile_left = self._load_sprite('platform_left.png')
-        self.tile_mid = self._load_sprite('platform_mid.png')
-        self.tile_right = self._load_sprite('platform_right.png')
+        # Tile sprites (shared atlas frames)
+        self.tile_left = sprite_cache.frame('platform_left')
+        self.tile_mid = sprite_cache.frame('platform_mid')
+        self.tile_right = sprite_cache.frame('platform_right')
 
         # Get tile dimensions
         tile_width = self.tile_mid.get_width()
@@ -32,8 +33,9 @@ class Platform(pygame.sprite.Sprite):
         self.image = pygame.Surface((num_tiles * tile_width, tile_height), pygame.SRCALPHA)
 
         # Tile the platform
-        if num_tiles == 1:
-            self.image.blit(self.tile_mid, (0, 0))
+        if num_tiles == 1 or not edges:
+            for i in range(num_tiles):
+                self.image.blit(self.tile_mid, (i * tile_width, 0))
         elif num_tiles == 2:
             self.image.blit(self.tile_left, (0, 0))
             self.image.blit(self.tile_right, (tile_width, 0))
@@ -48,18 +50,6 @@ class Platform(pygame.sprite.Sprite):
 
         self.rect = self.image.get_rect(topleft=(x, y))
 
-    def _load_sprite(self, filename: str) -> pygame.Surface:
-        """Load a sprite image."""
-        path = os.path.join(ASSETS_DIR, filename)
-        try:
-            image = pygame.image.load(path).convert_alpha()
-            return pygame.transform.scale(image, (70, 70))
-        except pygame.error:
-            # Fallback to colored rectangle
-            surface = pygame.Surface((70, 70))
-            surface.fill(PLATFORM_COLOR)
-            return surface
-
     def update(self, dt: float) -> None:
         """Platforms are static - no update needed."""
         pass
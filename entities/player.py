@@ -2,16 +2,19 @@
 Player - Main player character with movement, jumping, and shooting.
 """
 
-import os
 import pygame
 from config import (
     PLAYER_SPEED, JUMP_VELOCITY, GRAVITY, TERMINAL_VELOCITY,
     PLAYER_MAX_HEALTH, PLAYER_INVINCIBILITY_TIME,
-    SHOOT_COOLDOWN, LEVEL_WIDTH, ASSETS_DIR
+    SHOOT_COOLDOWN, MAX_LIVE_BULLETS, LEVEL_WIDTH
 )
+from core.assets import sprite_cache
 from core.event_manager import EventManager, GameEvent
 from .bullet import Bullet
 
+# Alpha of the faded frames shown while invincible
+FLASH_ALPHA = 100
+
 
 class Player(pygame.sprite.Sprite):
     """
@@ -21,24 +24,42 @@ class Player(pygame.sprite.Sprite):
     def __init__(self, x: int, y: int, event_manager: EventManager):
         super().__init__()
 
-        # Load sprites
+        # Direction
+        self.facing_right = True
+
+        # Atlas frames, each as (facing left, facing right)
         self.sprites = {
-            'stand': self._load_sprite('player_stand.png'),
-            'jump': self._load_sprite('player_jump.png'),
+            'stand': self._frames('player_stand'),
+            'jump': self._frames('player_jump'),
             'walk': [
-                self._load_sprite('player_walk1.png'),
-                self._load_sprite('player_walk2.png'),
+                self._frames('player_walk1'),
+                self._frames('player_walk2'),
             ]
         }
 
+        # Every frame in a fixed order (snapshots store the index), and a
+        # half-transparent copy of each for the invincibility flash (the
+        # atlas frames are shared, so their alpha is left alone)
+        self.frames = [frame for pair in (self.sprites['stand'], self.sprites['jump'],
+                                          *self.sprites['walk'])
+                       for frame in pair]
+        self.faded = {}
+        for frame in self.frames:
+            faded = frame.copy()
+            faded.set_alpha(FLASH_ALPHA)
+            self.faded[frame] = faded
+
         # Animation
         self.animation_timer = 0
         self.animation_frame = 0
         self.animation_speed = 0.1  # seconds per frame
 
-        # Set initial image
-        self.image = self.sprites['stand']
+        # Set initial image (frame is the atlas frame, image what is drawn)
+        self.frame = self.sprites['stand'][self.facing_right]
+        self.image = self.frame
         self.rect = self.image.get_rect(topleft=(x, y))
+        self.prev_rect = self.rect.copy()  # Start of step, for swept collision
+        self.level_width = LEVEL_WIDTH     # right bound (endless mode lifts it)
 
         self.event_manager = event_manager
 
@@ -46,9 +67,6 @@ class Player(pygame.sprite.Sprite):
         self.velocity = pygame.math.Vector2(0, 0)
         self.on_ground = False
 
-        # Direction
-        self.facing_right = True
-
         # Health
         self.max_health = PLAYER_MAX_HEALTH
         self.health = self.max_health
@@ -58,53 +76,74 @@ class Player(pygame.sprite.Sprite):
         # Shooting
         self.shoot_cooldown = 0
         self.bullet_group = None  # Set by PlayingState
+        self.entity_store = None  # Set by PlayingState
+
+    def reset(self, x: int, y: int) -> None:
+        """Restore the starting state at a new position (fast restart)."""
+        self.facing_right = True
+        self.animation_timer = 0
+        self.animation_frame = 0
+        self.frame = self.sprites['stand'][self.facing_right]
+        self.image = self.frame
+        self.rect.topleft = (x, y)
+        self.prev_rect = self.rect.copy()
 
-    def _load_sprite(self, filename: str) -> pygame.Surface:
-        """Load a sprite image and scale it appropriately."""
-        path = os.path.join(ASSETS_DIR, filename)
-        try:
-            image = pygame.image.load(path).convert_alpha()
-            # Scale to reasonable size (original Kenney sprites are 70x70ish)
-            return pygame.transform.scale(image, (48, 48))
-        except pygame.error:
-            # Fallback to colored rectangle
-            surface = pygame.Surface((48, 48))
-            surface.fill((0, 200, 100))
-            return surface
-
-    def handle_input(self, keys) -> None:
-        """Process keyboard input for movement."""
+        self.velocity.update(0, 0)
+        self.on_ground = False
+        self.health = self.max_health
+        self.invincible = False
+        self.invincible_timer = 0
+        self.shoot_cooldown = 0
+
+    def _frames(self, name: str) -> tuple:
+        """Get a frame's (flipped, unflipped) atlas surfaces."""
+        return (sprite_cache.frame(name, flipped=True), sprite_cache.frame(name))
+
+    @property
+    def mask(self) -> pygame.mask.Mask:
+        """Collision mask of the current frame (used by collide_mask)."""
+        return sprite_cache.mask_of(self.frame)
+
+    def apply_input(self, left: bool, right: bool, jump: bool) -> bool:
+        """Apply movement input (from actions or the network). Returns True if it jumped."""
         # Horizontal movement
         self.velocity.x = 0
 
-        if keys[pygame.K_LEFT] or keys[pygame.K_a]:
+        if left:
             self.velocity.x = -PLAYER_SPEED
             self.facing_right = False
 
-        if keys[pygame.K_RIGHT] or keys[pygame.K_d]:
+        if right:
             self.velocity.x = PLAYER_SPEED
             self.facing_right = True
 
         # Jumping
-        if (keys[pygame.K_SPACE] or keys[pygame.K_w]) and self.on_ground:
+        if jump and self.on_ground:
             self.velocity.y = JUMP_VELOCITY
             self.on_ground = False
+            return True
+        return False
 
-    def shoot(self) -> None:
-        """Fire a bullet if cooldown allows."""
-        if self.shoot_cooldown > 0 or self.bullet_group is None:
-            return
+    def shoot(self) -> bool:
+        """Fire a bullet if cooldown allows. Returns True if it fired."""
+        if self.shoot_cooldown > 0 or self.bullet_group is None or self.entity_store is None:
+            return False
+
+        # Hard bullet budget
+        if len(self.bullet_group) >= MAX_LIVE_BULLETS:
+            return False
 
         # Spawn bullet at gun position
         direction = 1 if self.facing_right else -1
         bullet_x = self.rect.right if self.facing_right else self.rect.left
         bullet_y = self.rect.centery
 
-        bullet = Bullet(bullet_x, bullet_y, direction)
+        bullet = Bullet(bullet_x, bullet_y, direction, self.entity_store)
         self.bullet_group.add(bullet)
 
         self.shoot_cooldown = SHOOT_COOLDOWN
         self.event_manager.emit(GameEvent.BULLET_FIRED)
+        return True
 
     def take_damage(self, amount: int) -> None:
         """Take damage if not invincible."""
@@ -136,11 +175,8 @@ class Player(pygame.sprite.Sprite):
         else:
             sprite = self.sprites['stand']
 
-        # Flip sprite based on direction
-        if self.facing_right:
-            self.image = sprite
-        else:
-            self.image = pygame.transform.flip(sprite, True, False)
+        # Pick the pre-flipped frame for the facing direction
+        self.frame = sprite[self.facing_right]
 
     def update(self, dt: float) -> None:
         """Update player physics and timers."""
@@ -150,14 +186,15 @@ class Player(pygame.sprite.Sprite):
             self.velocity.y = TERMINAL_VELOCITY
 
         # Apply velocity
+        self.prev_rect.topleft = self.rect.topleft
         self.rect.x += self.velocity.x * dt
         self.rect.y += self.velocity.y * dt
 
         # Keep player in level bounds
         if self.rect.left < 0:
             self.rect.left = 0
-        if self.rect.right > LEVEL_WIDTH:
-            self.rect.right = LEVEL_WIDTH
+        if self.rect.right > self.level_width:
+            self.rect.right = self.level_width
 
         # Update shoot cooldown
         if self.shoot_cooldown > 0:
@@ -172,10 +209,16 @@ class Player(pygame.sprite.Sprite):
             if self.invincible_timer <= 0:
                 self.invincible = False
 
-            # Flash effect - toggle visibility
-            if int(self.invincible_timer * 10) % 2 == 0:
-                self.image.set_alpha(100)
-            else:
-                self.image.set_alpha(255)
+        self._update_image()
+
+    def set_frame(self, index: int) -> None:
+        """Show frame `index` of self.frames (restoring a snapshot)."""
+        self.frame = self.frames[index]
+        self._update_image()
+
+    def _update_image(self) -> None:
+        """Flash effect - alternate between the frame and its faded copy."""
+        if self.invincible and int(self.invincible_timer * 10) % 2 == 0:
+            self.image = self.faded[self.frame]
         else:
-            self.image.set_alpha(255)
+            self.image = self.frame
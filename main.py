@@ -8,22 +8,88 @@ Controls:
     F - Shoot
     ESC - Pause
     ENTER - Start/Select
+    E - Endless mode (menu)
+
+Options:
+    --soak HOURS - Run headless for HOURS simulated hours and check for leaks
+    --renderer texture - Draw with GPU textures (pygame._sdl2.video)
+    --sdl-software - Use SDL's software renderer for the texture backend
+    --pipelined - Draw on a render thread while the next frame updates (software renderer)
+    --pacing sleep|busy|hybrid|vsync - Frame pacing strategy (--pacing-stats prints jitter)
+    --coop HOST:PORT --player 1|2 - Two-player co-op with the peer at HOST:PORT
 """
 
-from core.game import Game
-from states.menu_state import MenuState
+import argparse
+import os
+import sys
+from config import RENDERER, RENDERER_SDL_SOFTWARE, RENDER_PIPELINED, NET_PORT, FRAME_PACING
+
+
+def parse_args():
+    """Parse command line options."""
+    parser = argparse.ArgumentParser(description="Side-Scrolling Shooter")
+    parser.add_argument("--soak", type=float, metavar="HOURS",
+                        help="run headless for HOURS simulated hours and report memory growth")
+    parser.add_argument("--renderer", choices=("software", "texture"), default=RENDERER,
+                        help="drawing backend (default: %(default)s)")
+    parser.add_argument("--sdl-software", action="store_true", default=RENDERER_SDL_SOFTWARE,
+                        help="run the texture backend on SDL's software renderer (no GPU)")
+    parser.add_argument("--pipelined", action="store_true", default=RENDER_PIPELINED,
+                        help="draw each frame on a render thread while the next one updates")
+    parser.add_argument("--pacing", choices=("sleep", "busy", "hybrid", "vsync"), default=FRAME_PACING,
+                        help="frame pacing strategy (default: %(default)s)")
+    parser.add_argument("--pacing-stats", action="store_true",
+                        help="print frame interval and jitter statistics on exit")
+    parser.add_argument("--coop", metavar="HOST:PORT",
+                        help="play two-player co-op with the peer listening at HOST:PORT")
+    parser.add_argument("--player", type=int, choices=(1, 2), default=1,
+                        help="which co-op player this machine controls (default: %(default)s)")
+    parser.add_argument("--port", type=int, default=NET_PORT,
+                        help="local UDP port for co-op (default: %(default)s)")
+    parser.add_argument("--net-latency", type=float, default=0.0, metavar="MS",
+                        help="simulate extra one-way latency for co-op testing")
+    parser.add_argument("--net-loss", type=float, default=0.0, metavar="FRACTION",
+                        help="simulate packet loss for co-op testing")
+    return parser.parse_args()
 
 
 def main():
     """Initialize and run the game."""
-    game = Game()
+    args = parse_args()
+
+    if args.soak:
+        # Headless: no window or audio device needed
+        os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+        os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+    from core.game import Game
+    from states.menu_state import MenuState
+
+    game = Game(args.renderer, args.sdl_software, args.pacing, args.pipelined)
 
     # Start at menu
     initial_state = MenuState(game)
     game.push_state(initial_state)
 
+    if args.soak:
+        from core.soak import SoakRunner
+        from states.playing_state import PlayingState
+        game.change_state(PlayingState.start(game))
+        passed = SoakRunner(game, args.soak).run()
+        sys.exit(0 if passed else 1)
+
+    if args.coop:
+        from core.netplay import UdpTransport
+        from states.coop_state import CoopState
+        host, port = args.coop.rsplit(":", 1)
+        transport = UdpTransport(args.port, (host, int(port)),
+                                 latency_ms=args.net_latency, loss=args.net_loss)
+        game.change_state(CoopState(game, transport, args.player - 1))
+
     # Run game loop
     game.run()
+    if args.pacing_stats:
+        print(game.pacer.report())
 
 
 if __name__ == "__main__":
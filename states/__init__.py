@@ -1,6 +1,8 @@
-"""States module - game states (menu, playing, pause, game over)."""
+"""States module - game states (menu, playing, endless, pause, game over)."""
 
 from .menu_state import MenuState
 from .playing_state import PlayingState
+from .endless_state import EndlessState
+from .coop_state import CoopState
 from .pause_state import PauseState
 from .game_over_state import GameOverState
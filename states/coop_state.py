@@ -0,0 +1,159 @@
+"""
+Co-op State - Two-player gameplay synced over UDP with rollback.
+"""
+
+import zlib
+from config import SCREEN_WIDTH, SCREEN_HEIGHT, LEVEL_WIDTH, SPAWN_MARGIN, FPS, NET_SEED
+from core.netplay import (
+    RollbackSession, input_bits, INPUT_LEFT, INPUT_RIGHT, INPUT_JUMP, INPUT_SHOOT
+)
+from entities.enemy import FlyingEnemy
+from .playing_state import PlayingState
+
+# Every peer steps the simulation with the same fixed dt
+STEP_DT = 1.0 / FPS
+
+
+class CoopState(PlayingState):
+    """
+    PlayingState for two players, one per machine. Both peers run the
+    whole simulation and exchange only inputs through a RollbackSession.
+
+    Everything that feeds the simulation is deterministic: a fixed step,
+    a shared seed, spawning and bullet cleanup based on the players
+    rather than the local camera, and no frame-time spawn throttling.
+    The camera, HUD and particles follow the local player and stay
+    outside the rolled-back state.
+    """
+
+    mode = "coop"
+
+    def __init__(self, game, transport, local_index: int, seed: int = NET_SEED):
+        """
+        Args:
+            game: Game instance
+            transport: UdpTransport connected to the other peer
+            local_index: 0 or 1, which player this machine controls
+            seed: Gameplay seed (must match on both peers)
+        """
+        super().__init__(game)
+        self._add_player(160, SCREEN_HEIGHT - 140)
+        self.rng.seed(seed)
+        # Rebuild the flow field in one go so it only depends on player cells
+        self.flow_field.cells_per_frame = None
+
+        # View follows the local player
+        self.player = self.players[local_index]
+        self.hud.player = self.player
+        self.particles.player = self.player
+
+        self.transport = transport
+        self.session = RollbackSession(self, transport, local_index)
+        self.frame = 0              # simulated frames (rolled back with the rest)
+        self.death_frame = None
+        self._desync_reported = False
+
+    def exit(self) -> None:
+        """Called when state is deactivated."""
+        super().exit()
+        self.transport.close()
+
+    def update(self, dt: float) -> None:
+        """Exchange inputs and advance the synced simulation by one step."""
+        self.session_time += dt
+        self.session.update(input_bits(self.game.input))
+
+        self.particles.update(dt)
+        self.camera.update(self.player)
+
+        if self.session.desync_frame is not None and not self._desync_reported:
+            print(f"[net] desync detected at frame {self.session.desync_frame}")
+            self._desync_reported = True
+
+        # Only a death both peers agree on ends the run
+        if self.death_frame is not None and self.death_frame <= self.session.confirmed_frame:
+            from .game_over_state import GameOverState
+            rank = self._finish_session("killed")
+            # No replay: a new session needs both peers to reconnect
+            self.game.change_state(GameOverState(self.game, self.score, rank, self.mode))
+
+    # --- Simulation interface for RollbackSession ---
+
+    def step(self, inputs, replay: bool) -> None:
+        """Apply one input per player and advance one fixed step."""
+        for player, bits in zip(self.players, inputs):
+            player.apply_input(bits & INPUT_LEFT, bits & INPUT_RIGHT, bits & INPUT_JUMP)
+            if bits & INPUT_SHOOT:
+                player.shoot()
+
+        # Effects for resimulated frames were already shown and heard once
+        effects = self.particles.enabled
+        muted = self.game.audio.muted
+        self.particles.enabled = effects and not replay
+        self.game.audio.muted = muted or replay
+        try:
+            self._step(STEP_DT)
+        finally:
+            self.particles.enabled = effects
+            self.game.audio.muted = muted
+        self.frame += 1
+
+    def save_state(self) -> tuple:
+        """Exact copy of everything the simulation reads."""
+        store = self.entity_store
+        enemies = [
+            (view.ai_slot, view.ai_elapsed, view.animation_timer, view.animation_frame,
+             store.target[view._index])
+            if isinstance(view, FlyingEnemy) else None
+            for view in store.views
+        ]
+        return (self._snapshot('d'), enemies, self.rng.getstate(),
+                self.ai_scheduler.frame, self.ai_scheduler.next_slot,
+                self.frame, self.death_frame)
+
+    def load_state(self, state: tuple) -> None:
+        """Restore a save_state() result."""
+        (snapshot, enemies, rng_state, ai_frame, next_slot,
+         self.frame, self.death_frame) = state
+        self._restore(snapshot, 'd')
+        store = self.entity_store
+        for view, extra in zip(store.views, enemies):
+            if extra is not None:
+                (view.ai_slot, view.ai_elapsed, view.animation_timer,
+                 view.animation_frame, store.target[view._index]) = extra
+        self.rng.setstate(rng_state)
+        self.ai_scheduler.frame = ai_frame
+        self.ai_scheduler.next_slot = next_slot
+
+    def checksum(self, state: tuple) -> int:
+        """Checksum of a saved state, compared between peers."""
+        return zlib.crc32(state[0])
+
+    # --- Deterministic replacements for camera-based rules ---
+
+    def _update_spawning(self, dt: float) -> None:
+        """Spawn on the shared schedule (no local frame-time throttling)."""
+        count = self.spawn_director.update(dt, 0.0, len(self.enemies))
+        for _ in range(count):
+            self._spawn_enemy()
+
+    def _spawn_enemy(self) -> None:
+        """Spawn ahead of the leading player, chasing a random player."""
+        lead = max(player.rect.centerx for player in self.players)
+        spawn_x = lead + SCREEN_WIDTH // 2 + SPAWN_MARGIN
+        spawn_y = self.rng.randint(100, SCREEN_HEIGHT - 150)
+        target = self.rng.randrange(len(self.players))
+
+        enemy = FlyingEnemy(spawn_x, spawn_y, self.entity_store, target)
+        self.enemies.add(enemy)
+
+    def _cleanup_bullets(self) -> None:
+        """Remove bullets that left the level."""
+        for bullet in self.bullets:
+            if bullet.rect.right < 0 or bullet.rect.left > LEVEL_WIDTH:
+                bullet.kill()
+
+    def _on_player_died(self, data) -> None:
+        """Remember when a player died; update() ends the run once confirmed."""
+        if self.death_frame is None:
+            self.death_frame = self.frame
@@ -0,0 +1,106 @@
+"""
+Endless State - Single-player run on a level generated as it is played.
+"""
+
+from config import ENDLESS_SEED, ENDLESS_CHUNK_WIDTH, ENDLESS_CHUNKS_AHEAD, ENDLESS_CHUNKS_BEHIND
+from core.level_gen import ChunkStreamer
+from .playing_state import PlayingState
+
+
+class EndlessState(PlayingState):
+    """
+    PlayingState on a level with no right edge.
+
+    The level is cut into ENDLESS_CHUNK_WIDTH chunks, each generated
+    from the run's seed and its index by a ChunkStreamer on a worker
+    thread, platform images and collision boxes included. This thread
+    only adds finished chunks to the sprite groups. Chunks from
+    ENDLESS_CHUNKS_BEHIND behind the player's chunk to
+    ENDLESS_CHUNKS_AHEAD in front of it are kept and the rest dropped,
+    so a run holds the same few chunks however far it goes. Walking (or
+    rewinding) back into a dropped chunk generates it again, identical.
+
+    The player only collides with its own chunk and the ones next to
+    it. If one of those isn't ready yet the frame waits for it (counted
+    in stalls); with the chunks requested well ahead that shouldn't
+    happen. Enemies steer straight at the player with flocking, as the
+    flow field needs a fixed level.
+    """
+
+    mode = "endless"
+
+    def __init__(self, game):
+        super().__init__(game)
+        self.player.level_width = float('inf')
+        self.camera.level_width = float('inf')
+
+    def _create_level(self) -> None:
+        """Start streaming the level; the chunks around the spawn are waited for."""
+        self.chunks = {}            # index -> installed Chunk
+        self.stalls = 0             # chunks play had to wait for
+        self.solid_platforms = []
+        self.solid_boxes = []
+        self._solid_for = None      # (player chunk, installed chunks) solids were built for
+        self.streamer = ChunkStreamer(self._new_seed())
+        self._stream_chunks()
+
+    def _create_flow_field(self):
+        """No flow field: it covers a fixed level."""
+        return None
+
+    def _new_seed(self) -> int:
+        return ENDLESS_SEED if ENDLESS_SEED is not None else self.rng.getrandbits(32)
+
+    def reset(self) -> None:
+        """Restart the run on a newly seeded level."""
+        for chunk in self.chunks.values():
+            self._remove_chunk(chunk)
+        self.chunks.clear()
+        self.streamer.reseed(self._new_seed())
+        super().reset()
+        self._stream_chunks()
+
+    def exit(self) -> None:
+        """Called when state is deactivated."""
+        super().exit()
+        self.streamer.close()
+
+    def update(self, dt: float) -> None:
+        """Install and drop chunks around the player, then play the frame."""
+        self._stream_chunks()
+        super().update(dt)
+
+    def _stream_chunks(self) -> None:
+        center = self.player.rect.centerx // ENDLESS_CHUNK_WIDTH
+        first = max(0, center - ENDLESS_CHUNKS_BEHIND)
+        last = center + ENDLESS_CHUNKS_AHEAD
+
+        for index in [index for index in self.chunks if not first <= index <= last]:
+            self._remove_chunk(self.chunks.pop(index))
+        for index in range(first, last + 1):
+            if index not in self.chunks:
+                self.streamer.request(index)
+
+        finished = self.streamer.finished()
+        for index in range(max(0, center - 1), center + 2):
+            if index not in self.chunks and not any(chunk.index == index for chunk in finished):
+                if self.chunks:
+                    self.stalls += 1    # (an empty level is the start of a run)
+                finished.extend(self.streamer.wait(index))
+
+        for chunk in finished:
+            if first <= chunk.index <= last and chunk.index not in self.chunks:
+                self.chunks[chunk.index] = chunk
+                self.platforms.add(chunk.platforms)
+                self.all_sprites.add(chunk.platforms)
+
+        solid_for = (center, tuple(self.chunks))
+        if solid_for != self._solid_for:
+            self._solid_for = solid_for
+            near = [self.chunks[index] for index in range(center - 1, center + 2) if index in self.chunks]
+            self.solid_platforms = [platform for chunk in near for platform in chunk.platforms]
+            self.solid_boxes = [box for chunk in near for box in chunk.boxes]
+
+    def _remove_chunk(self, chunk) -> None:
+        for platform in chunk.platforms:
+            platform.kill()
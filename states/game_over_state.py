@@ -11,9 +11,23 @@ class GameOverState:
     Game over screen shown when player dies.
     """
 
-    def __init__(self, game, score: int = 0):
+    def __init__(self, game, score: int = 0, rank: int = None, mode: str = "single",
+                 restart=None):
+        """
+        Args:
+            game: Game instance
+            score: Enemies defeated this run
+            rank: Rank of the run in its mode's high-score table (None if it didn't place)
+            mode: Mode the run was played in (whose high scores are shown)
+            restart: Called with the game to get the state for another
+                     run of the mode (None offers only the menu)
+        """
         self.game = game
         self.score = score
+        self.rank = rank
+        self.mode = mode
+        self.restart = restart
+        self.best = game.sessions.best(mode)
         self.font_large = pygame.font.Font(None, 74)
         self.font_small = pygame.font.Font(None, 36)
 
@@ -33,17 +47,15 @@ class GameOverState:
         """Called when returning to this state."""
         pass
 
-    def handle_event(self, event) -> None:
-        """Handle pygame events."""
-        if event.type == pygame.KEYDOWN:
-            if event.key == pygame.K_RETURN:
-                # Restart game
-                from .playing_state import PlayingState
-                self.game.change_state(PlayingState(self.game))
-            elif event.key == pygame.K_ESCAPE:
-                # Return to menu
-                from .menu_state import MenuState
-                self.game.change_state(MenuState(self.game))
+    def handle_input(self, actions) -> None:
+        """Handle input actions."""
+        if actions.consume("confirm") and self.restart is not None:
+            # Another run in the same mode
+            self.game.change_state(self.restart(self.game))
+        elif actions.consume("back"):
+            # Return to menu
+            from .menu_state import MenuState
+            self.game.change_state(MenuState(self.game))
 
     def update(self, dt: float) -> None:
         """Update game over logic."""
@@ -63,10 +75,23 @@ class GameOverState:
         score_rect = score_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2))
         screen.blit(score_text, score_rect)
 
+        # Rank 1 beats every earlier run of the mode (ties rank lower);
+        # a first run that scored nothing isn't a record
+        if self.rank == 1 and self.score > 0:
+            best_line = "New High Score!"
+        elif self.rank is not None:
+            best_line = f"#{self.rank} on the High Scores - Best: {self.best}"
+        else:
+            best_line = f"High Score: {self.best}"
+        best_text = self.font_small.render(best_line, True, COLOR_WHITE)
+        best_rect = best_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 40))
+        screen.blit(best_text, best_rect)
+
         # Instructions
-        restart_text = self.font_small.render("Press ENTER to Play Again", True, COLOR_WHITE)
-        restart_rect = restart_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT * 0.65))
-        screen.blit(restart_text, restart_rect)
+        if self.restart is not None:
+            restart_text = self.font_small.render("Press ENTER to Play Again", True, COLOR_WHITE)
+            restart_rect = restart_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT * 0.65))
+            screen.blit(restart_text, restart_rect)
 
         menu_text = self.font_small.render("Press ESC for Menu", True, COLOR_WHITE)
         menu_rect = menu_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT * 0.65 + 40))
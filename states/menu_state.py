@@ -32,15 +32,17 @@ class MenuState:
         """Called when returning to this state."""
         pass
 
-    def handle_event(self, event) -> None:
-        """Handle pygame events."""
-        if event.type == pygame.KEYDOWN:
-            if event.key == pygame.K_RETURN:
-                # Import here to avoid circular import
-                from .playing_state import PlayingState
-                self.game.change_state(PlayingState(self.game))
-            elif event.key == pygame.K_ESCAPE:
-                self.game.running = False
+    def handle_input(self, actions) -> None:
+        """Handle input actions."""
+        if actions.consume("confirm"):
+            # Import here to avoid circular import
+            from .playing_state import PlayingState
+            self.game.change_state(PlayingState.start(self.game))
+        elif actions.consume("endless"):
+            from .endless_state import EndlessState
+            self.game.change_state(EndlessState.start(self.game))
+        elif actions.consume("back"):
+            self.game.running = False
 
     def update(self, dt: float) -> None:
         """Update menu logic."""
@@ -60,12 +62,17 @@ class MenuState:
         start_rect = start_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2))
         screen.blit(start_text, start_rect)
 
+        endless_text = self.font_small.render("Press E for Endless Mode", True, COLOR_WHITE)
+        endless_rect = endless_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 40))
+        screen.blit(endless_text, endless_rect)
+
         # Controls
         controls = [
             "Controls:",
             "A/D or Arrows - Move",
             "W or Space - Jump",
-            "F - Shoot",
+            "F - Shoot (hold for auto-fire)",
+            "R (hold) - Rewind",
             "ESC - Pause"
         ]
 
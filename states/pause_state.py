@@ -37,16 +37,15 @@ class PauseState:
         """Called when returning to this state."""
         pass
 
-    def handle_event(self, event) -> None:
-        """Handle pygame events."""
-        if event.type == pygame.KEYDOWN:
-            if event.key == pygame.K_ESCAPE or event.key == pygame.K_RETURN:
-                # Unpause - go back to playing
-                self.game.pop_state()
-            elif event.key == pygame.K_q:
-                # Quit to menu
-                from .menu_state import MenuState
-                self.game.change_state(MenuState(self.game))
+    def handle_input(self, actions) -> None:
+        """Handle input actions."""
+        if actions.consume("pause") or actions.consume("confirm"):
+            # Unpause - go back to playing
+            self.game.pop_state()
+        elif actions.consume("quit"):
+            # Quit to menu
+            from .menu_state import MenuState
+            self.game.change_state(MenuState(self.game))
 
     def update(self, dt: float) -> None:
         """Update pause logic."""
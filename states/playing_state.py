@@ -4,24 +4,57 @@ Playing State - Main gameplay state.
 
 import pygame
 import random
+import struct
+import time
+from array import array
 from config import (
     SCREEN_WIDTH, SCREEN_HEIGHT, LEVEL_WIDTH, LEVEL_HEIGHT,
-    COLOR_SKY_BLUE, SPAWN_INTERVAL, SPAWN_MARGIN
+    SPAWN_MARGIN, INPUT_JUMP_BUFFER, INPUT_SHOOT_BUFFER
 )
 from core.camera import Camera
+from core.parallax import ParallaxBackground
+from core.renderer import BlitBatch
+from core.rewind import RewindBuffer
+from core.resolution import ResolutionScaler
 from core.event_manager import GameEvent
 from entities.player import Player
 from entities.enemy import FlyingEnemy
+from entities.bullet import Bullet
 from entities.platform import Platform
+from entities.entity_store import EntityStore
 from systems.collision import CollisionSystem
+from systems.movement import MovementSystem
+from systems.lifetime import LifetimeSystem
+from systems.damage import DamageSystem
+from systems.ai_scheduler import AIScheduler
+from systems.spatial_grid import SpatialGrid
+from systems.flow_field import FlowField
+from systems.spawn_director import SpawnDirector
+from systems.particles import ParticleSystem
 from ui.hud import HUD
 
 
+# World snapshot layout: header (score, spawn timers, entity row and
+# player counts), one PLAYER record per player (x, y, velocity,
+# invincibility, shot and animation timers, health, animation and
+# frame indices, flags), then the row columns
+# (float32 for rewind, float64 for exact netplay rollback), sprite ids,
+# one kind byte per row and the row order of the enemy and bullet groups.
+SNAPSHOT_HEADER = struct.Struct('<iddIB')
+SNAPSHOT_PLAYER = struct.Struct('<2i5di2B3?')
+SNAPSHOT_COLUMNS = ('pos_x', 'pos_y', 'vel_x', 'vel_y', 'health', 'lifetime')
+KIND_ENEMY = 0
+KIND_BULLET = 1
+
+
 class PlayingState:
     """
     Active gameplay - manages all entities and systems.
     """
 
+    # Session records name the mode they were played in
+    mode = "single"
+
     def __init__(self, game):
         self.game = game
 
@@ -31,31 +64,87 @@ class PlayingState:
         self.enemies = pygame.sprite.Group()
         self.bullets = pygame.sprite.Group()
 
+        # Component storage for enemies and bullets (enemies chase
+        # store.targets, the players)
+        self.players = []
+        self.entity_store = EntityStore(self.players, game.event_manager)
+
         # Create player (spawn above ground)
-        self.player = Player(100, SCREEN_HEIGHT - 140, game.event_manager)
-        self.player.bullet_group = self.bullets
-        self.all_sprites.add(self.player)
+        self.player = self._add_player(100, SCREEN_HEIGHT - 140)
+
+        # Gameplay randomness (seeded for netplay)
+        self.rng = random.Random()
 
         # Create level
         self._create_level()
 
         # Systems
-        self.collision_system = CollisionSystem()
+        self.collision_system = CollisionSystem(game.event_manager)
+        self.movement_system = MovementSystem()
+        self.lifetime_system = LifetimeSystem()
+        self.damage_system = DamageSystem()
+        self.ai_scheduler = AIScheduler()
+        self.enemy_grid = SpatialGrid()
+        self.flow_field = self._create_flow_field()
+        self.particles = ParticleSystem(game.event_manager, self.player)
         self.camera = Camera(LEVEL_WIDTH, LEVEL_HEIGHT)
+        self.resolution = ResolutionScaler((SCREEN_WIDTH, SCREEN_HEIGHT))
+        self.blit_batch = BlitBatch()
+        self.background = ParallaxBackground()
+        self.rewind = RewindBuffer()
 
         # UI
         self.hud = HUD(self.player)
 
         # Enemy spawning
-        self.spawn_timer = 0
-        self.spawn_interval = SPAWN_INTERVAL
+        self.spawn_director = SpawnDirector()
 
         # Score tracking
         self.score = 0
 
-        # Subscribe to events
-        game.event_manager.subscribe(GameEvent.PLAYER_DIED, self._on_player_died)
-        game.event_manager.subscribe(GameEvent.ENEMY_KILLED, self._on_enemy_killed)
+        # Session telemetry (recorded when the run ends)
+        self.session_time = 0.0
+        self.session_open = True
+
+    @classmethod
+    def start(cls, game) -> 'PlayingState':
+        """
+        Get the state for a new run: the game's existing state reset in
+        place, or a new one the first time (or after switching modes).
+        """
+        state = game.playing_state
+        if type(state) is not cls:
+            state = game.playing_state = cls(game)
+        else:
+            state.reset()
+        return state
+
+    def reset(self) -> None:
+        """
+        Restart the run, keeping the level, assets and systems.
+        Only dynamic state (player, enemies, bullets, timers, score) is reset.
+        """
+        # Killing every store row removes enemies and bullets from their groups
+        self.entity_store.clear()
+
+        self.player.reset(100, SCREEN_HEIGHT - 140)
+        self.all_sprites.add(self.player)
+        self.particles.clear()
+        self.spawn_director.reset()
+        self.rewind.clear()
+        self.camera.update(self.player)
+        self.score = 0
+        self.session_time = 0.0
+        self.session_open = True
+
+    def _add_player(self, x: int, y: int) -> Player:
+        """Create a player wired to the shared bullet group and store."""
+        player = Player(x, y, self.game.event_manager)
+        player.bullet_group = self.bullets
+        player.entity_store = self.entity_store
+        self.players.append(player)
+        self.all_sprites.add(player)
+        return player
 
     def _create_level(self) -> None:
         """Create platforms for the level."""
@@ -87,15 +176,30 @@ class PlayingState:
             self.platforms.add(p)
             self.all_sprites.add(p)
 
+        # What the player collides with (the level never changes)
+        self.solid_platforms = list(self.platforms)
+        self.solid_boxes = [(p.rect.left, p.rect.top, p.rect.right, p.rect.bottom)
+                            for p in self.solid_platforms]
+
+    def _create_flow_field(self):
+        """Create the shared enemy flow field over the level (None to fly straight)."""
+        return FlowField(self.platforms, LEVEL_WIDTH, LEVEL_HEIGHT)
+
     def enter(self) -> None:
         """Called when state becomes active."""
-        pass
+        # Subscribe to events (the state is reused across restarts)
+        self.game.event_manager.subscribe(GameEvent.PLAYER_DIED, self._on_player_died)
+        self.game.event_manager.subscribe(GameEvent.ENEMY_KILLED, self._on_enemy_killed)
+        self.particles.open()
 
     def exit(self) -> None:
         """Called when state is deactivated."""
         # Unsubscribe from events
         self.game.event_manager.unsubscribe(GameEvent.PLAYER_DIED, self._on_player_died)
         self.game.event_manager.unsubscribe(GameEvent.ENEMY_KILLED, self._on_enemy_killed)
+        self.particles.close()
+        # Leaving without dying (quit to menu or closing the window)
+        self._finish_session("quit")
 
     def pause(self) -> None:
         """Called when another state is pushed on top."""
@@ -105,29 +209,68 @@ class PlayingState:
         """Called when returning to this state."""
         pass
 
-    def handle_event(self, event) -> None:
-        """Handle pygame events."""
-        if event.type == pygame.KEYDOWN:
-            if event.key == pygame.K_ESCAPE:
-                from .pause_state import PauseState
-                self.game.push_state(PauseState(self.game))
-            elif event.key == pygame.K_f:
-                self.player.shoot()
+    def handle_input(self, actions) -> None:
+        """Handle menu actions; gameplay actions are read in update()."""
+        if actions.consume("pause"):
+            from .pause_state import PauseState
+            self.game.push_state(PauseState(self.game))
 
     def update(self, dt: float) -> None:
         """Update all game logic."""
-        # Handle continuous input
-        keys = pygame.key.get_pressed()
-        self.player.handle_input(keys)
+        actions = self.game.input
+
+        # Holding rewind scrubs back one recorded frame per frame,
+        # then holds on the oldest one
+        if actions.held("rewind"):
+            snapshot = self.rewind.pop()
+            if snapshot is not None:
+                self._restore(snapshot)
+                self.camera.update(self.player)
+            self.particles.update(dt)
+            return
+
+        # Session length counts played time, not time spent rewinding
+        self.session_time += dt
+        self._apply_actions(actions)
+        self._step(dt)
+
+        # Update effects
+        self.particles.update(dt)
 
-        # Update player
-        self.player.update(dt)
-
-        # Update enemies
-        self.enemies.update(dt)
+        # Update camera
+        self.camera.update(self.player)
 
-        # Update bullets
-        self.bullets.update(dt)
+        # Record the frame for rewinding
+        self.rewind.push(self._snapshot())
+
+    def _apply_actions(self, actions) -> None:
+        """Move and shoot from actions. Holding fire repeats at the shot
+        cooldown; a jump or shot pressed slightly too early is buffered
+        and used as soon as it can happen."""
+        jump = actions.held("jump") or actions.pressed("jump", INPUT_JUMP_BUFFER)
+        if self.player.apply_input(actions.held("left"), actions.held("right"), jump):
+            actions.consume("jump", INPUT_JUMP_BUFFER)
+
+        if actions.held("shoot") or actions.pressed("shoot", INPUT_SHOOT_BUFFER):
+            if self.player.shoot():
+                actions.consume("shoot", INPUT_SHOOT_BUFFER)
+
+    def _step(self, dt: float) -> None:
+        """Advance the simulation once, after input has been applied."""
+        # Update players
+        for player in self.players:
+            player.update(dt)
+
+        # Steer enemies (staggered by distance, flocking with neighbors)
+        self.enemy_grid.rebuild(self.enemies)
+        if self.flow_field is not None:
+            self.flow_field.update(self.players)
+        self.ai_scheduler.update(self.enemies, self.players, self.camera, dt,
+                                 self.enemy_grid, self.flow_field)
+
+        # Move and expire enemies and bullets in bulk
+        self.movement_system.update(self.entity_store, dt)
+        self.lifetime_system.update(self.entity_store, dt)
 
         # Add new sprites to all_sprites for rendering
         for enemy in self.enemies:
@@ -140,14 +283,14 @@ class PlayingState:
 
         # Handle collisions
         self.collision_system.update(
-            self.player,
+            self.players,
             self.enemies,
             self.bullets,
-            self.platforms
+            self.solid_platforms,
+            dt,
+            self.solid_boxes
         )
-
-        # Update camera
-        self.camera.update(self.player)
+        self.damage_system.update(self.entity_store)
 
         # Spawn enemies
         self._update_spawning(dt)
@@ -155,21 +298,108 @@ class PlayingState:
         # Remove off-screen bullets
         self._cleanup_bullets()
 
-    def _update_spawning(self, dt: float) -> None:
-        """Spawn enemies periodically."""
-        self.spawn_timer += dt
+    def _snapshot(self, column_type: str = 'f') -> bytes:
+        """Pack the dynamic world state into bytes."""
+        store = self.entity_store
+        director = self.spawn_director
+        parts = [SNAPSHOT_HEADER.pack(
+            self.score, director.difficulty_time, director.spawn_timer,
+            len(store), len(self.players)
+        )]
+        for player in self.players:
+            parts.append(SNAPSHOT_PLAYER.pack(
+                player.rect.x, player.rect.y, player.velocity.x, player.velocity.y,
+                player.invincible_timer, player.shoot_cooldown, player.animation_timer,
+                player.health, player.animation_frame, player.frames.index(player.frame),
+                player.invincible, player.on_ground, player.facing_right
+            ))
+        parts.extend(array(column_type, getattr(store, name)).tobytes() for name in SNAPSHOT_COLUMNS)
+        parts.append(store.sprite_id.tobytes())
+        parts.append(bytes(KIND_BULLET if isinstance(view, Bullet) else KIND_ENEMY
+                           for view in store.views))
+        # Group order decides collision order, so keep it too
+        order = array('H', [view._index for view in self.enemies])
+        order.extend(view._index for view in self.bullets)
+        parts.append(order.tobytes())
+        return b''.join(parts)
+
+    def _restore(self, snapshot: bytes, column_type: str = 'f') -> None:
+        """Rebuild the dynamic world state from a snapshot."""
+        score, difficulty_time, spawn_timer, rows, player_count = SNAPSHOT_HEADER.unpack_from(snapshot)
+        self.score = score
+        self.spawn_director.difficulty_time = difficulty_time
+        self.spawn_director.spawn_timer = spawn_timer
+
+        offset = SNAPSHOT_HEADER.size
+        for player in self.players[:player_count]:
+            (x, y, vx, vy, invincible_timer, shoot_cooldown, animation_timer, health,
+             animation_frame, frame, invincible, on_ground,
+             facing_right) = SNAPSHOT_PLAYER.unpack_from(snapshot, offset)
+            offset += SNAPSHOT_PLAYER.size
+            player.rect.topleft = (x, y)
+            player.prev_rect = player.rect.copy()
+            player.velocity.update(vx, vy)
+            player.invincible_timer = invincible_timer
+            player.shoot_cooldown = shoot_cooldown
+            player.health = health
+            player.invincible = invincible
+            player.on_ground = on_ground
+            player.facing_right = facing_right
+            # The frame also picks the collision mask
+            player.animation_timer = animation_timer
+            player.animation_frame = animation_frame
+            player.set_frame(frame)
+
+        # Unpack the row columns
+        columns = []
+        for _ in SNAPSHOT_COLUMNS:
+            column = array(column_type)
+            size = rows * column.itemsize
+            column.frombytes(snapshot[offset:offset + size])
+            columns.append(column)
+            offset += size
+        sprite_ids = array('i')
+        sprite_ids.frombytes(snapshot[offset:offset + rows * sprite_ids.itemsize])
+        offset += rows * sprite_ids.itemsize
+        kinds = snapshot[offset:offset + rows]
+        order = array('H')
+        order.frombytes(snapshot[offset + rows:])
+
+        # Recreate enemies and bullets in row order, then overwrite their rows
+        store = self.entity_store
+        store.clear()
+        for i in range(rows):
+            pos_x, pos_y, vel_x = columns[0][i], columns[1][i], columns[2][i]
+            if kinds[i] == KIND_BULLET:
+                Bullet(pos_x, pos_y, 1 if vel_x >= 0 else -1, store)
+            else:
+                enemy = FlyingEnemy(pos_x, pos_y, store)
+                enemy.facing_right = vel_x > 0
+
+        for name, column in zip(SNAPSHOT_COLUMNS, columns):
+            getattr(store, name)[:] = array('d', column)
+        store.sprite_id[:] = sprite_ids
+
+        # Rebuild the groups in their saved order
+        views = store.views
+        for i in order:
+            view = views[i]
+            (self.bullets if kinds[i] == KIND_BULLET else self.enemies).add(view)
+            self.all_sprites.add(view)
 
-        if self.spawn_timer >= self.spawn_interval:
-            self.spawn_timer = 0
+    def _update_spawning(self, dt: float) -> None:
+        """Spawn the enemies the director asks for."""
+        count = self.spawn_director.update(dt, self.game.frame_time, len(self.enemies))
+        for _ in range(count):
             self._spawn_enemy()
 
     def _spawn_enemy(self) -> None:
         """Spawn a flying enemy off-screen."""
         # Spawn from right side of camera view
         spawn_x = self.camera.right + SPAWN_MARGIN
-        spawn_y = random.randint(100, SCREEN_HEIGHT - 150)
+        spawn_y = self.rng.randint(100, SCREEN_HEIGHT - 150)
 
-        enemy = FlyingEnemy(spawn_x, spawn_y, self.player, self.game.event_manager)
+        enemy = FlyingEnemy(spawn_x, spawn_y, self.entity_store)
         self.enemies.add(enemy)
 
     def _cleanup_bullets(self) -> None:
@@ -180,10 +410,28 @@ class PlayingState:
             elif bullet.rect.left > self.camera.right + 100:
                 bullet.kill()
 
+    def _finish_session(self, cause: str):
+        """Record the run once; returns its high-score rank (or None)."""
+        if not self.session_open:
+            return None
+        self.session_open = False
+        frames = {name: round(value, 3) if isinstance(value, float) else value
+                  for name, value in self.game.pacer.stats().items()}
+        return self.game.sessions.record_session({
+            'time': time.strftime('%Y-%m-%dT%H:%M:%S'),
+            'mode': self.mode,
+            'score': self.score,
+            'duration': round(self.session_time, 2),
+            'cause': cause,
+            'frames': frames,
+        })
+
     def _on_player_died(self, data) -> None:
         """Handle player death."""
         from .game_over_state import GameOverState
-        self.game.change_state(GameOverState(self.game, self.score))
+        rank = self._finish_session("killed")
+        self.game.change_state(GameOverState(self.game, self.score, rank, self.mode,
+                                             restart=type(self).start))
 
     def _on_enemy_killed(self, data) -> None:
         """Handle enemy death."""
@@ -191,12 +439,26 @@ class PlayingState:
 
     def render(self, screen) -> None:
         """Render the game world."""
-        # Clear screen with sky color
-        screen.fill(COLOR_SKY_BLUE)
-
-        # Draw all sprites with camera offset
-        for sprite in self.all_sprites:
-            screen.blit(sprite.image, self.camera.apply(sprite))
-
-        # Draw HUD (fixed to screen)
-        self.hud.render(screen, self.score)
+        # Dynamic resolution only pays off for software blitting
+        scale = self.resolution.update(self.game.frame_time) if screen.software else 1.0
+
+        if scale < 1.0:
+            # Draw the world small, then scale it to the display once
+            world = self.resolution.surface()
+            self.background.render(world, self.camera, scale)
+            world.blits(self.blit_batch.fill_scaled(
+                self.all_sprites, self.camera.left, self.camera.top,
+                scale, self.resolution.scaled
+            ), doreturn=False)
+            self.particles.render(world, self.camera, scale)
+            self.resolution.present(screen)
+        else:
+            # Parallax background (covers the whole screen)
+            self.background.render(screen, self.camera)
+
+            # Draw all sprites with camera offset in one batch
+            screen.blits(self.blit_batch.fill(self.all_sprites, self.camera.left, self.camera.top))
+            self.particles.render(screen, self.camera)
+
+        # Draw HUD (fixed to screen, always native resolution)
+        self.hud.render(screen, self.score, scale)
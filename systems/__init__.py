@@ -1,3 +1,9 @@
 """Systems module - game systems (collision, physics)."""
 
 from .collision import CollisionSystem
+from .movement import MovementSystem
+from .lifetime import LifetimeSystem
+from .damage import DamageSystem
+from .ai_scheduler import AIScheduler
+from .spatial_grid import SpatialGrid
+from .flow_field import FlowField
@@ -0,0 +1,72 @@
+"""
+AI Scheduler - Staggered, distance-based enemy AI ticks.
+"""
+
+from config import AI_LOD_TIERS, AI_FAR_INTERVAL, FLOCK_NEIGHBOR_RADIUS, FLOCK_MAX_NEIGHBORS
+
+
+class AIScheduler:
+    """
+    Runs enemy steering at a rate picked by distance to the player:
+    every frame up close, every AI_FAR_INTERVAL frames far away (the
+    nearest player counts when there are several). Each
+    enemy gets a round-robin slot when first seen, and ticks on frames
+    where (frame + slot) is a multiple of its interval, so far enemies
+    are spread evenly across frames instead of all ticking together.
+
+    Between ticks an enemy keeps its last velocity, which MovementSystem
+    keeps integrating every frame. A tick passes the time since the
+    enemy's previous tick, so animation timers stay in step.
+
+    Given a SpatialGrid of the enemies, each ticking enemy also gets the
+    enemies within FLOCK_NEIGHBOR_RADIUS (at most FLOCK_MAX_NEIGHBORS
+    besides itself) for flocking. A FlowField is passed on as is.
+    """
+
+    def __init__(self, tiers=AI_LOD_TIERS, far_interval: int = AI_FAR_INTERVAL):
+        # (squared distance, interval) nearest first
+        self.tiers = [(distance * distance, interval) for distance, interval in tiers]
+        self.far_interval = far_interval
+        self.frame = 0
+        self.ticks = 0          # enemies ticked on the last frame
+        self.next_slot = 0
+        # Queries find the enemy itself too
+        self.neighbor_limit = FLOCK_MAX_NEIGHBORS + 1
+
+    def update(self, enemies, players, camera, dt: float, grid=None, field=None) -> None:
+        """Tick the enemies that are due this frame."""
+        self.frame += 1
+        self.ticks = 0
+
+        # Distance is measured to the players, or the view center without any
+        centers = [player.rect.center for player in players if player.alive()]
+        if not centers:
+            centers = [camera.camera_rect.center]
+
+        for enemy in enemies.sprites():
+            enemy.ai_elapsed += dt
+
+            # New enemies tick immediately so they never sit still
+            if enemy.ai_slot is None:
+                enemy.ai_slot = self.next_slot
+                self.next_slot += 1
+            elif (self.frame + enemy.ai_slot) % self._interval(enemy, centers):
+                continue
+
+            if grid is not None:
+                x, y = enemy.position
+                neighbors = grid.query(x, y, FLOCK_NEIGHBOR_RADIUS, self.neighbor_limit)
+                enemy.update(enemy.ai_elapsed, neighbors, field)
+            else:
+                enemy.update(enemy.ai_elapsed, field=field)
+            enemy.ai_elapsed = 0.0
+            self.ticks += 1
+
+    def _interval(self, enemy, centers) -> int:
+        """Frames between ticks for an enemy at its current distance."""
+        x, y = enemy.position
+        distance_sq = min((x - cx) ** 2 + (y - cy) ** 2 for cx, cy in centers)
+        for limit_sq, interval in self.tiers:
+            if distance_sq <= limit_sq:
+                return interval
+        return self.far_interval
@@ -2,25 +2,104 @@
 Collision System - Handles all collision detection and response.
 """
 
+import math
 import pygame
+from core.event_manager import GameEvent
+from .swept import SweepTargets
 
 
 class CollisionSystem:
     """
     Centralized collision detection using Pygame's sprite collision.
+    Fast movers (bullets, the falling player) are swept along their
+    path for the step, so large dt can't tunnel through thin targets.
+
+    Hits between bullets, enemies and players are confirmed against
+    the sprites' cached frame masks once their rects touch, so a graze
+    of transparent padding doesn't count.
     """
 
-    def __init__(self):
-        pass
+    # Max sweep iterations per step (each hit slides along one axis)
+    SWEEP_ITERATIONS = 3
+
+    # Pixels between mask tests along a bullet's path through a box
+    MASK_STEP = 2
+
+    def __init__(self, event_manager=None):
+        """
+        Args:
+            event_manager: For emitting bullet impact events (optional)
+        """
+        self.event_manager = event_manager
+        self._boxes = None          # platform boxes the packed targets were built from
+        self._platform_targets = None
 
-    def update(self, player, enemies, bullets, platforms) -> None:
+    def update(self, players, enemies, bullets, platforms, dt: float, boxes=None) -> None:
         """
         Check all collisions each frame.
         Order matters for proper response.
+
+        boxes, if given, are the platform rects as (left, top, right,
+        bottom) tuples, built once instead of every frame.
         """
-        self._handle_player_platform_collision(player, platforms)
-        self._handle_bullet_enemy_collision(bullets, enemies)
-        self._handle_enemy_player_collision(player, enemies)
+        if boxes is None:
+            boxes = [(p.rect.left, p.rect.top, p.rect.right, p.rect.bottom) for p in platforms]
+        if boxes is not self._boxes:
+            self._boxes = boxes
+            self._platform_targets = SweepTargets(boxes)
+        for player in players:
+            self._sweep_player(player, self._platform_targets)
+            self._handle_player_platform_collision(player, platforms)
+        self._handle_bullet_enemy_collision(bullets, enemies, dt)
+        for player in players:
+            self._handle_enemy_player_collision(player, enemies)
+
+    def _sweep_player(self, player, targets: SweepTargets) -> None:
+        """
+        Move the player from prev_rect to rect, stopping at the first
+        platform in the way and sliding along it for the rest of the step.
+        Contact state (on_ground, head bumps) is left to the overlap pass.
+        """
+        start = player.prev_rect
+        dx = player.rect.x - start.x
+        dy = player.rect.y - start.y
+        if dx == 0 and dy == 0:
+            return
+
+        half_w = start.width / 2
+        half_h = start.height / 2
+        x = start.x + half_w
+        y = start.y + half_h
+
+        # Grounded players pass platform sides (as in the overlap pass),
+        # so only their vertical motion is swept
+        if player.on_ground:
+            x += dx
+            dx = 0
+
+        for _ in range(self.SWEEP_ITERATIONS):
+            hit = targets.first(x, y, dx, dy, half_w, half_h)
+            if hit is None:
+                x += dx
+                y += dy
+                break
+
+            t, _, normal_x, normal_y = hit
+            x += dx * t
+            y += dy * t
+
+            # Slide: drop the blocked axis, keep the rest of the other
+            remaining = 1.0 - t
+            if normal_x:
+                dx, dy = 0, dy * remaining
+            else:
+                dx, dy = dx * remaining, 0
+
+            if dx == 0 and dy == 0:
+                break
+
+        player.rect.x = round(x - half_w)
+        player.rect.y = round(y - half_h)
 
     def _handle_player_platform_collision(self, player, platforms) -> None:
         """
@@ -70,32 +149,106 @@ class CollisionSystem:
                     player.velocity.y = 0
                     break
 
-    def _handle_bullet_enemy_collision(self, bullets, enemies) -> None:
+    def _handle_bullet_enemy_collision(self, bullets, enemies, dt: float) -> None:
         """
         Check bullets hitting enemies.
-        Uses groupcollide for efficiency.
+        The enemy boxes (taken at the start of the step, moving with
+        their enemy) are packed once, and the opaque part of every
+        bullet's frame is cast along its path for the step against all
+        of them in one batch. Each bullet's hits are then checked
+        against the masks in the order it reaches them; the first enemy
+        whose pixels the bullet meets takes the hit.
         """
-        # Get all collisions between bullets and enemies
-        collisions = pygame.sprite.groupcollide(
-            bullets,
-            enemies,
-            dokilla=True,   # Kill bullet on hit
-            dokillb=False   # Don't auto-kill enemy
-        )
-
-        # Apply damage to hit enemies
-        for bullet, hit_enemies in collisions.items():
-            for enemy in hit_enemies:
-                enemy.take_damage(bullet.damage)
+        if not bullets or not enemies:
+            return
+
+        targets = list(enemies)
+        boxes = []
+        motions = []
+        for enemy in targets:
+            vx, vy = enemy.velocity
+            mx, my = vx * dt, vy * dt
+            rect = enemy.rect
+            boxes.append((rect.left - mx, rect.top - my, rect.right - mx, rect.bottom - my))
+            motions.append((mx, my))
+        sweep = SweepTargets(boxes, motions)
+
+        # Cast only the opaque part of each bullet's frame
+        shots = list(bullets)
+        starts = []
+        origin_x, origin_y, move_x, move_y, half_w, half_h = [], [], [], [], [], []
+        for bullet in shots:
+            x, y = bullet.position
+            vx, vy = bullet.velocity
+            dx, dy = vx * dt, vy * dt
+            left = x - dx - bullet.rect.width / 2
+            top = y - dy - bullet.rect.height / 2
+            opaque = bullet.opaque_rect
+            starts.append((x - dx, y - dy))
+            origin_x.append(left + opaque.centerx)
+            origin_y.append(top + opaque.centery)
+            move_x.append(dx)
+            move_y.append(dy)
+            half_w.append(opaque.width / 2)
+            half_h.append(opaque.height / 2)
+        casts = sweep.cast(origin_x, origin_y, move_x, move_y, half_w, half_h,
+                           include_overlap=True)
+
+        for bullet, (x, y), dx, dy, hits in zip(shots, starts, move_x, move_y, casts):
+            left = x - bullet.rect.width / 2
+            top = y - bullet.rect.height / 2
+            for t_enter, index, _, _ in hits:
+                t = self._mask_hit_time(bullet, left, top, dx, dy,
+                                        targets[index], boxes[index], motions[index], t_enter)
+                if t is None:
+                    continue
+                targets[index].take_damage(bullet.damage)
+                if self.event_manager is not None:
+                    self.event_manager.emit(GameEvent.BULLET_HIT, {
+                        'position': (x + dx * t, y + dy * t)
+                    })
+                bullet.kill()
+                break
+
+    def _mask_hit_time(self, bullet, left: float, top: float, dx: float, dy: float,
+                       enemy, box: tuple, motion: tuple, t_enter: float):
+        """
+        First time in [t_enter, 1] at which the bullet's pixels (frame
+        at (left, top) + t * (dx, dy)) overlap the enemy's (box moved by
+        t * motion), sampled every MASK_STEP pixels of relative motion.
+        Returns None if they never meet.
+        """
+        bullet_mask = bullet.mask
+        enemy_mask = enemy.mask
+        mx, my = motion
+        rel_x = dx - mx
+        rel_y = dy - my
+        steps = max(1, math.ceil(math.hypot(rel_x, rel_y) * (1.0 - t_enter) / self.MASK_STEP))
+        for step in range(steps + 1):
+            t = t_enter + (1.0 - t_enter) * step / steps
+            offset = (round(box[0] - left - rel_x * t), round(box[1] - top - rel_y * t))
+            if bullet_mask.overlap(enemy_mask, offset) is not None:
+                return t
+        return None
 
     def _handle_enemy_player_collision(self, player, enemies) -> None:
         """
-        Check enemies touching player.
+        Check enemies touching player: rects first, then frame masks.
         """
         if not player.alive():
             return
 
         hits = pygame.sprite.spritecollide(player, enemies, False)
+        if not hits:
+            return
 
+        player_mask = player.mask
+        player_x, player_y = player.rect.topleft
         for enemy in hits:
+            # Enemies shot down this frame are removed later by DamageSystem
+            if enemy.health <= 0:
+                continue
+            offset = (enemy.rect.x - player_x, enemy.rect.y - player_y)
+            if player_mask.overlap(enemy.mask, offset) is None:
+                continue
             player.take_damage(enemy.damage)
@@ -0,0 +1,20 @@
+"""
+Damage System - Resolves depleted health for store-backed entities.
+"""
+
+
+class DamageSystem:
+    """
+    Scans EntityStore health in bulk and notifies entities whose
+    health has run out, so damage from any source dies in one place.
+    """
+
+    def update(self, store) -> None:
+        """Notify every entity with no health left."""
+        health = store.health
+        views = store.views
+        depleted = [views[i] for i in range(len(views)) if health[i] <= 0]
+
+        # Notify after the pass - removal reorders rows
+        for view in depleted:
+            view.on_depleted()
@@ -0,0 +1,212 @@
+"""
+Flow Field - Shared navigation toward the players around platforms.
+"""
+
+from collections import OrderedDict, deque
+from config import (
+    NAV_CELL_SIZE, NAV_CLEARANCE, NAV_CELLS_PER_FRAME, NAV_DIRECT_STEPS, NAV_FIELD_CACHE
+)
+
+# Neighbor offsets: straight moves first so ties prefer straight paths
+STEPS = ((1, 0), (-1, 0), (0, 1), (0, -1), (1, 1), (1, -1), (-1, 1), (-1, -1))
+DIAGONAL = 0.7071067811865476
+
+
+class FlowField:
+    """
+    One breadth-first search from the players' cells over a navigation
+    grid, shared by every enemy.
+
+    The grid marks cells whose center lies inside a platform rect grown
+    by NAV_CLEARANCE as blocked. The search runs outward from the target
+    cells, and each free cell it reaches points back at the neighbor it
+    was reached from, which is one step along a shortest path. Diagonal
+    steps must not cut a blocked corner. A second pass gives blocked
+    cells a direction out of the platform they are in.
+
+    The search only reruns when a player enters a different cell. With
+    cells_per_frame set, it is spread over several frames into a second
+    buffer while enemies keep using the finished field; a move during a
+    search is picked up when it completes. With cells_per_frame None
+    the field is rebuilt in full whenever the targets change, so it is
+    always a pure function of the current player cells (as rollback
+    needs). The last NAV_FIELD_CACHE finished fields are kept by target
+    cells, so a player stepping back and forth (or a rollback replaying
+    the same moves) reuses them without searching.
+
+    Enemies call sample() for a direction; the cost per frame depends
+    on the grid size, never on how many enemies there are.
+    """
+
+    def __init__(self, platforms, width: int, height: int, cell_size: int = NAV_CELL_SIZE,
+                 cells_per_frame: int = NAV_CELLS_PER_FRAME):
+        """
+        Args:
+            platforms: Sprites whose rects block movement
+            width, height: Level size in pixels
+            cell_size: Navigation cell size in pixels
+            cells_per_frame: Search budget per update (None searches in one go)
+        """
+        self.cell_size = cell_size
+        self.cols = -(-width // cell_size)
+        self.rows = -(-height // cell_size)
+        self.cells_per_frame = cells_per_frame
+
+        # Blocked cells, by index (row * cols + col)
+        blockers = [platform.rect.inflate(NAV_CLEARANCE * 2, NAV_CLEARANCE * 2)
+                    for platform in platforms]
+        half = cell_size // 2
+        self.blocked = bytearray(self.cols * self.rows)
+        for row in range(self.rows):
+            for col in range(self.cols):
+                center = (col * cell_size + half, row * cell_size + half)
+                if any(rect.collidepoint(center) for rect in blockers):
+                    self.blocked[row * self.cols + col] = 1
+        self._links = self._link_cells()
+
+        # Finished field: steps to the nearest target and unit direction per cell
+        self.targets = None
+        self.distance = [-1] * (self.cols * self.rows)
+        self.dir_x = [0.0] * (self.cols * self.rows)
+        self.dir_y = [0.0] * (self.cols * self.rows)
+        self.searches = 0       # completed searches
+        self._cache = OrderedDict()  # targets -> (distance, dir_x, dir_y)
+
+        # Search in progress (targets, distance, dir_x, dir_y, frontier)
+        self._search = None
+        self._wanted = None     # targets of the latest update
+
+    def cell_of(self, x: float, y: float):
+        """Cell index for a position, or None outside the level."""
+        col = int(x // self.cell_size)
+        row = int(y // self.cell_size)
+        if 0 <= col < self.cols and 0 <= row < self.rows:
+            return row * self.cols + col
+        return None
+
+    def update(self, players) -> None:
+        """Start or continue a search toward the live players' cells."""
+        cells = [self.cell_of(*player.rect.center) for player in players if player.alive()]
+        targets = tuple(sorted(set(cell for cell in cells if cell is not None)))
+        if targets:
+            self._wanted = targets
+
+        if self._search is None:
+            if self._wanted is None or self._wanted == self.targets:
+                return
+            cached = self._cache.get(self._wanted)
+            if cached is not None:
+                self._cache.move_to_end(self._wanted)
+                self.targets = self._wanted
+                self.distance, self.dir_x, self.dir_y = cached
+                return
+            self._start(self._wanted)
+        self._advance(self.cells_per_frame)
+
+    def sample(self, x: float, y: float):
+        """
+        Unit (dx, dy) to follow from a position, or None where an enemy
+        should steer straight at its target: outside the level, within
+        NAV_DIRECT_STEPS of a target, or not reachable.
+        """
+        index = self.cell_of(x, y)
+        if index is None:
+            return None
+        steps = self.distance[index]
+        if steps < 0:
+            # Blocked cells only have a direction out of the platform
+            if self.blocked[index] and (self.dir_x[index] or self.dir_y[index]):
+                return (self.dir_x[index], self.dir_y[index])
+            return None
+        if steps <= NAV_DIRECT_STEPS:
+            return None
+        return (self.dir_x[index], self.dir_y[index])
+
+    def _start(self, targets: tuple) -> None:
+        size = self.cols * self.rows
+        distance = [-1] * size
+        for cell in targets:
+            distance[cell] = 0
+        self._search = (targets, distance, [0.0] * size, [0.0] * size, deque(targets))
+
+    def _link_cells(self) -> list:
+        """
+        Per cell, the free neighbors a search can step to, with the unit
+        direction pointing back: (neighbor, back_x, back_y). Diagonals
+        that would cut a blocked corner are left out.
+        """
+        cols, rows = self.cols, self.rows
+        blocked = self.blocked
+        links = []
+        for cell in range(cols * rows):
+            row, col = divmod(cell, cols)
+            cell_links = []
+            for step_x, step_y in STEPS:
+                c = col + step_x
+                r = row + step_y
+                if not (0 <= c < cols and 0 <= r < rows) or blocked[r * cols + c]:
+                    continue
+                if step_x and step_y:
+                    if blocked[row * cols + c] or blocked[r * cols + col]:
+                        continue
+                    cell_links.append((r * cols + c, -step_x * DIAGONAL, -step_y * DIAGONAL))
+                else:
+                    cell_links.append((r * cols + c, float(-step_x), float(-step_y)))
+            links.append(tuple(cell_links))
+        return links
+
+    def _advance(self, budget) -> None:
+        """Expand up to budget cells (all with None); publish the field when done."""
+        targets, distance, dir_x, dir_y, frontier = self._search
+        links = self._links
+
+        while frontier and budget != 0:
+            if budget is not None:
+                budget -= 1
+            cell = frontier.popleft()
+            next_steps = distance[cell] + 1
+            for neighbor, back_x, back_y in links[cell]:
+                if distance[neighbor] < 0:
+                    distance[neighbor] = next_steps
+                    dir_x[neighbor] = back_x
+                    dir_y[neighbor] = back_y
+                    frontier.append(neighbor)
+
+        if frontier:
+            return
+
+        self._point_out_of_platforms(distance, dir_x, dir_y)
+        self.targets = targets
+        self.distance = distance
+        self.dir_x = dir_x
+        self.dir_y = dir_y
+        self._search = None
+        self.searches += 1
+        self._cache[targets] = (distance, dir_x, dir_y)
+        if len(self._cache) > NAV_FIELD_CACHE:
+            self._cache.popitem(last=False)
+
+    def _point_out_of_platforms(self, distance, dir_x, dir_y) -> None:
+        """Give blocked cells a straight direction toward the nearest reached cell."""
+        cols, rows = self.cols, self.rows
+        blocked = self.blocked
+        seen = bytearray(cols * rows)
+        frontier = deque(cell for cell in range(cols * rows) if distance[cell] >= 0)
+        for cell in frontier:
+            seen[cell] = 1
+
+        while frontier:
+            cell = frontier.popleft()
+            row, col = divmod(cell, cols)
+            for step_x, step_y in STEPS[:4]:
+                c = col + step_x
+                r = row + step_y
+                if not (0 <= c < cols and 0 <= r < rows):
+                    continue
+                neighbor = r * cols + c
+                if seen[neighbor] or not blocked[neighbor]:
+                    continue
+                seen[neighbor] = 1
+                dir_x[neighbor] = -step_x
+                dir_y[neighbor] = -step_y
+                frontier.append(neighbor)
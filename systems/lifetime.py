@@ -0,0 +1,25 @@
+"""
+Lifetime System - Expires store-backed entities after their lifetime.
+"""
+
+
+class LifetimeSystem:
+    """
+    Counts down every EntityStore lifetime and kills expired entities.
+    Entities that never expire carry an infinite lifetime.
+    """
+
+    def update(self, store, dt: float) -> None:
+        """Decrease lifetimes and remove expired entities."""
+        lifetime = store.lifetime
+        expired = []
+
+        for i in range(len(lifetime)):
+            remaining = lifetime[i] - dt
+            lifetime[i] = remaining
+            if remaining <= 0:
+                expired.append(store.views[i])
+
+        # Kill after the pass - removal reorders rows
+        for view in expired:
+            view.kill()
@@ -0,0 +1,23 @@
+"""
+Movement System - Integrates velocity for store-backed entities.
+"""
+
+
+class MovementSystem:
+    """
+    Advances every EntityStore row by its velocity in one pass and
+    writes the result back to the view rects used for collision.
+    """
+
+    def update(self, store, dt: float) -> None:
+        """Integrate positions and sync rects."""
+        pos_x, pos_y = store.pos_x, store.pos_y
+        vel_x, vel_y = store.vel_x, store.vel_y
+        views = store.views
+
+        for i in range(len(views)):
+            x = pos_x[i] + vel_x[i] * dt
+            y = pos_y[i] + vel_y[i] * dt
+            pos_x[i] = x
+            pos_y[i] = y
+            views[i].rect.center = (int(x), int(y))
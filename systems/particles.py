@@ -0,0 +1,180 @@
+"""
+Particle System - Array-backed hit and death effects.
+"""
+
+import math
+import pygame
+from config import (
+    PARTICLE_MAX, PARTICLE_GRAVITY, PARTICLE_SIZE, PARTICLE_FADE_STEPS,
+    PARTICLE_EFFECTS
+)
+from core.event_manager import EventManager, GameEvent
+
+try:
+    import numpy as np
+except ImportError:     # Particles are optional; without NumPy they are skipped
+    np = None
+
+
+class ParticleSystem:
+    """
+    Particles stored in fixed-size NumPy arrays (position, velocity,
+    life, palette color) and updated with whole-array operations.
+    Bursts are triggered by game events and live particles are capped
+    at PARTICLE_MAX. Particles fade by shrinking as they age. The owner
+    subscribes with open() and unsubscribes with close().
+
+    Software targets are drawn by writing all dots straight into the
+    surface's pixel array. Other targets (the texture renderer) get one
+    blits call of pre-made dot surfaces, one per color and fade step.
+    """
+
+    def __init__(self, event_manager: EventManager, player=None, capacity: int = PARTICLE_MAX):
+        self.event_manager = event_manager
+        self.player = player
+        self.capacity = capacity
+        self.count = 0
+        self.enabled = np is not None
+
+        # Palette index per effect, in PARTICLE_EFFECTS order
+        self.effects = {name: (i,) + spec for i, (name, spec) in enumerate(PARTICLE_EFFECTS.items())}
+        self._dots = None
+
+        if self.enabled:
+            self.rng = np.random.default_rng()
+            self.pos = np.zeros((capacity, 2), dtype=np.float32)
+            self.vel = np.zeros((capacity, 2), dtype=np.float32)
+            self.life = np.zeros(capacity, dtype=np.float32)
+            self.max_life = np.ones(capacity, dtype=np.float32)
+            self.color = np.zeros(capacity, dtype=np.intp)
+
+    def open(self) -> None:
+        """Subscribe to the events that trigger bursts."""
+        self.event_manager.subscribe(GameEvent.ENEMY_KILLED, self._on_enemy_killed)
+        self.event_manager.subscribe(GameEvent.BULLET_HIT, self._on_bullet_hit)
+        self.event_manager.subscribe(GameEvent.PLAYER_DAMAGED, self._on_player_damaged)
+
+    def close(self) -> None:
+        """Unsubscribe from events."""
+        self.event_manager.unsubscribe(GameEvent.ENEMY_KILLED, self._on_enemy_killed)
+        self.event_manager.unsubscribe(GameEvent.BULLET_HIT, self._on_bullet_hit)
+        self.event_manager.unsubscribe(GameEvent.PLAYER_DAMAGED, self._on_player_damaged)
+
+    def clear(self) -> None:
+        """Remove all particles."""
+        self.count = 0
+
+    def emit(self, effect: str, x: float, y: float) -> None:
+        """Spawn a burst for a PARTICLE_EFFECTS entry, up to the cap."""
+        if not self.enabled:
+            return
+
+        palette, count, speed, lifetime, _ = self.effects[effect]
+        start = self.count
+        count = min(count, self.capacity - start)
+        if count <= 0:
+            return
+        end = start + count
+
+        angles = self.rng.uniform(0.0, 2 * math.pi, count)
+        speeds = self.rng.uniform(0.3, 1.0, count) * speed
+        lives = self.rng.uniform(0.6, 1.0, count) * lifetime
+
+        self.pos[start:end] = (x, y)
+        self.vel[start:end, 0] = np.cos(angles) * speeds
+        self.vel[start:end, 1] = np.sin(angles) * speeds
+        self.life[start:end] = lives
+        self.max_life[start:end] = lives
+        self.color[start:end] = palette
+        self.count = end
+
+    def update(self, dt: float) -> None:
+        """Integrate all particles and compact out the dead ones."""
+        n = self.count
+        if not n:
+            return
+
+        vel = self.vel[:n]
+        vel[:, 1] += PARTICLE_GRAVITY * dt
+        self.pos[:n] += vel * dt
+        self.life[:n] -= dt
+
+        alive = self.life[:n] > 0
+        remaining = int(np.count_nonzero(alive))
+        if remaining < n:
+            for array in (self.pos, self.vel, self.life, self.max_life, self.color):
+                array[:remaining] = array[:n][alive]
+            self.count = remaining
+
+    def render(self, screen, camera, scale: float = 1.0) -> None:
+        """Draw visible particles in one batch."""
+        n = self.count
+        if not n:
+            return
+
+        # Screen positions; cull everything that doesn't fit in the view
+        surface = getattr(screen, 'surface', screen)
+        width, height = screen.get_size()
+        xs = ((self.pos[:n, 0] - camera.left) * scale).astype(np.intp)
+        ys = ((self.pos[:n, 1] - camera.top) * scale).astype(np.intp)
+        visible = (xs >= 0) & (xs < width - PARTICLE_SIZE) & (ys >= 0) & (ys < height - PARTICLE_SIZE)
+        xs = xs[visible]
+        ys = ys[visible]
+
+        # Fade step from remaining life: 0 is the smallest dot
+        fade = (self.life[:n][visible] / self.max_life[:n][visible] * PARTICLE_FADE_STEPS).astype(np.intp)
+        np.minimum(fade, PARTICLE_FADE_STEPS - 1, out=fade)
+        color = self.color[:n][visible]
+
+        if isinstance(surface, pygame.Surface) and surface.get_bitsize() == 32:
+            self._splat(surface, xs, ys, color, fade)
+        else:
+            if self._dots is None:
+                self._dots = self._make_dots()
+            dots = self._dots
+            index = color * PARTICLE_FADE_STEPS + fade
+            screen.blits(zip(map(dots.__getitem__, index.tolist()), zip(xs.tolist(), ys.tolist())))
+
+    def _splat(self, surface: pygame.Surface, xs, ys, color, fade) -> None:
+        """Write all dots straight into the surface pixels."""
+        mapped = np.array([surface.map_rgb(spec[4]) for spec in self.effects.values()], dtype=np.uint32)
+        values = mapped[color]
+        sizes = 1 + fade * (PARTICLE_SIZE - 1) // max(1, PARTICLE_FADE_STEPS - 1)
+
+        # Group by dot size so each pixel of a square is one fancy-index assignment
+        pixels = pygame.surfarray.pixels2d(surface)
+        try:
+            for size in range(1, PARTICLE_SIZE + 1):
+                selected = sizes == size
+                if not selected.any():
+                    continue
+                sx, sy, sv = xs[selected], ys[selected], values[selected]
+                for dx in range(size):
+                    for dy in range(size):
+                        pixels[sx + dx, sy + dy] = sv
+        finally:
+            del pixels     # Unlock the surface
+
+    def _make_dots(self) -> list:
+        """One small surface per (palette color, fade step)."""
+        dots = []
+        for _, _, _, _, color in self.effects.values():
+            for step in range(PARTICLE_FADE_STEPS):
+                size = 1 + step * (PARTICLE_SIZE - 1) // max(1, PARTICLE_FADE_STEPS - 1)
+                dot = pygame.Surface((size, size))
+                dot.fill(color)
+                dots.append(dot)
+        return dots
+
+    def _on_enemy_killed(self, data) -> None:
+        x, y = data['position']
+        self.emit('enemy_killed', x, y)
+
+    def _on_bullet_hit(self, data) -> None:
+        x, y = data['position']
+        self.emit('bullet_hit', x, y)
+
+    def _on_player_damaged(self, data) -> None:
+        if self.player is not None:
+            x, y = self.player.rect.center
+            self.emit('player_damaged', x, y)
@@ -0,0 +1,75 @@
+"""
+Spatial Grid - Uniform grid for radius neighbor queries.
+"""
+
+from config import FLOCK_GRID_CELL
+
+
+class SpatialGrid:
+    """
+    Buckets entity positions into square cells so "everything within
+    radius r of (x, y)" only looks at the cells the circle overlaps.
+    With the cell size close to the usual query radius that is a 3x3
+    block, so a lookup costs about the number of nearby entities no
+    matter how many exist in total.
+
+    The grid holds plain (entity, x, y) entries and is rebuilt from
+    scratch each frame, which is cheaper than tracking moves.
+    """
+
+    def __init__(self, cell_size: float = FLOCK_GRID_CELL):
+        self.cell_size = cell_size
+        self.cells = {}     # (cx, cy) -> [(entity, x, y)]
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        self.cells.clear()
+
+    def insert(self, entity, x: float, y: float) -> None:
+        """Add an entity at a position."""
+        size = self.cell_size
+        key = (int(x // size), int(y // size))
+        cell = self.cells.get(key)
+        if cell is None:
+            self.cells[key] = [(entity, x, y)]
+        else:
+            cell.append((entity, x, y))
+
+    def rebuild(self, entities) -> None:
+        """Replace the contents with store-backed entities at their current positions."""
+        self.cells.clear()
+        for entity in entities:
+            x, y = entity.position
+            self.insert(entity, x, y)
+
+    def query(self, x: float, y: float, radius: float, limit: int = None) -> list:
+        """
+        (entity, x, y) entries within radius of (x, y).
+
+        The cell containing the point is scanned first, so with a limit
+        (the scan stops once that many entries are found, bounding the
+        cost in dense crowds) the entries kept tend to be the closest.
+        """
+        size = self.cell_size
+        radius_sq = radius * radius
+        cells = self.cells
+        home = (int(x // size), int(y // size))
+        keys = [home]
+        for cx in range(int((x - radius) // size), int((x + radius) // size) + 1):
+            for cy in range(int((y - radius) // size), int((y + radius) // size) + 1):
+                if (cx, cy) != home:
+                    keys.append((cx, cy))
+
+        found = []
+        for key in keys:
+            cell = cells.get(key)
+            if cell is None:
+                continue
+            for entry in cell:
+                dx = entry[1] - x
+                dy = entry[2] - y
+                if dx * dx + dy * dy <= radius_sq:
+                    found.append(entry)
+                    if len(found) == limit:
+                        return found
+        return found
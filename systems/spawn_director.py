@@ -0,0 +1,82 @@
+"""
+Spawn Director - Data-driven enemy waves with entity and frame budgets.
+"""
+
+from config import (
+    FPS, SPAWN_WAVES, MAX_LIVE_ENEMIES,
+    SPAWN_HOLD_RATIO, SPAWN_RESUME_RATIO, SPAWN_FRAME_SMOOTHING
+)
+
+
+class SpawnDirector:
+    """
+    Decides how many enemies to spawn each frame.
+    Waves come from a schedule of {'start', 'interval', 'count'} entries
+    keyed on difficulty time. Spawns are capped by a live-enemy budget and
+    held back while the smoothed frame time threatens the frame budget;
+    difficulty time only advances while frames are healthy, so waves get
+    harder only as fast as the machine keeps up.
+    """
+
+    def __init__(self, waves=SPAWN_WAVES, max_enemies: int = MAX_LIVE_ENEMIES,
+                 frame_budget_ms: float = 1000.0 / FPS):
+        self.waves = sorted(waves, key=lambda wave: wave['start'])
+        self.max_enemies = max_enemies
+        self.frame_budget_ms = frame_budget_ms
+
+        self.difficulty_time = 0.0
+        self.spawn_timer = 0.0
+        self.frame_time_avg = 0.0
+        self.throttled = False
+
+    def reset(self) -> None:
+        """Start the schedule over from the first wave."""
+        self.difficulty_time = 0.0
+        self.spawn_timer = 0.0
+        self.frame_time_avg = 0.0
+        self.throttled = False
+
+    @property
+    def wave_index(self) -> int:
+        """Index of the wave for the current difficulty time."""
+        index = 0
+        for i, wave in enumerate(self.waves):
+            if wave['start'] <= self.difficulty_time:
+                index = i
+        return index
+
+    def update(self, dt: float, frame_time_ms: float, live_enemies: int) -> int:
+        """
+        Advance the schedule.
+
+        Args:
+            dt: Simulation step in seconds
+            frame_time_ms: Measured work time of the last frame
+            live_enemies: Enemies currently alive
+
+        Returns:
+            Number of enemies to spawn this frame.
+        """
+        self._update_throttle(frame_time_ms)
+        if self.throttled:
+            return 0
+
+        self.difficulty_time += dt
+        wave = self.waves[self.wave_index]
+
+        self.spawn_timer += dt
+        if self.spawn_timer < wave['interval']:
+            return 0
+        self.spawn_timer = 0
+
+        return max(0, min(wave['count'], self.max_enemies - live_enemies))
+
+    def _update_throttle(self, frame_time_ms: float) -> None:
+        """Smooth frame time and hold spawns (with hysteresis) near the budget."""
+        self.frame_time_avg += (frame_time_ms - self.frame_time_avg) * SPAWN_FRAME_SMOOTHING
+
+        if self.throttled:
+            if self.frame_time_avg < self.frame_budget_ms * SPAWN_RESUME_RATIO:
+                self.throttled = False
+        elif self.frame_time_avg > self.frame_budget_ms * SPAWN_HOLD_RATIO:
+            self.throttled = True
@@ -7,7 +7,7 @@ from config import (
     HEALTH_BAR_WIDTH, HEALTH_BAR_HEIGHT,
     HEALTH_BAR_X, HEALTH_BAR_Y,
     HEALTH_BAR_BG, HEALTH_BAR_FG, HEALTH_BAR_LOW,
-    COLOR_WHITE
+    SCREEN_WIDTH, SHOW_RENDER_SCALE, COLOR_WHITE
 )
 
 
@@ -20,10 +20,12 @@ class HUD:
         self.player = player
         self.font = pygame.font.Font(None, 28)
 
-    def render(self, screen, score: int = 0) -> None:
+    def render(self, screen, score: int = 0, render_scale: float = None) -> None:
         """Render HUD elements to screen."""
         self._render_health_bar(screen)
         self._render_score(screen, score)
+        if SHOW_RENDER_SCALE and render_scale is not None:
+            self._render_scale(screen, render_scale)
 
     def _render_health_bar(self, screen) -> None:
         """Draw the health bar."""
@@ -32,7 +34,7 @@ class HUD:
             HEALTH_BAR_X, HEALTH_BAR_Y,
             HEALTH_BAR_WIDTH, HEALTH_BAR_HEIGHT
         )
-        pygame.draw.rect(screen, HEALTH_BAR_BG, bg_rect)
+        screen.draw_rect(HEALTH_BAR_BG, bg_rect)
 
         # Health percentage
         health_percent = self.player.health / self.player.max_health
@@ -46,10 +48,10 @@ class HUD:
                 HEALTH_BAR_X, HEALTH_BAR_Y,
                 fg_width, HEALTH_BAR_HEIGHT
             )
-            pygame.draw.rect(screen, fg_color, fg_rect)
+            screen.draw_rect(fg_color, fg_rect)
 
         # Border
-        pygame.draw.rect(screen, COLOR_WHITE, bg_rect, 2)
+        screen.draw_rect(COLOR_WHITE, bg_rect, 2)
 
         # Health text
         health_text = self.font.render(
@@ -66,3 +68,10 @@ class HUD:
         score_x = HEALTH_BAR_X + HEALTH_BAR_WIDTH + 100
         score_y = HEALTH_BAR_Y + (HEALTH_BAR_HEIGHT - score_text.get_height()) // 2
         screen.blit(score_text, (score_x, score_y))
+
+    def _render_scale(self, screen, render_scale: float) -> None:
+        """Draw the current world render scale."""
+        scale_text = self.font.render(f"Res {render_scale:.0%}", True, COLOR_WHITE)
+        scale_x = SCREEN_WIDTH - scale_text.get_width() - HEALTH_BAR_X
+        scale_y = HEALTH_BAR_Y + (HEALTH_BAR_HEIGHT - scale_text.get_height()) // 2
+        screen.blit(scale_text, (scale_x, scale_y))